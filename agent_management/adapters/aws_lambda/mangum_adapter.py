@@ -2,9 +2,14 @@
 """
 AWS Lambda handler for FastAPI application using Mangum
 """
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from mangum import Mangum
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 # Import all route modules
 from adapters.fastapi.routes.agent_routes import router as agent_router
@@ -24,6 +29,23 @@ from adapters.fastapi.routes.maturity_agent_response_routes import router as mat
 from adapters.fastapi.routes.registration_routes import router as registration_routes
 from adapters.fastapi.routes.axis_routes import router as axis_router
 from adapters.fastapi.routes.domain_agent_response_routes import router as domain_agent_response_router
+from adapters.fastapi.routes.metrics_routes import router as metrics_router
+from adapters.fastapi.middleware.read_your_writes import read_your_writes
+from adapters.postgres import telemetry
+from adapters.postgres.deadline import DeadlineExceeded
+from adapters.postgres.config import dispose_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled database connections when the server shuts down.
+
+    Lambda runs with lifespan disabled, so the engine outlives each
+    invocation and is reused while the container stays warm.
+    """
+    yield
+    await dispose_engine()
+
 
 def create_app() -> FastAPI:
     """
@@ -37,7 +59,8 @@ def create_app() -> FastAPI:
         description="API for managing agents and related resources",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
 
     # Configure CORS
@@ -73,6 +96,33 @@ def create_app() -> FastAPI:
     for router in routers:
         app.include_router(router)
 
+    # Process metrics are for local runs only; under Lambda the API is public
+    # and the same numbers are published as EMF log lines below
+    if not os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        app.include_router(metrics_router)
+
+    # Keep each caller's reads on the primary shortly after their own writes
+    app.middleware("http")(read_your_writes)
+
+    # Fail fast when the database is saturated instead of running into the
+    # Lambda timeout: no free pooled connection, or the request deadline hit
+    @app.exception_handler(PoolTimeoutError)
+    async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+        return JSONResponse(status_code=503, content={"detail": "Database is busy, retry later"})
+
+    @app.exception_handler(DeadlineExceeded)
+    async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+        return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+    # Under Lambda, publish database metrics for each invocation as EMF log lines
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        @app.middleware("http")
+        async def emit_database_metrics(request: Request, call_next):
+            try:
+                return await call_next(request)
+            finally:
+                telemetry.emit_emf()
+
     return app
 
 # Create FastAPI application
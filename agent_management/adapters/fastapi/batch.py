@@ -0,0 +1,32 @@
+"""``ids=`` query parameter for fetching many items of a list route at once."""
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Query
+
+from adapters.postgres.batch import MAX_IDS
+
+
+def id_list(
+    ids: Optional[str] = Query(
+        None,
+        description="Comma-separated IDs to fetch in one query, returned in this "
+                    "order; IDs not found are listed in missing. Filters and "
+                    "paging are ignored"
+    )
+) -> Optional[Tuple[int, ...]]:
+    """Read ``ids`` from the query string, without duplicates.
+
+    Raises:
+        HTTPException: If ``ids`` is empty, too long or not integers
+    """
+    if ids is None:
+        return None
+    try:
+        keys = tuple(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if not keys:
+        raise HTTPException(status_code=400, detail="ids must name at least one ID")
+    if len(keys) > MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_IDS} ids per request")
+    return keys
@@ -0,0 +1,49 @@
+"""``fields=`` query parameter for list and get routes."""
+from typing import Any, Callable, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def fieldset(response_model: Type[BaseModel]) -> Callable:
+    """Build a dependency reading the fields of ``response_model`` to return.
+
+    Args:
+        response_model: Model of the items the route returns
+
+    Returns:
+        Callable: Dependency resolving to a tuple of field names, or None when
+        the client wants every field
+    """
+    allowed = tuple(response_model.model_fields)
+
+    def read_fields(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated subset of: {', '.join(allowed)}"
+        )
+    ) -> Optional[Tuple[str, ...]]:
+        if fields is None:
+            return None
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in allowed]
+        if not names or unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown) or fields!r}"
+            )
+        return names
+
+    return read_fields
+
+
+def sparse(content: Any, fields: Optional[Tuple[str, ...]]) -> Any:
+    """Return ``content`` as is, or only its requested fields.
+
+    Partial models do not satisfy the route's ``response_model``, so they
+    are serialized here and bypass response validation.
+    """
+    if not fields:
+        return content
+    return JSONResponse(content=jsonable_encoder(content, exclude_unset=True))
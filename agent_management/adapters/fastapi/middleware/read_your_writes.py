@@ -0,0 +1,50 @@
+"""Read-your-writes middleware.
+
+After a caller writes, their reads stay on the primary for
+READ_YOUR_WRITES_SECONDS. The time of the write travels with the caller in
+a cookie, or a header for clients that do not keep cookies, so the window
+holds whichever process or Lambda container serves the next request.
+"""
+import math
+import time
+from typing import Optional
+
+from fastapi import Request
+
+from adapters.postgres.config import read_your_writes_seconds, track_caller_writes
+
+LAST_WRITE_COOKIE = "last_write_at"
+LAST_WRITE_HEADER = "X-Last-Write-At"
+
+
+def _parse(value: Optional[str]) -> Optional[float]:
+    """Read a last-write time sent by the client.
+
+    The client controls the value, so times in the future are clamped to
+    now; otherwise one could keep its reads off the replica indefinitely.
+    Malformed times and those whose window has closed are ignored.
+    """
+    try:
+        last_write_at = float(value) if value else None
+    except ValueError:
+        return None
+    now = time.time()
+    if last_write_at is None or not now - last_write_at < read_your_writes_seconds():
+        return None
+    return min(last_write_at, now)
+
+
+async def read_your_writes(request: Request, call_next):
+    """Route the caller's reads by their own last write and report new ones."""
+    writes = track_caller_writes(_parse(
+        request.cookies.get(LAST_WRITE_COOKIE) or request.headers.get(LAST_WRITE_HEADER)
+    ))
+    response = await call_next(request)
+
+    window = read_your_writes_seconds()
+    if writes.wrote and window > 0:
+        value = f"{writes.last_write_at:.3f}"
+        response.set_cookie(
+            LAST_WRITE_COOKIE, value, max_age=math.ceil(window), httponly=True, samesite="lax")
+        response.headers[LAST_WRITE_HEADER] = value
+    return response
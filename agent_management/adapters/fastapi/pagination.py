@@ -0,0 +1,40 @@
+"""Query parameters shared by the paginated list routes."""
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import HTTPException, Query
+
+from adapters.postgres.pagination import MAX_PAGE_SIZE, Count, decode_cursor
+
+
+@dataclass
+class PageParams:
+    """Requested page of a list route."""
+    limit: Optional[int] = None
+    after: Optional[int] = None
+    count: Count = "none"
+
+
+def page_params(
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_PAGE_SIZE,
+        description="Maximum number of items to return; omit to list everything"
+    ),
+    after: Optional[str] = Query(
+        None, description="next_cursor of the previous page"
+    ),
+    count: Count = Query(
+        "none",
+        description="Return a total: exact counts every row, estimated uses the "
+                    "table statistics on unfiltered lists, none skips it"
+    )
+) -> PageParams:
+    """Read ``limit``, ``after`` and ``count`` from the query string.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        return PageParams(limit=limit, after=decode_cursor(after), count=count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,7 +1,6 @@
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.agent_command import (
     CreateAgent,
@@ -13,9 +12,12 @@ from domain.command.agent_command import (
 )
 from domain.command.comon_command import sql, Sources
 from domain.command_handlers import agent_handler
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.dynamodb import registration_adapter, message_adapter
 from adapters.postgres.repositories.agent_repository import AgentRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 from adapters.saia_assistant import main as main_asistant
 
 # FIXME: set in the right place to work with
@@ -27,24 +29,27 @@ router = APIRouter(prefix="/agents", tags=["agents"])
 
 
 async def get_agent_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for agent handler functions.
 
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
 
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for agents
     """
-    repository = AgentRepository(session)
+    repository = lambda: AgentRepository(sessions.primary)
+    read_repository = lambda: AgentRepository(sessions.read)
     return {
-        'create_agent': lambda cmd: agent_handler.create_agent(repository, cmd),
-        'update_agent': lambda cmd: agent_handler.update_agent(repository, cmd),
-        'delete_agent': lambda cmd: agent_handler.delete_agent(repository, cmd),
-        'get_agent': lambda cmd: agent_handler.get_agent(repository, cmd),
-        'list_agents': lambda: agent_handler.list_agents(repository)
+        'create_agent': lambda cmd: agent_handler.create_agent(repository(), cmd),
+        'update_agent': lambda cmd: agent_handler.update_agent(repository(), cmd),
+        'delete_agent': lambda cmd: agent_handler.delete_agent(repository(), cmd),
+        'get_agent': lambda cmd: agent_handler.get_agent(read_repository(), cmd),
+        'get_agents_by_ids': lambda ids, fields=None: agent_handler.get_agents_by_ids(read_repository(), ids, fields),
+        'list_agents': lambda limit=None, after=None, fields=None, count="none":
+            agent_handler.list_agents(read_repository(), limit, after, fields, count)
     }
 
 
@@ -90,24 +95,30 @@ async def delete_agent_route(
 @router.get("/{agent_id}", response_model=AgentResponse)
 async def get_agent(
     agent_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(AgentResponse)),
     handler: dict[str, Callable] = Depends(get_agent_handler)
 ):
     """Get an agent by ID."""
-    agent = await handler['get_agent'](GetAgent(agent_id=agent_id))
+    agent = await handler['get_agent'](GetAgent(agent_id=agent_id, fields=fields))
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
-    return agent
+    return sparse(agent, fields)
 
 
 @router.get("/", response_model=ListAgents)
 async def list_agents_route(
     agent_type: Optional[str] = Query(None, description="Filter by agent type"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(AgentResponse)),
     handler: dict[str, Callable] = Depends(get_agent_handler)
 ):
     """List all agents, optionally filtered by agent_type."""
     if agent_type:
         return await handler['get_agent'](GetAgent(agent_type=agent_type))
-    return await handler['list_agents']()
+    if ids:
+        return sparse(await handler['get_agents_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_agents'](page.limit, page.after, fields, page.count), fields)
 
 
 @router.post('/chat_with_agent')
@@ -1,7 +1,6 @@
 """FastAPI routes for axis operations."""
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.axis_command import (
     CreateAxis,
@@ -16,33 +15,39 @@ from domain.command_handlers.axis_handler import (
     update_axis,
     delete_axis,
     get_axis,
-    list_axes
+    list_axes,
+    get_axes_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.axis_repository import AxisRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/axes", tags=["axes"])
 
 
 async def get_axis_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for axis handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for axes
     """
-    repository = AxisRepository(session)
+    repository = lambda: AxisRepository(sessions.primary)
+    read_repository = lambda: AxisRepository(sessions.read)
     return {
-        'create_axis': lambda cmd: create_axis(repository, cmd),
-        'update_axis': lambda cmd: update_axis(repository, cmd),
-        'delete_axis': lambda cmd: delete_axis(repository, cmd),
-        'get_axis': lambda cmd: get_axis(repository, cmd),
-        'list_axes': lambda: list_axes(repository)
+        'create_axis': lambda cmd: create_axis(repository(), cmd),
+        'update_axis': lambda cmd: update_axis(repository(), cmd),
+        'delete_axis': lambda cmd: delete_axis(repository(), cmd),
+        'get_axis': lambda cmd: get_axis(read_repository(), cmd),
+        'get_axes_by_ids': lambda ids, fields=None: get_axes_by_ids(read_repository(), ids, fields),
+        'list_axes': lambda limit=None, after=None, fields=None, count="none": list_axes(read_repository(), limit, after, fields, count)
     }
 
 
@@ -127,6 +132,7 @@ async def delete_axis_endpoint(
 @router.get("/{axis_id}", response_model=AxisResponse)
 async def get_axis_endpoint(
     axis_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(AxisResponse)),
     handler: dict[str, Callable] = Depends(get_axis_handler)
 ):
     """
@@ -134,6 +140,7 @@ async def get_axis_endpoint(
     
     Args:
         axis_id: ID of the axis to get
+        fields: Optional fields to return
         handler: Axis handler functions
         
     Returns:
@@ -142,23 +149,31 @@ async def get_axis_endpoint(
     Raises:
         HTTPException: If axis not found
     """
-    result = await handler['get_axis'](GetAxis(axis_id=axis_id))
+    result = await handler['get_axis'](GetAxis(axis_id=axis_id, fields=fields))
     if not result:
         raise HTTPException(status_code=404, detail="Axis not found")
-    return result
+    return sparse(result, fields)
 
 
 @router.get("/", response_model=ListAxes)
 async def list_axes_endpoint(
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(AxisResponse)),
     handler: dict[str, Callable] = Depends(get_axis_handler)
 ):
     """
     List all axes.
     
     Args:
+        ids: Optional IDs to fetch instead of listing
+        page: Requested page, see ``limit``, ``after`` and ``count``
+        fields: Optional fields to return
         handler: Axis handler functions
         
     Returns:
         ListAxes: List of all axes
     """
-    return await handler['list_axes']()
+    if ids:
+        return sparse(await handler['get_axes_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_axes'](page.limit, page.after, fields, page.count), fields)
@@ -1,47 +1,58 @@
 """FastAPI routes for company operations."""
-from typing import Callable
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from domain.command.company_command import (
     CreateCompany,
     UpdateCompany,
     DeleteCompany,
     GetCompany,
-    ListCompanies
+    GetCompanyTree,
+    CompanyResponse,
+    CompanyTree,
+    ListCompanies,
+    MAX_TREE_DEPTH
 )
 from domain.command_handlers.company_handler import (
     create_company,
     update_company,
     delete_company,
     get_company,
-    list_companies
+    get_company_tree,
+    list_companies,
+    get_companies_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.company_repository import CompanyRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
 
 async def get_company_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for company handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for companies
     """
-    repository = CompanyRepository(session)
+    repository = lambda: CompanyRepository(sessions.primary)
+    read_repository = lambda: CompanyRepository(sessions.read)
     return {
-        'create_company': lambda cmd: create_company(repository, cmd),
-        'update_company': lambda cmd: update_company(repository, cmd),
-        'delete_company': lambda cmd: delete_company(repository, cmd),
-        'get_company': lambda cmd: get_company(repository, cmd),
-        'list_companies': lambda: list_companies(repository)
+        'create_company': lambda cmd: create_company(repository(), cmd),
+        'update_company': lambda cmd: update_company(repository(), cmd),
+        'delete_company': lambda cmd: delete_company(repository(), cmd),
+        'get_company': lambda cmd: get_company(read_repository(), cmd),
+        'get_company_tree': lambda cmd: get_company_tree(read_repository(), cmd),
+        'get_companies_by_ids': lambda ids, fields=None: get_companies_by_ids(read_repository(), ids, fields),
+        'list_companies': lambda limit=None, after=None, fields=None, count="none": list_companies(read_repository(), limit, after, fields, count)
     }
 
 
@@ -80,19 +91,38 @@ async def delete_company_route(
 
 @router.get("/", response_model=ListCompanies)
 async def list_companies_route(
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(CompanyResponse)),
     handler: dict[str, Callable] = Depends(get_company_handler)
 ):
     """List all companies."""
-    return await handler['list_companies']()
+    if ids:
+        return sparse(await handler['get_companies_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_companies'](page.limit, page.after, fields, page.count), fields)
 
 
 @router.get("/{company_id}")
 async def get_company_route(
     company_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(CompanyResponse)),
     handler: dict[str, Callable] = Depends(get_company_handler)
 ):
     """Get a company by ID."""
-    result = await handler['get_company'](GetCompany(company_id=company_id))
+    result = await handler['get_company'](GetCompany(company_id=company_id, fields=fields))
+    if not result:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return sparse(result, fields)
+
+
+@router.get("/{company_id}/tree", response_model=CompanyTree)
+async def get_company_tree_route(
+    company_id: int,
+    depth: int = Query(MAX_TREE_DEPTH, ge=0, le=MAX_TREE_DEPTH),
+    handler: dict[str, Callable] = Depends(get_company_handler)
+):
+    """Get a company with its domains, their subdomains and its projects."""
+    result = await handler['get_company_tree'](GetCompanyTree(company_id=company_id, depth=depth))
     if not result:
         raise HTTPException(status_code=404, detail="Company not found")
     return result
@@ -1,7 +1,6 @@
 """FastAPI routes for domain agent response operations."""
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.domain_agent_response_command import (
     CreateDomainAgentResponse,
@@ -12,33 +11,38 @@ from domain.command.domain_agent_response_command import (
     ListDomainAgentResponses
 )
 from domain.command_handlers import domain_agent_response_handler
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.domain_agent_response_repository import DomainAgentResponseRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/domain-agent-responses", tags=["domain-agent-responses"])
 
 
 async def get_domain_agent_response_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for domain agent response handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for domain agent responses
     """
-    repository = DomainAgentResponseRepository(session)
+    repository = lambda: DomainAgentResponseRepository(sessions.primary)
+    read_repository = lambda: DomainAgentResponseRepository(sessions.read)
     return {
-        'create_domain_response': lambda cmd: domain_agent_response_handler.create_domain_response(repository, cmd),
-        'update_domain_response': lambda cmd: domain_agent_response_handler.update_domain_response(repository, cmd),
-        'delete_domain_response': lambda cmd: domain_agent_response_handler.delete_domain_response(repository, cmd),
-        'get_domain_response': lambda cmd: domain_agent_response_handler.get_domain_response(repository, cmd),
-        'list_domain_responses': lambda agent_id=None, domain_question_id=None: 
+        'create_domain_response': lambda cmd: domain_agent_response_handler.create_domain_response(repository(), cmd),
+        'update_domain_response': lambda cmd: domain_agent_response_handler.update_domain_response(repository(), cmd),
+        'delete_domain_response': lambda cmd: domain_agent_response_handler.delete_domain_response(repository(), cmd),
+        'get_domain_response': lambda cmd: domain_agent_response_handler.get_domain_response(read_repository(), cmd),
+        'get_domain_responses_by_ids': lambda ids, fields=None: domain_agent_response_handler.get_domain_responses_by_ids(read_repository(), ids, fields),
+        'list_domain_responses': lambda agent_id=None, domain_question_id=None, limit=None, after=None, fields=None, count="none": 
             domain_agent_response_handler.list_domain_responses(
-                repository, agent_id, domain_question_id
+                read_repository(), agent_id, domain_question_id, limit, after, fields, count
             )
     }
 
@@ -125,6 +129,7 @@ async def delete_domain_response_route(
 @router.get("/{domain_agent_response_id}", response_model=DomainAgentResponseData)
 async def get_domain_response_route(
     domain_agent_response_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(DomainAgentResponseData)),
     handler: dict[str, Callable] = Depends(get_domain_agent_response_handler)
 ):
     """
@@ -132,6 +137,7 @@ async def get_domain_response_route(
     
     Args:
         domain_agent_response_id: ID of the domain agent response to get
+        fields: Optional fields to return
         handler: Domain agent response handler functions
         
     Returns:
@@ -141,11 +147,11 @@ async def get_domain_response_route(
         HTTPException: If domain agent response not found
     """
     response = await handler['get_domain_response'](
-        GetDomainAgentResponse(domain_agent_response_id=domain_agent_response_id)
+        GetDomainAgentResponse(domain_agent_response_id=domain_agent_response_id, fields=fields)
     )
     if not response:
         raise HTTPException(status_code=404, detail="Domain agent response not found")
-    return response
+    return sparse(response, fields)
 
 
 @router.get("/", response_model=ListDomainAgentResponses)
@@ -153,6 +159,9 @@ async def list_domain_responses_route(
     agent_id: Optional[int] = Query(None, description="Filter by agent ID"),
     domain_question_id: Optional[int] = Query(
         None, description="Filter by domain question ID"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(DomainAgentResponseData)),
     handler: dict[str, Callable] = Depends(get_domain_agent_response_handler)
 ):
     """
@@ -161,9 +170,15 @@ async def list_domain_responses_route(
     Args:
         agent_id: Optional agent ID filter
         domain_question_id: Optional domain question ID filter
+        ids: Optional IDs to fetch instead of listing
+        page: Requested page, see ``limit``, ``after`` and ``count``
+        fields: Optional fields to return
         handler: Domain agent response handler functions
         
     Returns:
         ListDomainAgentResponses: List of domain agent responses
     """
-    return await handler['list_domain_responses'](agent_id, domain_question_id)
+    if ids:
+        return sparse(await handler['get_domain_responses_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_domain_responses'](
+        agent_id, domain_question_id, page.limit, page.after, fields, page.count), fields)
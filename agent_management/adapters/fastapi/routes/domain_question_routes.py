@@ -1,7 +1,6 @@
 """FastAPI routes for domain question operations."""
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.domain_question_command import (
     CreateDomainQuestion,
@@ -16,34 +15,40 @@ from domain.command_handlers.domain_question_handler import (
     update_domain_question,
     delete_domain_question,
     get_domain_question,
-    list_domain_questions
+    list_domain_questions,
+    get_domain_questions_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.domain_question_repository import DomainQuestionRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/domain-questions", tags=["domain-questions"])
 
 
 async def get_domain_question_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for domain question handler functions.
 
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
 
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for domain questions
     """
-    repository = DomainQuestionRepository(session)
+    repository = lambda: DomainQuestionRepository(sessions.primary)
+    read_repository = lambda: DomainQuestionRepository(sessions.read)
     return {
-        'create_domain_question': lambda cmd: create_domain_question(repository, cmd),
-        'update_domain_question': lambda cmd: update_domain_question(repository, cmd),
-        'delete_domain_question': lambda cmd: delete_domain_question(repository, cmd),
-        'get_domain_question': lambda cmd: get_domain_question(repository, cmd),
-        'list_domain_questions': lambda domain_id=None, industry_id=None, category=None, question_type=None:
-            list_domain_questions(repository, domain_id, industry_id, category, question_type)
+        'create_domain_question': lambda cmd: create_domain_question(repository(), cmd),
+        'update_domain_question': lambda cmd: update_domain_question(repository(), cmd),
+        'delete_domain_question': lambda cmd: delete_domain_question(repository(), cmd),
+        'get_domain_question': lambda cmd: get_domain_question(read_repository(), cmd),
+        'get_domain_questions_by_ids': lambda ids, fields=None: get_domain_questions_by_ids(read_repository(), ids, fields),
+        'list_domain_questions': lambda domain_id=None, industry_id=None, category=None, question_type=None, limit=None, after=None, fields=None, count="none":
+            list_domain_questions(read_repository(), domain_id, industry_id, category, question_type, limit, after, fields, count)
     }
 
 
@@ -85,15 +90,16 @@ async def delete_domain_question_route(
 @router.get("/{domain_question_id}", response_model=DomainQuestionResponse)
 async def get_domain_question_route(
     domain_question_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(DomainQuestionResponse)),
     handler: dict[str, Callable] = Depends(get_domain_question_handler)
 ):
     """Get a domain question by ID."""
     question = await handler['get_domain_question'](
-        GetDomainQuestion(domain_question_id=domain_question_id)
+        GetDomainQuestion(domain_question_id=domain_question_id, fields=fields)
     )
     if not question:
         raise HTTPException(status_code=404, detail="Domain question not found")
-    return question
+    return sparse(question, fields)
 
 
 @router.get("/", response_model=ListDomainQuestions)
@@ -102,7 +108,13 @@ async def list_domain_questions_route(
     industry_id: Optional[int] = Query(None, description="Filter by industry ID"),
     category: Optional[str] = Query(None, description="Filter by category"),
     question_type: Optional[str] = Query(None, description="Filter by question type"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(DomainQuestionResponse)),
     handler: dict[str, Callable] = Depends(get_domain_question_handler)
 ):
     """List all domain questions with optional filters."""
-    return await handler['list_domain_questions'](domain_id, industry_id, category, question_type)
+    if ids:
+        return sparse(await handler['get_domain_questions_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_domain_questions'](
+        domain_id, industry_id, category, question_type, page.limit, page.after, fields, page.count), fields)
@@ -1,7 +1,6 @@
 """FastAPI routes for domain operations."""
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.domain_command import (
     CreateDomain,
@@ -16,33 +15,39 @@ from domain.command_handlers.domain_handler import (
     update_domain,
     delete_domain,
     get_domain,
-    list_domains
+    list_domains,
+    get_domains_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.domain_repository import DomainRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/domains", tags=["domains"])
 
 
 async def get_domain_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for domain handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for domains
     """
-    repository = DomainRepository(session)
+    repository = lambda: DomainRepository(sessions.primary)
+    read_repository = lambda: DomainRepository(sessions.read)
     return {
-        'create_domain': lambda cmd: create_domain(repository, cmd),
-        'update_domain': lambda cmd: update_domain(repository, cmd),
-        'delete_domain': lambda cmd: delete_domain(repository, cmd),
-        'get_domain': lambda cmd: get_domain(repository, cmd),
-        'list_domains': lambda: list_domains(repository)
+        'create_domain': lambda cmd: create_domain(repository(), cmd),
+        'update_domain': lambda cmd: update_domain(repository(), cmd),
+        'delete_domain': lambda cmd: delete_domain(repository(), cmd),
+        'get_domain': lambda cmd: get_domain(read_repository(), cmd),
+        'get_domains_by_ids': lambda ids, fields=None: get_domains_by_ids(read_repository(), ids, fields),
+        'list_domains': lambda limit=None, after=None, fields=None, count="none": list_domains(read_repository(), limit, after, fields, count)
     }
 
 
@@ -88,18 +93,24 @@ async def delete_domain(
 @router.get("/{domain_id}", response_model=DomainResponse)
 async def get_domain_route(
     domain_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(DomainResponse)),
     handler: dict[str, Callable] = Depends(get_domain_handler)
 ):
     """Get a domain by ID."""
-    domain = await handler['get_domain'](GetDomain(domain_id=domain_id))
+    domain = await handler['get_domain'](GetDomain(domain_id=domain_id, fields=fields))
     if not domain:
         raise HTTPException(status_code=404, detail="Domain not found")
-    return domain
+    return sparse(domain, fields)
 
 
 @router.get("/", response_model=ListDomains)
 async def list_domains_route(
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(DomainResponse)),
     handler: dict[str, Callable] = Depends(get_domain_handler)
 ):
     """List all domains."""
-    return await handler['list_domains']()
+    if ids:
+        return sparse(await handler['get_domains_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_domains'](page.limit, page.after, fields, page.count), fields)
@@ -1,7 +1,6 @@
 """FastAPI routes for industry operations."""
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.industry_command import (
     CreateIndustry,
@@ -16,33 +15,39 @@ from domain.command_handlers.industry_handler import (
     update_industry,
     delete_industry,
     get_industry,
-    list_industries
+    list_industries,
+    get_industries_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.industry_repository import IndustryRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/industries", tags=["industries"])
 
 
 async def get_industry_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for industry handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for industries
     """
-    repository = IndustryRepository(session)
+    repository = lambda: IndustryRepository(sessions.primary)
+    read_repository = lambda: IndustryRepository(sessions.read)
     return {
-        'create_industry': lambda cmd: create_industry(repository, cmd),
-        'update_industry': lambda cmd: update_industry(repository, cmd),
-        'delete_industry': lambda cmd: delete_industry(repository, cmd),
-        'get_industry': lambda cmd: get_industry(repository, cmd),
-        'list_industries': lambda: list_industries(repository)
+        'create_industry': lambda cmd: create_industry(repository(), cmd),
+        'update_industry': lambda cmd: update_industry(repository(), cmd),
+        'delete_industry': lambda cmd: delete_industry(repository(), cmd),
+        'get_industry': lambda cmd: get_industry(read_repository(), cmd),
+        'get_industries_by_ids': lambda ids, fields=None: get_industries_by_ids(read_repository(), ids, fields),
+        'list_industries': lambda limit=None, after=None, fields=None, count="none": list_industries(read_repository(), limit, after, fields, count)
     }
 
 
@@ -127,6 +132,7 @@ async def delete_industry_endpoint(
 @router.get("/{industry_id}", response_model=IndustryResponse)
 async def get_industry_endpoint(
     industry_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(IndustryResponse)),
     handler: dict[str, Callable] = Depends(get_industry_handler)
 ):
     """
@@ -134,6 +140,7 @@ async def get_industry_endpoint(
     
     Args:
         industry_id: ID of the industry to get
+        fields: Optional fields to return
         handler: Industry handler functions
         
     Returns:
@@ -142,23 +149,31 @@ async def get_industry_endpoint(
     Raises:
         HTTPException: If industry not found
     """
-    result = await handler['get_industry'](GetIndustry(industry_id=industry_id))
+    result = await handler['get_industry'](GetIndustry(industry_id=industry_id, fields=fields))
     if not result:
         raise HTTPException(status_code=404, detail="Industry not found")
-    return result
+    return sparse(result, fields)
 
 
 @router.get("/", response_model=ListIndustries)
 async def list_industries_endpoint(
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(IndustryResponse)),
     handler: dict[str, Callable] = Depends(get_industry_handler)
 ):
     """
     List all industries.
     
     Args:
+        ids: Optional IDs to fetch instead of listing
+        page: Requested page, see ``limit``, ``after`` and ``count``
+        fields: Optional fields to return
         handler: Industry handler functions
         
     Returns:
         ListIndustries: List of all industries
     """
-    return await handler['list_industries']()
+    if ids:
+        return sparse(await handler['get_industries_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_industries'](page.limit, page.after, fields, page.count), fields)
@@ -1,7 +1,6 @@
 """FastAPI routes for maturity agent response operations."""
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.maturity_agent_response_command import (
     CreateMaturityAgentResponse,
@@ -12,33 +11,38 @@ from domain.command.maturity_agent_response_command import (
     ListMaturityAgentResponses
 )
 from domain.command_handlers import maturity_agent_response_handler
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.maturity_agent_response_repository import MaturityAgentResponseRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/maturity-agent-responses", tags=["maturity-agent-responses"])
 
 
 async def get_maturity_agent_response_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for maturity agent response handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for maturity agent responses
     """
-    repository = MaturityAgentResponseRepository(session)
+    repository = lambda: MaturityAgentResponseRepository(sessions.primary)
+    read_repository = lambda: MaturityAgentResponseRepository(sessions.read)
     return {
-        'create_maturity_response': lambda cmd: maturity_agent_response_handler.create_maturity_response(repository, cmd),
-        'update_maturity_response': lambda cmd: maturity_agent_response_handler.update_maturity_response(repository, cmd),
-        'delete_maturity_response': lambda cmd: maturity_agent_response_handler.delete_maturity_response(repository, cmd),
-        'get_maturity_response': lambda cmd: maturity_agent_response_handler.get_maturity_response(repository, cmd),
-        'list_maturity_responses': lambda agent_id=None, maturity_question_id=None: 
+        'create_maturity_response': lambda cmd: maturity_agent_response_handler.create_maturity_response(repository(), cmd),
+        'update_maturity_response': lambda cmd: maturity_agent_response_handler.update_maturity_response(repository(), cmd),
+        'delete_maturity_response': lambda cmd: maturity_agent_response_handler.delete_maturity_response(repository(), cmd),
+        'get_maturity_response': lambda cmd: maturity_agent_response_handler.get_maturity_response(read_repository(), cmd),
+        'get_maturity_responses_by_ids': lambda ids, fields=None: maturity_agent_response_handler.get_maturity_responses_by_ids(read_repository(), ids, fields),
+        'list_maturity_responses': lambda agent_id=None, maturity_question_id=None, limit=None, after=None, fields=None, count="none": 
             maturity_agent_response_handler.list_maturity_responses(
-                repository, agent_id, maturity_question_id
+                read_repository(), agent_id, maturity_question_id, limit, after, fields, count
             )
     }
 
@@ -125,6 +129,7 @@ async def delete_maturity_response_route(
 @router.get("/{maturity_agent_response_id}", response_model=MaturityAgentResponseData)
 async def get_maturity_response_route(
     maturity_agent_response_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(MaturityAgentResponseData)),
     handler: dict[str, Callable] = Depends(get_maturity_agent_response_handler)
 ):
     """
@@ -132,6 +137,7 @@ async def get_maturity_response_route(
     
     Args:
         maturity_agent_response_id: ID of the maturity agent response to get
+        fields: Optional fields to return
         handler: Maturity agent response handler functions
         
     Returns:
@@ -141,11 +147,11 @@ async def get_maturity_response_route(
         HTTPException: If maturity agent response not found
     """
     response = await handler['get_maturity_response'](
-        GetMaturityAgentResponse(maturity_agent_response_id=maturity_agent_response_id)
+        GetMaturityAgentResponse(maturity_agent_response_id=maturity_agent_response_id, fields=fields)
     )
     if not response:
         raise HTTPException(status_code=404, detail="Maturity agent response not found")
-    return response
+    return sparse(response, fields)
 
 
 @router.get("/", response_model=ListMaturityAgentResponses)
@@ -153,6 +159,9 @@ async def list_maturity_responses_route(
     agent_id: Optional[int] = Query(None, description="Filter by agent ID"),
     maturity_question_id: Optional[int] = Query(
         None, description="Filter by maturity question ID"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(MaturityAgentResponseData)),
     handler: dict[str, Callable] = Depends(get_maturity_agent_response_handler)
 ):
     """
@@ -161,9 +170,15 @@ async def list_maturity_responses_route(
     Args:
         agent_id: Optional agent ID filter
         maturity_question_id: Optional maturity question ID filter
+        ids: Optional IDs to fetch instead of listing
+        page: Requested page, see ``limit``, ``after`` and ``count``
+        fields: Optional fields to return
         handler: Maturity agent response handler functions
         
     Returns:
         ListMaturityAgentResponses: List of maturity agent responses
     """
-    return await handler['list_maturity_responses'](agent_id, maturity_question_id)
+    if ids:
+        return sparse(await handler['get_maturity_responses_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_maturity_responses'](
+        agent_id, maturity_question_id, page.limit, page.after, fields, page.count), fields)
@@ -1,5 +1,6 @@
 """FastAPI routes for maturity answer operations."""
-from typing import Optional, Callable
+from functools import partial
+from typing import Optional, Callable, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,44 +10,73 @@ from domain.command.maturity_answer_command import (
     DeleteMaturityAnswer,
     GetMaturityAnswer,
     MaturityAnswerResponse,
-    ListMaturityAnswers
+    ListMaturityAnswers,
+    UpsertMaturityAnswers,
+    UpsertMaturityAnswersResponse
 )
 from domain.command_handlers.maturity_answer_handler import (
     create_maturity_answer,
+    upsert_maturity_answers,
+    complete_session_answers,
     update_maturity_answer,
     delete_maturity_answer,
     get_maturity_answer,
-    list_maturity_answers
+    list_maturity_answers,
+    get_maturity_answers_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.maturity_answer_repository import MaturityAnswerRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.repositories.session_repository import SessionRepository
+from adapters.postgres.config import RequestSessions, get_sessions, get_unit_of_work
+from adapters.postgres.deadline import deadline
 
 router = APIRouter(prefix="/maturity-answers", tags=["maturity-answers"])
 
 
 async def get_maturity_answer_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for maturity answer handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for maturity answers
     """
-    repository = MaturityAnswerRepository(session)
+    repository = lambda: MaturityAnswerRepository(sessions.primary)
+    read_repository = lambda: MaturityAnswerRepository(sessions.read)
     return {
-        'create_maturity_answer': lambda cmd: create_maturity_answer(repository, cmd),
-        'update_maturity_answer': lambda cmd: update_maturity_answer(repository, cmd),
-        'delete_maturity_answer': lambda cmd: delete_maturity_answer(repository, cmd),
-        'get_maturity_answer': lambda cmd: get_maturity_answer(repository, cmd),
-        'list_maturity_answers': lambda session_id=None, maturity_question_id=None: 
-            list_maturity_answers(repository, session_id, maturity_question_id)
+        'create_maturity_answer': lambda cmd: create_maturity_answer(repository(), cmd),
+        'upsert_maturity_answers': lambda cmd: upsert_maturity_answers(repository(), cmd),
+        'update_maturity_answer': lambda cmd: update_maturity_answer(repository(), cmd),
+        'delete_maturity_answer': lambda cmd: delete_maturity_answer(repository(), cmd),
+        'get_maturity_answer': lambda cmd: get_maturity_answer(read_repository(), cmd),
+        'get_maturity_answers_by_ids': lambda ids, fields=None: get_maturity_answers_by_ids(read_repository(), ids, fields),
+        'list_maturity_answers': lambda session_id=None, maturity_question_id=None, limit=None, after=None, fields=None, count="none": 
+            list_maturity_answers(read_repository(), session_id, maturity_question_id, limit, after, fields, count)
     }
 
 
+async def get_complete_session_handler(
+    session: AsyncSession = Depends(get_unit_of_work, scope="function")
+) -> Callable:
+    """
+    Dependency injection for closing a session with its answers.
+
+    Args:
+        session: Unit of work shared by the answer and session repositories
+
+    Returns:
+        Callable: Handler saving the answers and closing the session
+    """
+    return partial(
+        complete_session_answers, MaturityAnswerRepository(session), SessionRepository(session))
+
+
 @router.post("/", response_model=int)
 async def create_maturity_answer_endpoint(
     command: CreateMaturityAnswer,
@@ -71,6 +101,58 @@ async def create_maturity_answer_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.put("/bulk", response_model=UpsertMaturityAnswersResponse)
+async def upsert_maturity_answers_endpoint(
+    command: UpsertMaturityAnswers,
+    handler: dict[str, Callable] = Depends(get_maturity_answer_handler)
+):
+    """
+    Save many answers of a session, creating or overwriting them per question.
+    
+    Args:
+        command: UpsertMaturityAnswers command with the session and its answers
+        handler: Maturity answer handler functions
+        
+    Returns:
+        UpsertMaturityAnswersResponse: Number of answers inserted and updated
+        
+    Raises:
+        HTTPException: If the session or a question does not exist
+    """
+    try:
+        return await handler['upsert_maturity_answers'](command)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/complete", response_model=UpsertMaturityAnswersResponse)
+async def complete_session_answers_endpoint(
+    command: UpsertMaturityAnswers,
+    handler: Callable = Depends(get_complete_session_handler)
+):
+    """
+    Save the final answers of a session and close it, in one transaction.
+
+    Args:
+        command: UpsertMaturityAnswers command with the session and its answers
+        handler: Handler sharing one unit of work between both repositories
+
+    Returns:
+        UpsertMaturityAnswersResponse: Number of answers inserted and updated
+
+    Raises:
+        HTTPException: If the session is not active or a question does not
+            exist; nothing is written in either case
+    """
+    try:
+        result = await handler(command)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Session not found or already inactive")
+    return result
+
+
 @router.put("/{maturity_answer_id}", response_model=bool)
 async def update_maturity_answer_endpoint(
     maturity_answer_id: int,
@@ -126,6 +208,7 @@ async def delete_maturity_answer_endpoint(
 @router.get("/{maturity_answer_id}", response_model=MaturityAnswerResponse)
 async def get_maturity_answer_endpoint(
     maturity_answer_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(MaturityAnswerResponse)),
     handler: dict[str, Callable] = Depends(get_maturity_answer_handler)
 ):
     """
@@ -133,6 +216,7 @@ async def get_maturity_answer_endpoint(
     
     Args:
         maturity_answer_id: ID of the maturity answer to get
+        fields: Optional fields to return
         handler: Maturity answer handler functions
         
     Returns:
@@ -141,16 +225,19 @@ async def get_maturity_answer_endpoint(
     Raises:
         HTTPException: If maturity answer not found
     """
-    answer = await handler['get_maturity_answer'](GetMaturityAnswer(maturity_answer_id=maturity_answer_id))
+    answer = await handler['get_maturity_answer'](GetMaturityAnswer(maturity_answer_id=maturity_answer_id, fields=fields))
     if not answer:
         raise HTTPException(status_code=404, detail="Maturity answer not found")
-    return answer
+    return sparse(answer, fields)
 
 
-@router.get("/", response_model=ListMaturityAnswers)
+@router.get("/", response_model=ListMaturityAnswers, dependencies=[Depends(deadline(5))])
 async def list_maturity_answers_endpoint(
     session_id: Optional[int] = Query(None, description="Filter by session ID"),
     maturity_question_id: Optional[int] = Query(None, description="Filter by maturity question ID"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(MaturityAnswerResponse)),
     handler: dict[str, Callable] = Depends(get_maturity_answer_handler)
 ):
     """
@@ -159,9 +246,15 @@ async def list_maturity_answers_endpoint(
     Args:
         session_id: Optional session ID filter
         maturity_question_id: Optional maturity question ID filter
+        ids: Optional IDs to fetch instead of listing
+        page: Requested page, see ``limit``, ``after`` and ``count``
+        fields: Optional fields to return
         handler: Maturity answer handler functions
         
     Returns:
         ListMaturityAnswers: List of maturity answers
     """
-    return await handler['list_maturity_answers'](session_id, maturity_question_id)
+    if ids:
+        return sparse(await handler['get_maturity_answers_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_maturity_answers'](
+        session_id, maturity_question_id, page.limit, page.after, fields, page.count), fields)
@@ -1,10 +1,12 @@
 """FastAPI routes for maturity question operations."""
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.maturity_question_repository import MaturityQuestionRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 from adapters.s3 import main as s3
 from adapters.saia import saia_adapter
 
@@ -12,6 +14,8 @@ from adapters.saia import saia_adapter
 from domain.command.comon_command import sql, Sources
 
 from domain.command.maturity_question_command import (
+    BulkCreateMaturityQuestions,
+    BulkCreateMaturityQuestionsResponse,
     CreateMaturityQuestion,
     UpdateMaturityQuestion,
     DeleteMaturityQuestion,
@@ -23,11 +27,13 @@ from domain.command.maturity_question_command import (
     ChatResponse
 )
 from domain.command_handlers.maturity_question_handler import (
+    bulk_create_maturity_questions,
     create_maturity_question,
     update_maturity_question,
     delete_maturity_question,
     get_maturity_question,
     list_maturity_questions,
+    get_maturity_questions_by_ids,
     chat_maturity_questions
 )
 
@@ -35,28 +41,31 @@ router = APIRouter(prefix="/maturity-questions", tags=["maturity-questions"])
 
 
 async def get_maturity_question_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for maturity question handler functions.
 
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
 
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for maturity questions
     """
-    repository = MaturityQuestionRepository(session)
-    sql_object = sql(maturity_question=repository)
-    sources = Sources(sql=sql_object, asistant=saia_adapter, storage=s3)
+    repository = lambda: MaturityQuestionRepository(sessions.primary)
+    read_repository = lambda: MaturityQuestionRepository(sessions.read)
+    sources = lambda: Sources(
+        sql=sql(maturity_question=read_repository()), asistant=saia_adapter, storage=s3)
     return {
-        'chat_maturity_question': lambda cmd: chat_maturity_questions(sources, cmd),
-        'create_maturity_question': lambda cmd: create_maturity_question(repository, cmd),
-        'update_maturity_question': lambda cmd: update_maturity_question(repository, cmd),
-        'delete_maturity_question': lambda cmd: delete_maturity_question(repository, cmd),
-        'get_maturity_question': lambda cmd: get_maturity_question(repository, cmd),
-        'list_maturity_questions': lambda category=None, question_type=None, axis_id=None, industry_id=None: list_maturity_questions(
-            repository, category, question_type, axis_id, industry_id
+        'chat_maturity_question': lambda cmd: chat_maturity_questions(sources(), cmd),
+        'create_maturity_question': lambda cmd: create_maturity_question(repository(), cmd),
+        'bulk_create_maturity_questions': lambda cmd: bulk_create_maturity_questions(repository(), cmd),
+        'update_maturity_question': lambda cmd: update_maturity_question(repository(), cmd),
+        'delete_maturity_question': lambda cmd: delete_maturity_question(repository(), cmd),
+        'get_maturity_question': lambda cmd: get_maturity_question(read_repository(), cmd),
+        'get_maturity_questions_by_ids': lambda ids, fields=None: get_maturity_questions_by_ids(read_repository(), ids, fields),
+        'list_maturity_questions': lambda category=None, question_type=None, axis_id=None, industry_id=None, limit=None, after=None, fields=None, count="none": list_maturity_questions(
+            read_repository(), category, question_type, axis_id, industry_id, limit, after, fields, count
         )
     }
 
@@ -95,6 +104,33 @@ async def create_maturity_question_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", response_model=BulkCreateMaturityQuestionsResponse)
+async def bulk_create_maturity_questions_endpoint(
+    command: BulkCreateMaturityQuestions,
+    handler: dict[str, Callable] = Depends(get_maturity_question_handler)
+):
+    """
+    Create many maturity questions with their agent response options.
+
+    All questions and options are written in one transaction; if any row
+    is rejected, nothing is created.
+
+    Args:
+        command: BulkCreateMaturityQuestions command with questions and nested options
+        handler: Maturity question handler functions
+
+    Returns:
+        BulkCreateMaturityQuestionsResponse: Generated question and option IDs in input order
+
+    Raises:
+        HTTPException: If validation fails
+    """
+    try:
+        return await handler['bulk_create_maturity_questions'](command)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.put("/{maturity_question_id}", response_model=bool)
 async def update_maturity_question_endpoint(
     maturity_question_id: int,
@@ -151,6 +187,7 @@ async def delete_maturity_question_endpoint(
 @router.get("/{maturity_question_id}", response_model=MaturityQuestionResponse)
 async def get_maturity_question_endpoint(
     maturity_question_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(MaturityQuestionResponse)),
     handler: dict[str, Callable] = Depends(get_maturity_question_handler)
 ):
     """
@@ -158,6 +195,7 @@ async def get_maturity_question_endpoint(
 
     Args:
         maturity_question_id: ID of the maturity question to get
+        fields: Optional fields to return
         handler: Maturity question handler functions
 
     Returns:
@@ -166,11 +204,11 @@ async def get_maturity_question_endpoint(
     Raises:
         HTTPException: If maturity question not found
     """
-    command = GetMaturityQuestion(maturity_question_id=maturity_question_id)
+    command = GetMaturityQuestion(maturity_question_id=maturity_question_id, fields=fields)
     maturity_question = await handler['get_maturity_question'](command)
     if not maturity_question:
         raise HTTPException(status_code=404, detail="Maturity question not found")
-    return maturity_question
+    return sparse(maturity_question, fields)
 
 
 @router.get("/", response_model=ListMaturityQuestions)
@@ -179,6 +217,9 @@ async def list_maturity_questions_endpoint(
     question_type: Optional[str] = Query(None, description="Filter by question type"),
     axis_id: Optional[int] = Query(None, description="Filter by axis ID"),
     industry_id: Optional[int] = Query(None, description="Filter by industry ID"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(MaturityQuestionResponse)),
     handler: dict[str, Callable] = Depends(get_maturity_question_handler)
 ):
     """
@@ -189,9 +230,15 @@ async def list_maturity_questions_endpoint(
         question_type: Optional question type filter
         axis_id: Optional axis ID filter
         industry_id: Optional industry ID filter
+        ids: Optional IDs to fetch instead of listing
+        page: Requested page, see ``limit``, ``after`` and ``count``
+        fields: Optional fields to return
         handler: Maturity question handler functions
 
     Returns:
         ListMaturityQuestions: List of maturity questions
     """
-    return await handler['list_maturity_questions'](category, question_type, axis_id, industry_id)
+    if ids:
+        return sparse(await handler['get_maturity_questions_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_maturity_questions'](
+        category, question_type, axis_id, industry_id, page.limit, page.after, fields, page.count), fields)
@@ -0,0 +1,21 @@
+"""FastAPI routes for internal service metrics.
+
+Only mounted outside Lambda; deployed functions publish these metrics as
+EMF log lines instead of serving them.
+"""
+from fastapi import APIRouter
+
+from adapters.postgres import telemetry
+
+router = APIRouter(prefix="/internal", tags=["internal"], include_in_schema=False)
+
+
+@router.get("/metrics")
+async def get_metrics_endpoint() -> dict:
+    """
+    Get connection pool and database statement metrics for this process.
+
+    Returns:
+        dict: Pool gauges per engine and counters since the process started
+    """
+    return telemetry.snapshot()
@@ -1,7 +1,6 @@
 """FastAPI routes for project operations."""
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.project_command import (
     CreateProject,
@@ -16,33 +15,40 @@ from domain.command_handlers.project_handler import (
     update_project,
     delete_project,
     get_project,
-    list_projects
+    list_projects,
+    get_projects_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.project_repository import ProjectRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 async def get_project_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for project handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for projects
     """
-    repository = ProjectRepository(session)
+    repository = lambda: ProjectRepository(sessions.primary)
+    read_repository = lambda: ProjectRepository(sessions.read)
     return {
-        'create_project': lambda cmd: create_project(repository, cmd),
-        'update_project': lambda cmd: update_project(repository, cmd),
-        'delete_project': lambda cmd: delete_project(repository, cmd),
-        'get_project': lambda cmd: get_project(repository, cmd),
-        'list_projects': lambda company_id=None: list_projects(repository, company_id)
+        'create_project': lambda cmd: create_project(repository(), cmd),
+        'update_project': lambda cmd: update_project(repository(), cmd),
+        'delete_project': lambda cmd: delete_project(repository(), cmd),
+        'get_project': lambda cmd: get_project(read_repository(), cmd),
+        'get_projects_by_ids': lambda ids, fields=None: get_projects_by_ids(read_repository(), ids, fields),
+        'list_projects': lambda company_id=None, limit=None, after=None, fields=None, count="none":
+            list_projects(read_repository(), company_id, limit, after, fields, count)
     }
 
 
@@ -89,20 +95,26 @@ async def delete_project_route(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project_route(
     project_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(ProjectResponse)),
     handler: dict[str, Callable] = Depends(get_project_handler)
 ):
     """Get a project by ID."""
-    command = GetProject(project_id=project_id)
+    command = GetProject(project_id=project_id, fields=fields)
     project = await handler['get_project'](command)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return sparse(project, fields)
 
 
 @router.get("/", response_model=ListProjects)
 async def list_projects_route(
     company_id: Optional[int] = Query(None, gt=0),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(ProjectResponse)),
     handler: dict[str, Callable] = Depends(get_project_handler)
 ):
     """List all projects, optionally filtered by company_id."""
-    return await handler['list_projects'](company_id)
+    if ids:
+        return sparse(await handler['get_projects_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_projects'](company_id, page.limit, page.after, fields, page.count), fields)
@@ -2,10 +2,12 @@ from functools import partial
 from typing import Callable
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from adapters.postgres.repositories.registration_repository import RegistrationRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import get_read_session
+from adapters.postgres.deadline import DeadlineExceeded
 from domain.command_handlers.registration_command_handler import get_registration
 from domain.command.registration_command import RegistrationResponse
 from domain.command.user_command import GetUser
@@ -16,7 +18,7 @@ router = APIRouter(prefix="/registration", tags=["agents"])
 
 
 async def create_registration_handler(
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_read_session)
 ) -> Callable:
     """
     Create a registration handler with dependency injection.
@@ -47,11 +49,20 @@ async def get_user_data_route(
         
     Returns:
         RegistrationResponse: User registration data
+
+    Raises:
+        HTTPException: 404 when no user has the email
     """
     try:
-        return await handler(command)
+        registration = await handler(command)
+    except (DeadlineExceeded, PoolTimeoutError):
+        # Left to the app's 504 and 503 handlers
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400,
             detail=f"Failed to get user data: {str(e)}"
         )
+    if registration is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return registration
@@ -1,7 +1,6 @@
 """FastAPI routes for role operations."""
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.role_command import (
     CreateRole,
@@ -16,33 +15,39 @@ from domain.command_handlers.role_handler import (
     update_role,
     delete_role,
     get_role,
-    list_roles
+    list_roles,
+    get_roles_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.role_repository import RoleRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/roles", tags=["roles"])
 
 
 async def get_role_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for role handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for roles
     """
-    repository = RoleRepository(session)
+    repository = lambda: RoleRepository(sessions.primary)
+    read_repository = lambda: RoleRepository(sessions.read)
     return {
-        'create_role': lambda cmd: create_role(repository, cmd),
-        'update_role': lambda cmd: update_role(repository, cmd),
-        'delete_role': lambda cmd: delete_role(repository, cmd),
-        'get_role': lambda cmd: get_role(repository, cmd),
-        'list_roles': lambda: list_roles(repository)
+        'create_role': lambda cmd: create_role(repository(), cmd),
+        'update_role': lambda cmd: update_role(repository(), cmd),
+        'delete_role': lambda cmd: delete_role(repository(), cmd),
+        'get_role': lambda cmd: get_role(read_repository(), cmd),
+        'get_roles_by_ids': lambda ids, fields=None: get_roles_by_ids(read_repository(), ids, fields),
+        'list_roles': lambda limit=None, after=None, fields=None, count="none": list_roles(read_repository(), limit, after, fields, count)
     }
 
 
@@ -89,19 +94,25 @@ async def delete_role_route(
 @router.get("/{role_id}", response_model=RoleResponse)
 async def get_role_route(
     role_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(RoleResponse)),
     handler: dict[str, Callable] = Depends(get_role_handler)
 ):
     """Get a role by ID."""
-    command = GetRole(role_id=role_id)
+    command = GetRole(role_id=role_id, fields=fields)
     role = await handler['get_role'](command)
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
-    return role
+    return sparse(role, fields)
 
 
 @router.get("/", response_model=ListRoles)
 async def list_roles_route(
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(RoleResponse)),
     handler: dict[str, Callable] = Depends(get_role_handler)
 ):
     """List all roles."""
-    return await handler['list_roles']()
+    if ids:
+        return sparse(await handler['get_roles_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_roles'](page.limit, page.after, fields, page.count), fields)
@@ -1,7 +1,6 @@
 """FastAPI routes for session operations."""
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.session_command import (
     CreateSession,
@@ -17,34 +16,41 @@ from domain.command_handlers.session_handler import (
     delete_session,
     get_session,
     list_sessions,
+    get_sessions_by_ids,
     deactivate_session
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.session_repository import SessionRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
 async def get_session_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for session handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for sessions
     """
-    repository = SessionRepository(session)
+    repository = lambda: SessionRepository(sessions.primary)
+    read_repository = lambda: SessionRepository(sessions.read)
     return {
-        'create_session': lambda cmd: create_session(repository, cmd),
-        'update_session': lambda cmd: update_session(repository, cmd),
-        'delete_session': lambda cmd: delete_session(repository, cmd),
-        'get_session': lambda cmd: get_session(repository, cmd),
-        'list_sessions': lambda active_only: list_sessions(repository, active_only),
-        'deactivate_session': lambda session_id: deactivate_session(repository, session_id)
+        'create_session': lambda cmd: create_session(repository(), cmd),
+        'update_session': lambda cmd: update_session(repository(), cmd),
+        'delete_session': lambda cmd: delete_session(repository(), cmd),
+        'get_session': lambda cmd: get_session(read_repository(), cmd),
+        'get_sessions_by_ids': lambda ids, fields=None: get_sessions_by_ids(read_repository(), ids, fields),
+        'list_sessions': lambda active_only, limit=None, after=None, fields=None, count="none":
+            list_sessions(read_repository(), active_only, limit, after, fields, count),
+        'deactivate_session': lambda session_id: deactivate_session(repository(), session_id)
     }
 
 
@@ -91,23 +97,29 @@ async def delete_session_route(
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session_route(
     session_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(SessionResponse)),
     handler: dict[str, Callable] = Depends(get_session_handler)
 ):
     """Get a session by ID."""
-    command = GetSession(session_id=session_id)
+    command = GetSession(session_id=session_id, fields=fields)
     session = await handler['get_session'](command)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    return session
+    return sparse(session, fields)
 
 
 @router.get("/", response_model=ListSessions)
 async def list_sessions_route(
     active_only: bool = Query(False, description="Filter for active sessions only"),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(SessionResponse)),
     handler: dict[str, Callable] = Depends(get_session_handler)
 ):
     """List all sessions."""
-    return await handler['list_sessions'](active_only)
+    if ids:
+        return sparse(await handler['get_sessions_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_sessions'](active_only, page.limit, page.after, fields, page.count), fields)
 
 
 @router.post("/{session_id}/deactivate", response_model=bool)
@@ -1,7 +1,6 @@
 """FastAPI routes for subdomain operations."""
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.subdomain_command import (
     CreateSubdomain,
@@ -16,33 +15,40 @@ from domain.command_handlers.subdomain_handler import (
     update_subdomain,
     delete_subdomain,
     get_subdomain,
-    list_subdomains
+    list_subdomains,
+    get_subdomains_by_ids
 )
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
 from adapters.postgres.repositories.subdomain_repository import SubdomainRepository
-from adapters.postgres.config import get_session
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/subdomains", tags=["subdomains"])
 
 
 async def get_subdomain_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for subdomain handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for subdomains
     """
-    repository = SubdomainRepository(session)
+    repository = lambda: SubdomainRepository(sessions.primary)
+    read_repository = lambda: SubdomainRepository(sessions.read)
     return {
-        'create_subdomain': lambda cmd: create_subdomain(repository, cmd),
-        'update_subdomain': lambda cmd: update_subdomain(repository, cmd),
-        'delete_subdomain': lambda cmd: delete_subdomain(repository, cmd),
-        'get_subdomain': lambda cmd: get_subdomain(repository, cmd),
-        'list_subdomains': lambda domain_id: list_subdomains(repository, domain_id)
+        'create_subdomain': lambda cmd: create_subdomain(repository(), cmd),
+        'update_subdomain': lambda cmd: update_subdomain(repository(), cmd),
+        'delete_subdomain': lambda cmd: delete_subdomain(repository(), cmd),
+        'get_subdomain': lambda cmd: get_subdomain(read_repository(), cmd),
+        'get_subdomains_by_ids': lambda ids, fields=None: get_subdomains_by_ids(read_repository(), ids, fields),
+        'list_subdomains': lambda domain_id, limit=None, after=None, fields=None, count="none":
+            list_subdomains(read_repository(), domain_id, limit, after, fields, count)
     }
 
 
@@ -89,20 +95,26 @@ async def delete_subdomain_route(
 @router.get("/{subdomain_id}", response_model=SubdomainResponse)
 async def get_subdomain_route(
     subdomain_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(SubdomainResponse)),
     handler: dict[str, Callable] = Depends(get_subdomain_handler)
 ):
     """Get a subdomain by ID."""
-    command = GetSubdomain(subdomain_id=subdomain_id)
+    command = GetSubdomain(subdomain_id=subdomain_id, fields=fields)
     subdomain = await handler['get_subdomain'](command)
     if not subdomain:
         raise HTTPException(status_code=404, detail="Subdomain not found")
-    return subdomain
+    return sparse(subdomain, fields)
 
 
 @router.get("/", response_model=ListSubdomains)
 async def list_subdomains_route(
     domain_id: Optional[int] = Query(None, gt=0),
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(SubdomainResponse)),
     handler: dict[str, Callable] = Depends(get_subdomain_handler)
 ):
     """List all subdomains, optionally filtered by domain_id."""
-    return await handler['list_subdomains'](domain_id)
+    if ids:
+        return sparse(await handler['get_subdomains_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_subdomains'](domain_id, page.limit, page.after, fields, page.count), fields)
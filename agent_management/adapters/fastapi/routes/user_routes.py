@@ -1,7 +1,6 @@
 """FastAPI routes for user operations."""
-from typing import Callable
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from domain.command.user_command import (
     CreateUser,
@@ -16,33 +15,42 @@ from domain.command_handlers.user_handler import (
     update_user,
     delete_user,
     get_user,
-    list_users
+    list_users,
+    get_users_by_ids,
+    search_users
 )
-from adapters.postgres.repositories.user_repository import UserRepository
-from adapters.postgres.config import get_session
+from adapters.fastapi.batch import id_list
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.fastapi.pagination import PageParams, page_params
+from adapters.postgres.pagination import MAX_PAGE_SIZE
+from adapters.postgres.repositories.user_repository import MIN_SEARCH_LENGTH, UserRepository
+from adapters.postgres.config import RequestSessions, get_sessions
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 async def get_user_handler(
-    session: AsyncSession = Depends(get_session)
+    sessions: RequestSessions = Depends(get_sessions)
 ) -> dict[str, Callable]:
     """
     Dependency injection for user handler functions.
     
     Args:
-        session: AsyncSession from dependency injection
+        sessions: Primary and read sessions, each opened on first use
         
     Returns:
         dict[str, Callable]: Dictionary containing handler functions for users
     """
-    repository = UserRepository(session)
+    repository = lambda: UserRepository(sessions.primary)
+    read_repository = lambda: UserRepository(sessions.read)
     return {
-        'create_user': lambda cmd: create_user(repository, cmd),
-        'update_user': lambda cmd: update_user(repository, cmd),
-        'delete_user': lambda cmd: delete_user(repository, cmd),
-        'get_user': lambda cmd: get_user(repository, cmd),
-        'list_users': lambda: list_users(repository)
+        'create_user': lambda cmd: create_user(repository(), cmd),
+        'update_user': lambda cmd: update_user(repository(), cmd),
+        'delete_user': lambda cmd: delete_user(repository(), cmd),
+        'get_user': lambda cmd: get_user(read_repository(), cmd),
+        'get_users_by_ids': lambda ids, fields=None: get_users_by_ids(read_repository(), ids, fields),
+        'search_users': lambda email, limit=20: search_users(read_repository(), email, limit),
+        'list_users': lambda limit=None, after=None, fields=None, count="none": list_users(read_repository(), limit, after, fields, count)
     }
 
 
@@ -85,21 +93,37 @@ async def route_delete_user(
     return True
 
 
+@router.get("/search", response_model=ListUsers)
+async def route_search_users(
+    email: str = Query(..., min_length=MIN_SEARCH_LENGTH),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    handler: dict[str, Callable] = Depends(get_user_handler)
+):
+    """Search users by part of their email, closest matches first."""
+    return await handler['search_users'](email, limit)
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def route_get_user(
     user_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(UserResponse)),
     handler: dict[str, Callable] = Depends(get_user_handler)
 ):
     """Get a user by ID."""
-    user = await handler['get_user'](GetUser(user_id=user_id))
+    user = await handler['get_user'](GetUser(user_id=user_id, fields=fields))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return sparse(user, fields)
 
 
 @router.get("/", response_model=ListUsers)
 async def route_list_users(
+    ids: Optional[Tuple[int, ...]] = Depends(id_list),
+    page: PageParams = Depends(page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(fieldset(UserResponse)),
     handler: dict[str, Callable] = Depends(get_user_handler)
 ):
     """List all users."""
-    return await handler['list_users']()
+    if ids:
+        return sparse(await handler['get_users_by_ids'](ids, fields), fields)
+    return sparse(await handler['list_users'](page.limit, page.after, fields, page.count), fields)
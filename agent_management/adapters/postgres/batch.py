@@ -0,0 +1,44 @@
+"""Batched lookups of many rows by primary key."""
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import Integer, Select, any_, bindparam, inspect, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from adapters.postgres.fieldsets import Fields, selection
+from adapters.postgres.pagination import MAX_PAGE_SIZE
+
+# Largest number of IDs a client may fetch at once.
+MAX_IDS = MAX_PAGE_SIZE
+
+
+def select_many(model: type, ids: Sequence[int], fields: Fields = None) -> Select:
+    """SELECT of the rows of ``model`` whose primary key is in ``ids``.
+
+    The IDs are bound as a single array, ``pk = ANY(:ids)``, so the SQL
+    and its prepared statement are the same however many IDs are passed;
+    an IN list would produce a new statement for every length.
+
+    Args:
+        model: Mapped class with a single-column primary key
+        ids: Primary keys to fetch
+        fields: Optional columns to return
+    """
+    key = getattr(model, inspect(model).primary_key[0].key)
+    ids = bindparam("ids", list(ids), type_=ARRAY(Integer))
+    return select(*selection(model, fields)).where(key == any_(ids))
+
+
+def in_order(rows: Sequence[Any], key: str, ids: Sequence[int]) -> Tuple[List[Any], List[int]]:
+    """Arrange the rows fetched by ``select_many`` in the order of ``ids``.
+
+    Args:
+        rows: Rows returned by the query
+        key: Attribute name of the primary key
+        ids: IDs that were requested
+
+    Returns:
+        Tuple[List[Any], List[int]]: The rows found, and the IDs no row
+        matched
+    """
+    by_key = {getattr(row, key): row for row in rows}
+    return [by_key[i] for i in ids if i in by_key], [i for i in ids if i not in by_key]
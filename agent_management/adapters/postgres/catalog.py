@@ -0,0 +1,172 @@
+"""Incremental maintenance and backfill of the maturity question catalog."""
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from sqlalchemy import Integer, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
+
+# Rebuilds the catalog rows of the selected questions in one statement:
+# questions with agent responses are upserted with their options aggregated,
+# and rows of questions left without responses are deleted. ambitus_id is a
+# column of the deployed maturity_questions table that the ORM model does not
+# map; the survey is ordered by it.
+REFRESH_CATALOG_SQL = """
+    WITH fresh AS (
+        SELECT
+            mq.maturity_question_id,
+            mq.question_text,
+            mq.question_type,
+            mq.question_order,
+            mq.category,
+            mq.axis_id,
+            mq.industry_id,
+            mq.ambitus_id,
+            jsonb_agg(jsonb_build_object(
+                'id', mar.maturity_agent_response_id,
+                'text', mar.response_text,
+                'score', 0
+            ) ORDER BY mar.maturity_agent_response_id) AS options
+        FROM __[SCHEMA__none].maturity_questions mq
+        JOIN __[SCHEMA__none].maturity_agent_responses mar
+            ON mar.maturity_question_id = mq.maturity_question_id
+        {question_filter}
+        GROUP BY mq.maturity_question_id
+    ),
+    stale AS (
+        DELETE FROM __[SCHEMA__none].maturity_question_catalog c
+        WHERE NOT EXISTS (
+            SELECT 1 FROM fresh f WHERE f.maturity_question_id = c.maturity_question_id
+        )
+        {stale_filter}
+    )
+    INSERT INTO __[SCHEMA__none].maturity_question_catalog (
+        maturity_question_id, question_text, question_type, question_order,
+        category, axis_id, industry_id, ambitus_id, options
+    )
+    SELECT
+        maturity_question_id, question_text, question_type, question_order,
+        category, axis_id, industry_id, ambitus_id, options
+    FROM fresh
+    ON CONFLICT (maturity_question_id) DO UPDATE SET
+        question_text = EXCLUDED.question_text,
+        question_type = EXCLUDED.question_type,
+        question_order = EXCLUDED.question_order,
+        category = EXCLUDED.category,
+        axis_id = EXCLUDED.axis_id,
+        industry_id = EXCLUDED.industry_id,
+        ambitus_id = EXCLUDED.ambitus_id,
+        options = EXCLUDED.options
+"""
+
+# Locks the questions about to be refreshed, in a stable order, before their
+# options are aggregated. Refreshes of the same question then run one after
+# the other. Under READ COMMITTED the refresh statement takes its snapshot
+# once the lock is granted, so it sees everything the previous refresh's
+# transaction committed and cannot overwrite the row with a stale option
+# list. FOR NO KEY UPDATE does not conflict with the KEY SHARE lock that
+# inserting an agent response takes on its question.
+LOCK_QUESTIONS_SQL = """
+    SELECT maturity_question_id
+    FROM __[SCHEMA__none].maturity_questions mq
+    {question_filter}
+    ORDER BY maturity_question_id
+    FOR NO KEY UPDATE
+"""
+
+
+# The backfill marks the table with a comment in the transaction that fills
+# it. Rows written before then only cover the questions changed since the
+# table was created. Reading the mark is a system catalog lookup, and yields
+# NULL while the table does not exist.
+CATALOG_BACKFILLED = "backfilled"
+CATALOG_READY_SQL = text(
+    "SELECT obj_description("
+    "to_regclass('__[SCHEMA__none].maturity_question_catalog'), 'pg_class')"
+    f" = '{CATALOG_BACKFILLED}'"
+)
+MARK_BACKFILLED_SQL = text(
+    f"COMMENT ON TABLE __[SCHEMA__none].maturity_question_catalog IS '{CATALOG_BACKFILLED}'"
+)
+
+_catalog_ready = False
+
+
+@lru_cache(maxsize=2)
+def _lock_questions_query(selected: bool) -> TextClause:
+    """Build the lock statement for some questions, or for all of them."""
+    if not selected:
+        return text(LOCK_QUESTIONS_SQL.format(question_filter=""))
+    return text(LOCK_QUESTIONS_SQL.format(
+        question_filter="WHERE mq.maturity_question_id = ANY(:ids)"
+    )).bindparams(bindparam("ids", type_=ARRAY(Integer)))
+
+
+@lru_cache(maxsize=2)
+def _refresh_catalog_query(selected: bool) -> TextClause:
+    """Build the refresh statement for some questions, or for all of them."""
+    if not selected:
+        return text(REFRESH_CATALOG_SQL.format(question_filter="", stale_filter=""))
+    return text(REFRESH_CATALOG_SQL.format(
+        question_filter="WHERE mq.maturity_question_id = ANY(:ids)",
+        stale_filter="AND c.maturity_question_id = ANY(:ids)"
+    )).bindparams(bindparam("ids", type_=ARRAY(Integer)))
+
+
+async def refresh_catalog(
+    session: AsyncSession,
+    question_ids: Optional[Iterable[Optional[int]]] = None
+) -> None:
+    """Bring the catalog rows of ``question_ids`` up to date.
+
+    Runs in the caller's transaction, so the catalog commits or rolls back
+    together with the write that changed the questions or their options.
+    The questions stay locked until then, so concurrent refreshes of the
+    same question are applied in order.
+
+    Args:
+        session: Session the repository writes through
+        question_ids: Questions whose rows to rebuild; None rebuilds the
+            whole catalog
+    """
+    if question_ids is None:
+        await session.execute(_lock_questions_query(False))
+        await session.execute(_refresh_catalog_query(False))
+        return
+    ids = sorted({question_id for question_id in question_ids if question_id is not None})
+    if ids:
+        await session.execute(_lock_questions_query(True), {"ids": ids})
+        await session.execute(_refresh_catalog_query(True), {"ids": ids})
+
+
+async def catalog_ready(session: AsyncSession) -> bool:
+    """Whether the catalog can serve reads in place of the live aggregation.
+
+    Once backfilled, the repositories keep it complete, and the answer is
+    kept for the life of the process; until then every call checks again.
+
+    Args:
+        session: Session to check through
+
+    Returns:
+        bool: True when the table exists and has been backfilled
+    """
+    global _catalog_ready
+    if not _catalog_ready:
+        _catalog_ready = bool((await session.execute(CATALOG_READY_SQL)).scalar())
+    return _catalog_ready
+
+
+async def backfill_catalog(session: AsyncSession) -> None:
+    """Rebuild the whole catalog and mark it ready to serve reads.
+
+    The repositories only refresh the rows of the questions they write, so
+    questions stored before the table existed get theirs here. A full
+    refresh is idempotent, so it is safe to repeat on every deployment.
+
+    Args:
+        session: Session to write through; the caller commits
+    """
+    await refresh_catalog(session)
+    await session.execute(MARK_BACKFILLED_SQL)
@@ -1,18 +1,30 @@
 import json
-import os
+import logging
+import time
+from contextvars import ContextVar
 from dotenv import load_dotenv
-from typing import Optional
+from functools import lru_cache
+from typing import Literal, Optional
+from uuid import uuid4
 
 import boto3
+from asyncpg.exceptions import InvalidAuthorizationSpecificationError
 from pydantic_settings import BaseSettings
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.schema import MetaData
-from sqlalchemy.orm import sessionmaker
-from sshtunnel import SSHTunnelForwarder
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from adapters.postgres import deadline, telemetry
+from adapters.postgres.telemetry import InstrumentedQueuePool
+from adapters.postgres.tunnel import SSHTunnelManager
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseLocalSettings(BaseSettings):
     """Local database configuration settings."""
@@ -28,6 +40,18 @@ class DatabaseLocalSettings(BaseSettings):
     SSH_PORT: int|None = None                      
     SSH_USERNAME: str|None = None
     SSH_PKEY: str|None = None
+    SSH_KEEPALIVE_SECONDS: float = 30.0
+    DB_READ_HOST: str|None = None
+    DB_READ_PORT: int|None = None
+    READ_YOUR_WRITES_SECONDS: float = 0.0
+    DB_POOL_MODE: Literal["queue", "single", "null"] = "queue"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 3600
+    DB_TRANSACTION_POOLER: bool = False
+    DB_SLOW_STATEMENT_MS: float = 500.0
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_REQUEST_DEADLINE_SECONDS: float = 25.0
 
     class Config:
         """Pydantic configuration."""
@@ -38,25 +62,73 @@ class AWSSettings(BaseSettings):
     """AWS configuration settings."""
     STAGE: str = "dev"
     SECRET_NAME: str = ""
+    SECRET_TTL_SECONDS: int = 300
 
     class Config:
         """Pydantic configuration."""
         env_file = ".env"
 
-def get_secret(secret_name: str, region_name: str = "us-east-1") -> dict:
-    """Retrieve secret from AWS Secrets Manager."""
+    @property
+    def database_secret_name(self) -> str:
+        """Name of the Secrets Manager entry holding database credentials."""
+        return f"{self.STAGE}/database"
+
+
+@lru_cache
+def _get_secrets_client(region_name: str):
+    """Get a Secrets Manager client, reused for the life of the process."""
     session = boto3.session.Session()
-    client = session.client(
+    return session.client(
         service_name='secretsmanager',
         region_name=region_name
     )
-    
+
+
+def get_secret(secret_name: str, region_name: str = "us-east-1") -> dict:
+    """Retrieve secret from AWS Secrets Manager."""
+    client = _get_secrets_client(region_name)
+
     try:
         response = client.get_secret_value(SecretId=secret_name)
         return json.loads(response['SecretString'])
     except Exception as e:
         raise ValueError(f"Failed to retrieve secret: {str(e)}")
 
+
+# Secrets fetched from Secrets Manager, keyed by name: (fetched_at, secret).
+_secret_cache: dict[str, tuple[float, dict]] = {}
+
+
+def get_cached_secret(
+    secret_name: str,
+    ttl_seconds: int,
+    force_refresh: bool = False
+) -> dict:
+    """Retrieve a secret, serving it from the in-process cache while fresh.
+
+    Args:
+        secret_name: Name of the secret in Secrets Manager
+        ttl_seconds: Seconds a fetched secret is served from the cache
+        force_refresh: Skip the cache and fetch the current secret value
+
+    Returns:
+        dict: Secret contents
+    """
+    now = time.monotonic()
+    cached = _secret_cache.get(secret_name)
+    if cached and not force_refresh and now - cached[0] < ttl_seconds:
+        return cached[1]
+
+    secret = get_secret(secret_name)
+    _secret_cache[secret_name] = (now, secret)
+    return secret
+
+
+def clear_secret_cache() -> None:
+    """Forget all cached secrets."""
+    _secret_cache.clear()
+
+
 class DatabaseSettings(BaseSettings):
     """Database configuration settings with AWS Secrets support."""
     db_secret: Optional[dict] = None
@@ -75,12 +147,7 @@ class DatabaseSettings(BaseSettings):
                 f"{self.local_settings.DB_NAME}"
             )
         
-        if not self.db_secret:
-            aws_settings = AWSSettings()
-            self.db_secret = get_secret(
-                f"{aws_settings.STAGE}/database"
-            )
-        
+        self._load_secret()
         return (
             f"postgresql+asyncpg://"
             f"{self.db_secret['username']}:{self.db_secret['password']}@"
@@ -88,52 +155,525 @@ class DatabaseSettings(BaseSettings):
             f"{self.db_secret['dbname']}"
         )
 
-def create_engine(settings: DatabaseSettings):
-    """Create database engine with proper configurations."""
-    return create_async_engine(
-        settings.database_url,
+    @property
+    def read_database_url(self) -> Optional[str]:
+        """Generate the read replica URL, or None when no replica is configured.
+
+        Replicas come from DB_READ_HOST/DB_READ_PORT locally or from the
+        optional ``read_host``/``read_port`` keys of the secret. They are not
+        used through the SSH tunnel, which only forwards to the primary.
+        """
+        if self.local_settings.USE_LOCAL_DB:
+            if not self.local_settings.DB_READ_HOST or self.local_settings.SSH_HOST:
+                return None
+            return (
+                f"postgresql+asyncpg://"
+                f"{self.local_settings.DB_USERNAME}"
+                f":{self.local_settings.DB_PASSWORD}@"
+                f"{self.local_settings.DB_READ_HOST}"
+                f":{self.local_settings.DB_READ_PORT or self.local_settings.DB_PORT}/"
+                f"{self.local_settings.DB_NAME}"
+            )
+
+        self._load_secret()
+        if not self.db_secret.get('read_host'):
+            return None
+        return (
+            f"postgresql+asyncpg://"
+            f"{self.db_secret['username']}:{self.db_secret['password']}@"
+            f"{self.db_secret['read_host']}:{self.db_secret.get('read_port', self.db_secret['port'])}/"
+            f"{self.db_secret['dbname']}"
+        )
+
+    def _load_secret(self) -> None:
+        """Load database credentials from the secret cache.
+
+        The cache is consulted on every call, not only the first, so a
+        long-lived settings instance still picks up rotated credentials.
+        """
+        aws_settings = get_aws_settings()
+        self.db_secret = get_cached_secret(
+            aws_settings.database_secret_name,
+            aws_settings.SECRET_TTL_SECONDS
+        )
+
+
+@lru_cache
+def get_settings() -> DatabaseSettings:
+    """Get the database settings, loaded once per process."""
+    return DatabaseSettings()
+
+
+@lru_cache
+def get_aws_settings() -> AWSSettings:
+    """Get the AWS settings, loaded once per process."""
+    return AWSSettings()
+
+def create_engine(
+    settings: DatabaseSettings,
+    tunnel: Optional[SSHTunnelManager] = None,
+    url: Optional[str] = None,
+    request_timeout: bool = True
+):
+    """Create database engine with proper configurations.
+
+    ``request_timeout`` False leaves the connections without the request
+    deadline's statement_timeout, for work that is not serving a request.
+    """
+    engine = create_async_engine(
+        url or settings.database_url,
         echo=settings.local_settings.ECHO_SQL,
         future=True,
-        pool_size=5,
-        max_overflow=10,
-        pool_pre_ping=True,
-        pool_recycle=3600
+        execution_options={
+            "schema_translate_map": {None: settings.local_settings.DB_SCHEMA}
+        },
+        **_pool_options(settings.local_settings, request_timeout)
+    )
+    if tunnel is not None:
+        _install_tunnel_check(engine, tunnel)
+    if not settings.local_settings.USE_LOCAL_DB:
+        _install_credential_refresh(engine)
+    return engine
+
+
+def _pool_options(settings: DatabaseLocalSettings, request_timeout: bool = True) -> dict:
+    """Build pooling arguments for the selected DB_POOL_MODE.
+
+    - ``queue``: a pool of DB_POOL_SIZE connections plus DB_MAX_OVERFLOW,
+      for long-lived containers and local uvicorn.
+    - ``single``: one connection per engine kept open per process, with no
+      overflow, for Lambda. ``RequestSessions`` gives reads routed to the
+      primary the primary session, so a request only holds a second
+      connection when it reads from the replica, whose engine has its own.
+      A route must not also depend on ``get_session``, ``get_read_session``
+      or ``get_unit_of_work``; their second session would wait on the first
+      until DB_POOL_TIMEOUT.
+    - ``null``: no pooling in the process, for when RDS Proxy or pgbouncer
+      already pools connections.
+
+    With DB_TRANSACTION_POOLER enabled, asyncpg's prepared statement caches
+    are disabled and statements get unique names, since a transaction
+    pooler may run consecutive statements on different server connections.
+    Otherwise connections of request engines open with statement_timeout
+    set to the default request deadline; see ``_statement_timeout_ms``.
+    """
+    if settings.DB_POOL_MODE == "null":
+        options = {"poolclass": NullPool}
+    else:
+        single = settings.DB_POOL_MODE == "single"
+        options = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": 1 if single else settings.DB_POOL_SIZE,
+            "max_overflow": 0 if single else settings.DB_MAX_OVERFLOW,
+            "pool_pre_ping": True,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_timeout": settings.DB_POOL_TIMEOUT
+        }
+
+    if settings.DB_TRANSACTION_POOLER:
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"
+        }
+    elif request_timeout and _statement_timeout_ms(settings):
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(_statement_timeout_ms(settings))}
+        }
+    return options
+
+
+def _statement_timeout_ms(settings: DatabaseLocalSettings) -> Optional[int]:
+    """statement_timeout new connections open with, if the engine sets one.
+
+    Set to DB_REQUEST_DEADLINE_SECONDS in the startup packet, so requests on
+    the default deadline need no SET LOCAL of their own. Behind a
+    transaction pooler session settings would leak to other clients, so
+    none is set and every transaction sets its own.
+    """
+    if settings.DB_TRANSACTION_POOLER or settings.DB_REQUEST_DEADLINE_SECONDS <= 0:
+        return None
+    return int(settings.DB_REQUEST_DEADLINE_SECONDS * 1000)
+
+
+def _install_tunnel_check(engine: AsyncEngine, tunnel: SSHTunnelManager) -> None:
+    """Make sure the SSH tunnel is up before each new database connection."""
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def ensure_tunnel(dialect, conn_rec, cargs, cparams):
+        tunnel.ensure_running()
+
+
+def _install_credential_refresh(engine: AsyncEngine) -> None:
+    """Connect with the current secret and recover from rotated credentials.
+
+    Every new connection takes its credentials from the secret cache. When
+    the database rejects them, the secret is fetched again once and the pool
+    is marked for a rebuild so connections opened with the old credentials
+    are dropped on the next request.
+    """
+    aws_settings = get_aws_settings()
+
+    def _apply_secret(cparams: dict, secret: dict) -> None:
+        cparams['user'] = secret['username']
+        cparams['password'] = secret['password']
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def connect_with_current_secret(dialect, conn_rec, cargs, cparams):
+        global _credentials_rotated
+
+        _apply_secret(cparams, get_cached_secret(
+            aws_settings.database_secret_name,
+            aws_settings.SECRET_TTL_SECONDS
+        ))
+        try:
+            return dialect.connect(*cargs, **cparams)
+        except InvalidAuthorizationSpecificationError:
+            logger.warning("Database rejected cached credentials, refreshing secret")
+            _apply_secret(cparams, get_cached_secret(
+                aws_settings.database_secret_name,
+                aws_settings.SECRET_TTL_SECONDS,
+                force_refresh=True
+            ))
+            connection = dialect.connect(*cargs, **cparams)
+            _credentials_rotated = True
+            return connection
+
+
+# Process-wide engine state. It is created lazily on first use and survives
+# warm Lambda invocations, so the connection pool is reused across requests.
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[sessionmaker] = None
+_tunnel: Optional[SSHTunnelManager] = None
+_credentials_rotated = False
+_read_engine: Optional[AsyncEngine] = None
+_read_session_factory: Optional[sessionmaker] = None
+_read_your_writes_seconds = 0.0
+
+# Session.info keys marking a request-scoped unit of work and whether it has
+# flushed writes that still need a commit.
+UNIT_OF_WORK = "unit_of_work"
+_PENDING_WRITES = "unit_of_work_pending_writes"
+
+
+class _DatabaseSession(Session):
+    """Session whose transactions are bounded by the request deadline."""
+
+
+deadline.install(_DatabaseSession)
+
+
+class _PrimarySession(_DatabaseSession):
+    """Session bound to the primary database."""
+
+
+class CallerWrites:
+    """When the caller of the current request last committed on the primary.
+
+    The time is wall-clock seconds, so it can travel with the caller to
+    another process or Lambda container and still be compared there.
+    """
+
+    def __init__(self, last_write_at: Optional[float] = None):
+        self.last_write_at = last_write_at
+        self.wrote = False
+
+
+_caller_writes: ContextVar[Optional[CallerWrites]] = ContextVar("caller_writes", default=None)
+
+
+def track_caller_writes(last_write_at: Optional[float] = None) -> CallerWrites:
+    """Scope read-your-writes to the caller of the current request.
+
+    Args:
+        last_write_at: Time of the caller's last write, as they sent it back
+
+    Returns:
+        CallerWrites: Updated when the request commits, for the response
+            to hand the new time back to the caller
+    """
+    writes = CallerWrites(last_write_at)
+    _caller_writes.set(writes)
+    return writes
+
+
+def read_your_writes_seconds() -> float:
+    """How long after a caller's write their reads stay on the primary."""
+    return _read_your_writes_seconds
+
+
+@event.listens_for(_PrimarySession, "after_commit")
+def _record_write(session) -> None:
+    """Remember when the caller last committed, for read-your-writes."""
+    writes = _caller_writes.get()
+    if writes is not None:
+        writes.last_write_at = time.time()
+        writes.wrote = True
+
+
+def _create_tunnel(settings: DatabaseLocalSettings) -> SSHTunnelManager:
+    """Create the SSH tunnel used to reach the database through a bastion host."""
+    return SSHTunnelManager(
+        ssh_host=settings.SSH_HOST,
+        ssh_port=settings.SSH_PORT or 22,
+        ssh_username=settings.SSH_USERNAME,
+        ssh_pkey=settings.SSH_PKEY,
+        remote_host=settings.DB_HOST,
+        remote_port=settings.DB_PORT,
+        local_port=settings.DB_PORT,
+        keepalive_seconds=settings.SSH_KEEPALIVE_SECONDS
     )
 
+
+def get_engine() -> AsyncEngine:
+    """Get the process-wide database engine, creating it on first use."""
+    global _engine, _session_factory, _tunnel
+    global _read_engine, _read_session_factory, _read_your_writes_seconds
+
+    if _engine is None:
+        settings = get_settings()
+        if settings.local_settings.SSH_HOST:
+            _tunnel = _create_tunnel(settings.local_settings)
+            _tunnel.start()
+        _engine = create_engine(settings, _tunnel)
+        _session_factory = sessionmaker(
+            _engine,
+            class_=AsyncSession,
+            sync_session_class=_PrimarySession,
+            expire_on_commit=False,
+            autoflush=False
+        )
+        telemetry.instrument_engine(
+            "primary", _engine, settings.local_settings.DB_SLOW_STATEMENT_MS)
+        deadline.instrument_engine(_engine, _statement_timeout_ms(settings.local_settings))
+
+        read_url = settings.read_database_url
+        if read_url:
+            _read_engine = create_engine(settings, url=read_url)
+            _read_session_factory = sessionmaker(
+                _read_engine,
+                class_=AsyncSession,
+                sync_session_class=_DatabaseSession,
+                expire_on_commit=False,
+                autoflush=False
+            )
+            telemetry.instrument_engine(
+                "replica", _read_engine, settings.local_settings.DB_SLOW_STATEMENT_MS)
+            deadline.instrument_engine(
+                _read_engine, _statement_timeout_ms(settings.local_settings))
+        _read_your_writes_seconds = settings.local_settings.READ_YOUR_WRITES_SECONDS
+    return _engine
+
+
+def create_maintenance_engine() -> AsyncEngine:
+    """Create an engine for work outside requests, such as migrations.
+
+    Its connections open without the request deadline's statement_timeout,
+    so index builds and backfills on large tables are not cancelled halfway.
+    It goes through the process's SSH tunnel, which ``dispose_engine`` stops;
+    dispose the engine itself before that.
+    """
+    global _tunnel
+
+    settings = get_settings()
+    if settings.local_settings.SSH_HOST and _tunnel is None:
+        _tunnel = _create_tunnel(settings.local_settings)
+        _tunnel.start()
+    return create_engine(settings, _tunnel, request_timeout=False)
+
+
+def get_session_factory() -> sessionmaker:
+    """Get the process-wide session factory bound to the shared engine."""
+    get_engine()
+    return _session_factory
+
+
+def get_read_session_factory() -> sessionmaker:
+    """Get the session factory for reads.
+
+    Reads go to the replica when one is configured. They fall back to the
+    primary when there is no replica, or while the read-your-writes window
+    (READ_YOUR_WRITES_SECONDS) after the caller's own last commit is still
+    open; other callers keep reading from the replica.
+    """
+    get_engine()
+    if _read_session_factory is None:
+        return _session_factory
+    writes = _caller_writes.get()
+    if (
+        writes is not None and writes.last_write_at is not None
+        and time.time() - writes.last_write_at < _read_your_writes_seconds
+    ):
+        return _session_factory
+    return _read_session_factory
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections and forget the shared engine.
+
+    Intended for application shutdown and tests; the next call to
+    ``get_engine`` builds a fresh engine.
+    """
+    global _engine, _session_factory, _tunnel, _credentials_rotated
+    global _read_engine, _read_session_factory
+
+    if _engine is not None:
+        await _engine.dispose()
+    if _read_engine is not None:
+        await _read_engine.dispose()
+    if _tunnel is not None:
+        _tunnel.stop()
+    telemetry.forget_engines()
+    _engine = None
+    _session_factory = None
+    _read_engine = None
+    _read_session_factory = None
+    _tunnel = None
+    _credentials_rotated = False
+
+
+async def _rebuild_pools_if_rotated() -> None:
+    """Drop pooled connections opened with credentials that were rotated."""
+    global _credentials_rotated
+
+    if _credentials_rotated:
+        _credentials_rotated = False
+        await get_engine().dispose()
+        if _read_engine is not None:
+            await _read_engine.dispose()
+
+
+def _start_request_deadline() -> None:
+    """Bound the request's database work by DB_REQUEST_DEADLINE_SECONDS.
+
+    Routes can set a tighter budget with ``Depends(deadline.deadline(...))``.
+    """
+    seconds = get_settings().local_settings.DB_REQUEST_DEADLINE_SECONDS
+    if seconds > 0:
+        deadline.start_deadline(seconds)
+
+
 async def get_session() -> AsyncSession:
     """Get database session."""
-    settings = DatabaseSettings()
-
-    if settings.local_settings.SSH_HOST:
-        # Create SSH tunnel
-        tunnel = SSHTunnelForwarder(
-        (os.getenv('SSH_HOST'), int(os.getenv('SSH_PORT', 22))),
-        ssh_username=os.getenv('SSH_USERNAME'),
-        ssh_pkey=os.getenv('SSH_PKEY'),
-        remote_bind_address=(os.getenv('DB_HOST'), int(os.getenv('DB_PORT', 5432))),
-        local_bind_address=('localhost', int(os.getenv('DB_PORT', 5432)))
-    )
-    
-    # Iniciar el túnel
-    tunnel.start()
-
-    # Update database connection to use tunnel
-    engine = create_engine(settings)
-    async_session = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False
-    )
+    await _rebuild_pools_if_rotated()
+    _start_request_deadline()
 
-    async with async_session() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
         finally:
             await session.close()
-            if settings.local_settings.SSH_HOST:
-                tunnel.stop()
-    
 
-metadata = MetaData(schema=DatabaseSettings().local_settings.DB_SCHEMA)
+
+async def get_read_session() -> AsyncSession:
+    """Get database session for read-only work, routed to the replica."""
+    await _rebuild_pools_if_rotated()
+    _start_request_deadline()
+
+    async with get_read_session_factory()() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+class RequestSessions:
+    """Primary and read sessions of a request, each opened on first use.
+
+    An endpoint only opens the session it works with. When reads are routed
+    to the primary, they share the primary session, so a request never
+    holds two connections from the same pool.
+    """
+
+    def __init__(self):
+        self._primary: Optional[AsyncSession] = None
+        self._read: Optional[AsyncSession] = None
+
+    @property
+    def primary(self) -> AsyncSession:
+        """Session bound to the primary database."""
+        if self._primary is None:
+            self._primary = get_session_factory()()
+        return self._primary
+
+    @property
+    def read(self) -> AsyncSession:
+        """Session for read-only work, routed to the replica."""
+        if self._read is None:
+            factory = get_read_session_factory()
+            self._read = self.primary if factory is _session_factory else factory()
+        return self._read
+
+    async def close(self) -> None:
+        """Close the sessions that were opened."""
+        for session in {self._primary, self._read} - {None}:
+            await session.close()
+
+
+async def get_sessions() -> RequestSessions:
+    """Get the request's sessions, opened only when a repository uses them."""
+    await _rebuild_pools_if_rotated()
+    _start_request_deadline()
+
+    sessions = RequestSessions()
+    try:
+        yield sessions
+    finally:
+        await sessions.close()
+
+
+async def get_unit_of_work() -> AsyncSession:
+    """Get a database session that commits once when the request finishes.
+
+    Repositories sharing this session only flush their writes; the request
+    commits them together when the route returns and rolls everything back
+    when it raises. Declare it with ``scope="function"`` so the commit runs
+    before the response is sent and a failed commit surfaces as an error.
+    """
+    await _rebuild_pools_if_rotated()
+    _start_request_deadline()
+
+    async with get_session_factory()() as session:
+        session.info[UNIT_OF_WORK] = True
+        try:
+            yield session
+            if session.info.get(_PENDING_WRITES):
+                await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def commit(session: AsyncSession) -> None:
+    """Commit the session, or only flush it inside a unit of work.
+
+    Args:
+        session: Session the repository writes through
+    """
+    if session.info.get(UNIT_OF_WORK):
+        await session.flush()
+        session.info[_PENDING_WRITES] = True
+    else:
+        await session.commit()
+
+
+async def rollback(session: AsyncSession) -> None:
+    """Roll back the session after a failed write, except inside a unit of work.
+
+    A unit of work rolls back as a whole when the error leaves the request;
+    rolling back here would also discard the writes other repositories
+    already flushed into it.
+
+    Args:
+        session: Session the repository writes through
+    """
+    if not session.info.get(UNIT_OF_WORK):
+        await session.rollback()
+
+
+# Tables are declared without a schema; the engine maps them to DB_SCHEMA
+# through its schema_translate_map.
+metadata = MetaData()
 Base = declarative_base(metadata=metadata)
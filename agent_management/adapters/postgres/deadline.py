@@ -0,0 +1,117 @@
+"""Per-request time budgets for database work."""
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+# SQLSTATE Postgres reports for a statement cancelled by statement_timeout.
+QUERY_CANCELED = "57014"
+
+# Connection record info key for the statement_timeout a connection opens with.
+STATEMENT_TIMEOUT_MS = "statement_timeout_ms"
+
+# Monotonic time by which the current request's database work must finish,
+# and the budget in milliseconds it was set from.
+_deadline_at: ContextVar[Optional[float]] = ContextVar("deadline_at", default=None)
+_budget_ms: ContextVar[Optional[int]] = ContextVar("budget_ms", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The request ran out of its database time budget."""
+
+
+def start_deadline(seconds: float) -> None:
+    """Give the current request ``seconds`` for its remaining database work.
+
+    A deadline already set for the request is only ever tightened.
+
+    Args:
+        seconds: Time budget from now
+    """
+    deadline_at = time.monotonic() + seconds
+    current = _deadline_at.get()
+    if current is None or deadline_at < current:
+        _deadline_at.set(deadline_at)
+        _budget_ms.set(int(seconds * 1000))
+
+
+def remaining_ms() -> Optional[int]:
+    """Milliseconds left before the current deadline, or None without one.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    deadline_at = _deadline_at.get()
+    if deadline_at is None:
+        return None
+    remaining = int((deadline_at - time.monotonic()) * 1000)
+    if remaining <= 0:
+        raise DeadlineExceeded("Database time budget exhausted")
+    return remaining
+
+
+def deadline(seconds: float) -> Callable:
+    """Build a route dependency that sets the request's database time budget.
+
+    Args:
+        seconds: Time budget for the route's database work
+
+    Returns:
+        Callable: Dependency for ``Depends`` or a router's ``dependencies``
+    """
+    async def set_deadline() -> None:
+        start_deadline(seconds)
+
+    return set_deadline
+
+
+def install(session_class: type[Session]) -> None:
+    """Apply the request deadline to every transaction of ``session_class``.
+
+    A budget tighter than the statement_timeout the connection opened with
+    starts each transaction with ``SET LOCAL statement_timeout`` set to the
+    time left, so Postgres cancels queries and lock waits that would overrun
+    it. SET LOCAL ends with the transaction, which keeps it safe behind
+    transaction poolers. Other requests rely on the connection's own
+    timeout and skip the extra round trip.
+    """
+    @event.listens_for(session_class, "after_begin")
+    def set_statement_timeout(session, transaction, connection):
+        timeout_ms = remaining_ms()
+        if timeout_ms is None:
+            return
+        default_ms = connection.info.get(STATEMENT_TIMEOUT_MS)
+        if default_ms and _budget_ms.get() >= default_ms:
+            return
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+
+
+def instrument_engine(engine: AsyncEngine, statement_timeout_ms: Optional[int] = None) -> None:
+    """Bound the statements of ``engine`` by the request deadline.
+
+    No statement is sent once the deadline has passed, and statements
+    cancelled by statement_timeout are reported as DeadlineExceeded.
+
+    Args:
+        engine: Engine to instrument
+        statement_timeout_ms: statement_timeout every new connection of the
+            engine opens with, when the engine sets one
+    """
+    if statement_timeout_ms:
+        @event.listens_for(engine.sync_engine, "connect")
+        def remember_statement_timeout(dbapi_connection, connection_record):
+            connection_record.info[STATEMENT_TIMEOUT_MS] = statement_timeout_ms
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def check_deadline(conn, cursor, statement, parameters, context, executemany):
+        remaining_ms()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def translate_cancel(context):
+        sqlstate = getattr(context.original_exception, "sqlstate", None)
+        if sqlstate == QUERY_CANCELED and _deadline_at.get() is not None:
+            return DeadlineExceeded("Database statement exceeded the request deadline")
+
@@ -0,0 +1,58 @@
+"""Sparse fieldsets: select only the columns a client asked for."""
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import inspect, lambda_stmt, select
+from sqlalchemy.engine import Result
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+Fields = Optional[Tuple[str, ...]]
+
+
+def selection(model: type, fields: Fields) -> List[Any]:
+    """What to pass to ``select()`` for ``fields`` of ``model``.
+
+    Without fields this is the entity itself. Otherwise it is the requested
+    columns, plus the primary key so pages and lookups keep working.
+
+    Args:
+        model: Mapped class to select from
+        fields: Column attribute names, or None for the whole entity
+    """
+    if not fields:
+        return [model]
+    primary_key = [c.key for c in inspect(model).primary_key]
+    names = primary_key + [name for name in fields if name not in primary_key]
+    return [getattr(model, name) for name in names]
+
+
+def select_fields(model: type, fields: Fields) -> StatementLambdaElement:
+    """Lambda statement selecting ``selection(model, fields)``.
+
+    The statement is cached per model and fieldset, like the repositories'
+    other lambda statements are cached per filter combination.
+    """
+    columns = selection(model, fields)
+    key = ",".join(fields) if fields else None
+    return lambda_stmt(lambda: select(*columns), track_on=[model, key])
+
+
+def fetch_all(result: Result, fields: Fields) -> Sequence[Any]:
+    """Entities, or rows when only some fields were selected."""
+    return result.all() if fields else result.scalars().all()
+
+
+def fetch_one(result: Result, fields: Fields) -> Optional[Any]:
+    """The single entity or row of ``result``, or None."""
+    return result.one_or_none() if fields else result.scalar_one_or_none()
+
+
+def to_response(response_cls: Type[BaseModel], row: Any, fields: Fields = None) -> BaseModel:
+    """Build a response model from an entity, or a partial one from a row.
+
+    Partial models hold only ``fields``; serializing them with
+    ``exclude_unset`` leaves the other fields out of the payload.
+    """
+    if fields:
+        return response_cls.model_construct(**{name: getattr(row, name) for name in fields})
+    return response_cls.model_validate(row, from_attributes=True)
@@ -0,0 +1,188 @@
+"""Online migration of the indexes declared on the models.
+
+``create_all`` only builds indexes together with new tables. ``migrate_indexes``
+first creates the migrated tables that do not exist yet. For tables that
+already hold data, it then builds every model index that is missing with
+CREATE INDEX CONCURRENTLY, so writes are not blocked while it runs, and
+drops the indexes the models no longer declare. ``migrate_catalog`` then
+fills the maturity question catalog from the questions already stored.
+
+Run it once per deployment with::
+
+    python -m adapters.postgres.migrations
+"""
+import asyncio
+import logging
+import re
+from typing import Collection, List, Optional
+
+from sqlalchemy import Table, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.schema import CreateIndex
+
+from adapters.postgres.catalog import backfill_catalog
+from adapters.postgres.config import create_maintenance_engine, dispose_engine, metadata
+from adapters.postgres.models.domain import Domain
+from adapters.postgres.models.domain_question import DomainQuestion
+from adapters.postgres.models.maturity_agent_response import MaturityAgentResponse
+from adapters.postgres.models.maturity_answer import MaturityAnswer
+from adapters.postgres.models.maturity_question import MaturityQuestion
+from adapters.postgres.models.maturity_question_catalog import MaturityQuestionCatalog
+from adapters.postgres.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Tables whose indexes are migrated.
+TABLES = (
+    MaturityQuestion.__table__,
+    MaturityQuestionCatalog.__table__,
+    MaturityAgentResponse.__table__,
+    MaturityAnswer.__table__,
+    DomainQuestion.__table__,
+    Domain.__table__,
+    User.__table__,
+)
+
+# Extensions the migrated indexes depend on, with the indexes needing them.
+# Servers that do not ship an extension go without its indexes.
+EXTENSIONS = {
+    'pg_trgm': ('idx_user_email_trgm',),
+}
+
+# Indexes replaced by composite ones, or left redundant by them.
+OBSOLETE_INDEXES = (
+    'idx_maturity_question_type',
+    'idx_maturity_category',
+    'idx_maturity_question_order',
+    'idx_maturity_question_axis_id',
+    'idx_maturity_question_industry_id',
+    'idx_maturity_agent_responses_agent_id',
+    'idx_maturity_agent_responses_question_id',
+    'idx_maturity_agent_responses_date',
+    'idx_maturity_answer_session_id',
+    'idx_maturity_answer_question_id',
+    'idx_maturity_answer_answered_at',
+    'idx_domain_question_domain_id',
+    'idx_domain_question_industry_id',
+    'idx_domain_question_type',
+    'idx_domain_question_category',
+    'idx_user_email',
+)
+
+
+def index_statements(
+    tables: Optional[List[Table]] = None,
+    unavailable: Collection[str] = ()
+) -> List[str]:
+    """DDL bringing the indexes of ``tables`` in line with the models.
+
+    Extensions come first, then new indexes, so every query keeps an index
+    to use while the old ones are dropped. Statements are idempotent, which
+    lets a migration interrupted halfway simply be run again.
+
+    Args:
+        tables: Tables to migrate; defaults to ``TABLES``
+        unavailable: Extensions the server does not ship; they and the
+            indexes needing them are skipped
+
+    Returns:
+        List[str]: Statements with the schema left as a placeholder the
+            engine's schema_translate_map fills in
+    """
+    skipped = {index for name in unavailable for index in EXTENSIONS.get(name, ())}
+    statements = [
+        f"CREATE EXTENSION IF NOT EXISTS {name}"
+        for name in EXTENSIONS if name not in unavailable
+    ]
+    for table in tables or TABLES:
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name in skipped:
+                continue
+            ddl = str(CreateIndex(index, if_not_exists=True).compile(
+                dialect=postgresql.dialect(),
+                schema_translate_map={None: None}
+            ))
+            statements.append(re.sub(r"^CREATE (UNIQUE )?INDEX", r"CREATE \1INDEX CONCURRENTLY", ddl))
+    statements.extend(
+        f"DROP INDEX CONCURRENTLY IF EXISTS __[SCHEMA__none].{name}"
+        for name in OBSOLETE_INDEXES
+    )
+    return statements
+
+
+async def migrate_indexes(engine: AsyncEngine) -> None:
+    """Apply ``index_statements`` to the database behind ``engine``.
+
+    Missing tables are created first, with their indexes; a new table is
+    empty, so building them there blocks nobody. CONCURRENTLY cannot run
+    inside a transaction block, so each statement
+    runs on its own in autocommit mode. A concurrent build that fails leaves
+    an INVALID index behind; it is dropped and rebuilt on the next run. The
+    unique index on lower(email) fails until emails differing only in case
+    are merged.
+    """
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.run_sync(metadata.create_all, tables=list(TABLES))
+        await _drop_invalid_indexes(connection)
+        result = await connection.execute(
+            text("SELECT name FROM pg_available_extensions WHERE name = ANY(:names)"),
+            {"names": list(EXTENSIONS)}
+        )
+        unavailable = set(EXTENSIONS) - set(result.scalars())
+        for name in unavailable:
+            logger.warning("Extension %s is not available; skipping its indexes", name)
+        for statement in index_statements(unavailable=unavailable):
+            logger.info("Running %s", statement)
+            await connection.execute(text(statement))
+
+
+async def _drop_invalid_indexes(connection) -> None:
+    # Only indexes the models declare are considered, in the schema the
+    # tables are mapped to.
+    names = [index.name for table in TABLES for index in table.indexes]
+    result = await connection.execute(text("""
+        SELECT i.relname
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE NOT x.indisvalid
+            AND i.relname = ANY(:names)
+            AND i.relnamespace = (
+                SELECT relnamespace FROM pg_class
+                WHERE oid = '__[SCHEMA__none].maturity_questions'::regclass
+            )
+    """), {"names": names})
+    for name in result.scalars():
+        logger.warning("Dropping invalid index %s", name)
+        await connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS __[SCHEMA__none]."{name}"'))
+
+
+async def migrate_catalog(engine: AsyncEngine) -> None:
+    """Backfill the maturity question catalog of the database behind ``engine``.
+
+    Reads fall back to aggregating the options live until this has run.
+    """
+    async with AsyncSession(engine) as session:
+        await backfill_catalog(session)
+        await session.commit()
+
+
+async def main() -> None:
+    """Migrate the indexes of the configured database and backfill the catalog.
+
+    Runs on an engine of its own, whose connections have no statement_timeout:
+    on large tables both steps take far longer than a request may.
+    """
+    engine = create_maintenance_engine()
+    try:
+        await migrate_indexes(engine)
+        await migrate_catalog(engine)
+    finally:
+        await engine.dispose()
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -27,4 +27,5 @@ class Domain(Base):
     # Indexes
     __table_args__ = (
         Index('idx_domain_name', domain_name),
+        Index('idx_domain_company_id_id', company_id, domain_id),
     )
@@ -24,10 +24,11 @@ class DomainQuestion(Base):
     # domain_agent_responses = relationship(
     #     "DomainAgentResponse", back_populates="domain_question", cascade="all, delete-orphan")
 
-    # Indexes
+    # Indexes. Lists filter on one column and page by primary key, so each
+    # filter column is indexed together with the key.
     __table_args__ = (
-        Index('idx_domain_question_domain_id', domain_id),
-        Index('idx_domain_question_industry_id', industry_id),
-        Index('idx_domain_question_type', question_type),
-        Index('idx_domain_question_category', category),
+        Index('idx_domain_question_domain_id_id', domain_id, domain_question_id),
+        Index('idx_domain_question_industry_id_id', industry_id, domain_question_id),
+        Index('idx_domain_question_type_id', question_type, domain_question_id),
+        Index('idx_domain_question_category_id', category, domain_question_id),
     )
@@ -26,9 +26,10 @@ class MaturityAgentResponse(Base):
     # maturity_question = relationship(
     #     "MaturityQuestion", back_populates="maturity_agent_responses")
 
-    # Indexes
+    # Indexes. The catalog refresh reads a question's responses in ID order;
+    # lists filter by agent and page by primary key.
     __table_args__ = (
-        Index('idx_maturity_agent_responses_agent_id', agent_id),
-        Index('idx_maturity_agent_responses_question_id', maturity_question_id),
-        Index('idx_maturity_agent_responses_date', response_date),
+        Index('idx_maturity_agent_responses_agent_id_id', agent_id, maturity_agent_response_id),
+        Index('idx_maturity_agent_responses_question_id_id',
+              maturity_question_id, maturity_agent_response_id),
     )
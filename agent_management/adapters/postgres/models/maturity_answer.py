@@ -24,11 +24,10 @@ class MaturityAnswer(Base):
     # session = relationship("Session", back_populates="maturity_answers")
     # maturity_question = relationship("MaturityQuestion", back_populates="maturity_answers")
 
-    # Constraints and Indexes
+    # Constraints and Indexes. The unique constraint also serves lookups by
+    # session, then question; lists by question page by primary key.
     __table_args__ = (
         UniqueConstraint('session_id', 'maturity_question_id',
                          name='uq_session_maturity_question'),
-        Index('idx_maturity_answer_session_id', session_id),
-        Index('idx_maturity_answer_question_id', maturity_question_id),
-        Index('idx_maturity_answer_answered_at', answered_at),
+        Index('idx_maturity_answer_question_id_id', maturity_question_id, maturity_answer_id),
     )
@@ -25,11 +25,11 @@ class MaturityQuestion(Base):
     # maturity_agent_responses = relationship(
     #     "MaturityAgentResponse", back_populates="maturity_question", cascade="all, delete-orphan")
 
-    # Indexes
+    # Indexes. Lists filter on one column and page by primary key, so each
+    # filter column is indexed together with the key.
     __table_args__ = (
-        Index('idx_maturity_question_type', question_type),
-        Index('idx_maturity_category', category),
-        Index('idx_maturity_question_order', question_order),
-        Index('idx_maturity_question_axis_id', axis_id),
-        Index('idx_maturity_question_industry_id', industry_id),
+        Index('idx_maturity_question_type_id', question_type, maturity_question_id),
+        Index('idx_maturity_question_category_id', category, maturity_question_id),
+        Index('idx_maturity_question_axis_id_id', axis_id, maturity_question_id),
+        Index('idx_maturity_question_industry_id_id', industry_id, maturity_question_id),
     )
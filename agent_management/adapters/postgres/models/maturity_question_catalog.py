@@ -0,0 +1,36 @@
+"""SQLAlchemy model for the maturity question catalog."""
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+
+from adapters.postgres.config import Base
+
+
+class MaturityQuestionCatalog(Base):
+    """Maturity questions with their options already aggregated.
+
+    One row per question that has agent responses, read when a chat survey
+    starts. The maturity question and agent response repositories refresh
+    the rows of the questions they write; see ``adapters.postgres.catalog``.
+    """
+    __tablename__ = 'maturity_question_catalog'
+
+    maturity_question_id = Column(
+        Integer,
+        ForeignKey('maturity_questions.maturity_question_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    question_text = Column(Text, nullable=False)
+    question_type = Column(String(20), nullable=False)
+    question_order = Column(Integer, nullable=True)
+    category = Column(String(100), nullable=True)
+    axis_id = Column(Integer, nullable=True)
+    industry_id = Column(Integer, nullable=True)
+    ambitus_id = Column(Integer, nullable=True)
+    options = Column(JSONB, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_maturity_question_catalog_axis_order', axis_id, ambitus_id, question_order),
+        Index('idx_maturity_question_catalog_industry_order',
+              industry_id, ambitus_id, question_order),
+    )
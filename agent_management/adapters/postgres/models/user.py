@@ -1,12 +1,19 @@
 """SQLAlchemy model for users."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy import DDL, Column, Integer, String, DateTime, ForeignKey, Index, event, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from adapters.postgres.config import Base
 
 
+def _trigram_available(ddl, target, bind, **kw) -> bool:
+    """Whether the server ships pg_trgm, which the email search index needs."""
+    return bind.dialect.name == 'postgresql' and bind.scalar(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+    ))
+
+
 class User(Base):
     """User database model."""
     __tablename__ = 'users'
@@ -28,9 +35,24 @@ class User(Base):
     # )
     # company = relationship("Company", back_populates="projects")
 
-    # Indexes for frequent queries
+    # Indexes for frequent queries. Emails are looked up case-insensitively,
+    # so they are unique on lower(email). The trigram index serves email
+    # search and is skipped on servers without pg_trgm, where search scans.
     __table_args__ = (
-        Index('idx_user_email', email),
+        Index('uq_user_email_lower', func.lower(email), unique=True),
+        Index(
+            'idx_user_email_trgm', email,
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'}
+        ).ddl_if(callable_=_trigram_available),
         Index('idx_user_role', role_id),
         Index('idx_user_company', company_id),
     )
+
+
+# The trigram operator class comes from pg_trgm, installed with the table.
+event.listen(
+    User.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(callable_=_trigram_available)
+)
@@ -0,0 +1,140 @@
+"""Keyset pagination for repository list queries."""
+import base64
+import binascii
+import json
+from functools import lru_cache
+from typing import Any, List, Literal, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+# Largest page a client may request.
+MAX_PAGE_SIZE = 500
+
+# How a list total is computed: ``exact`` runs count(*), ``estimated`` reads
+# the planner's row count for the table, ``none`` skips the total.
+Count = Literal["exact", "estimated", "none"]
+
+# Below this many rows an estimated total is counted exactly instead; the
+# scan is cheap and the estimate of a small or fresh table is unreliable.
+ESTIMATE_THRESHOLD = 10_000
+
+TABLE_ESTIMATE_SQL = """
+    SELECT reltuples::bigint FROM pg_class
+    WHERE oid = '__[SCHEMA__none].{table}'::regclass
+"""
+
+
+def encode_cursor(key: int) -> str:
+    """Encode the key of the last row of a page as an opaque cursor."""
+    payload = json.dumps({"k": key}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode a cursor built by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor was not issued by this API
+    """
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded))["k"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, int) or isinstance(key, bool):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def keyset(
+    stmt: StatementLambdaElement,
+    key: Any,
+    limit: Optional[int],
+    after: Optional[int]
+) -> StatementLambdaElement:
+    """Restrict a list query to the page following ``after``.
+
+    Rows are ordered by ``key`` and one extra row is fetched so ``page``
+    can tell whether another page follows. Without ``limit`` or ``after``
+    the statement is returned unchanged.
+
+    Args:
+        stmt: Lambda statement selecting the rows to list
+        key: Unique, indexed column the pages are ordered by
+        limit: Maximum number of rows in the page
+        after: Key of the last row of the previous page
+    """
+    if limit is None and after is None:
+        return stmt
+    if after is not None:
+        stmt += lambda s: s.where(key > after)
+    stmt += lambda s: s.order_by(key)
+    if limit is not None:
+        fetch = limit + 1
+        stmt += lambda s: s.limit(fetch)
+    return stmt
+
+
+def page(rows: List[Any], key: str, limit: Optional[int]) -> Tuple[List[Any], Optional[str]]:
+    """Split the rows fetched by a ``keyset`` query into a page and its cursor.
+
+    Args:
+        rows: Rows returned by the query
+        key: Attribute name of the key column
+        limit: Page size the query was built with
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The page and the cursor of the next
+        page, or None on the last page
+    """
+    if limit is None or len(rows) <= limit:
+        return list(rows), None
+    rows = rows[:limit]
+    return rows, encode_cursor(getattr(rows[-1], key))
+
+
+@lru_cache(maxsize=32)
+def _table_estimate_query(table: str) -> TextClause:
+    """Build the row estimate query once per table."""
+    return text(TABLE_ESTIMATE_SQL.format(table=table))
+
+
+async def count_rows(
+    session: AsyncSession,
+    stmt: StatementLambdaElement,
+    table: str,
+    count: Count,
+    filtered: bool
+) -> Optional[int]:
+    """Total number of rows a list query matches.
+
+    ``estimated`` totals of unfiltered lists come from ``pg_class.reltuples``,
+    which ANALYZE and autovacuum keep current, so large tables are not
+    scanned. Filtered lists, small tables and tables never analyzed are
+    counted exactly.
+
+    Args:
+        session: Session to run the count on
+        stmt: Lambda statement of the list, before ``keyset`` is applied
+        table: Name of the table listed
+        count: How to compute the total
+        filtered: Whether ``stmt`` has filters
+
+    Returns:
+        Optional[int]: The total, or None when ``count`` is ``none``
+    """
+    if count == "none":
+        return None
+    if count == "estimated" and not filtered:
+        result = await session.execute(_table_estimate_query(table))
+        estimate = result.scalar_one()
+        if estimate >= ESTIMATE_THRESHOLD:
+            return estimate
+    stmt += lambda s: s.with_only_columns(func.count(), maintain_column_froms=True)
+    result = await session.execute(stmt)
+    return result.scalar_one()
@@ -1,10 +1,14 @@
 """Repository implementation for agent operations."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.agent_command import CreateAgent, UpdateAgent, GetAgent, AgentResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.agent import Agent
 
 
@@ -17,56 +21,59 @@ class AgentRepository:
 
     async def create(self, command: CreateAgent) -> int:
         """Create a new agent."""
-        agent = Agent(
-            agent_name=command.agent_name,
-            agent_role=command.agent_role,
-            agent_type=command.agent_type
+        stmt = (
+            insert(Agent)
+            .values(
+                agent_name=command.agent_name,
+                agent_role=command.agent_role,
+                agent_type=command.agent_type
+            )
+            .returning(Agent.agent_id)
         )
-        self.session.add(agent)
         try:
-            await self.session.commit()
-            await self.session.refresh(agent)
-            return agent.agent_id
+            result = await self.session.execute(stmt)
+            agent_id = result.scalar_one()
+            await commit(self.session)
+            return agent_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Agent name already exists")
 
     async def update(self, command: UpdateAgent) -> bool:
         """Update an existing agent."""
-        stmt = select(Agent).where(Agent.agent_id == command.agent_id)
-        result = await self.session.execute(stmt)
-        agent = result.scalar_one_or_none()
-
-        if not agent:
-            return False
-
-        agent.agent_name = command.agent_name
-        agent.agent_role = command.agent_role
-        agent.agent_type = command.agent_type
+        stmt = (
+            update(Agent)
+            .where(Agent.agent_id == command.agent_id)
+            .values(
+                agent_name=command.agent_name,
+                agent_role=command.agent_role,
+                agent_type=command.agent_type
+            )
+            .returning(Agent.agent_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Agent name already exists")
 
     async def delete(self, agent_id: int) -> bool:
         """Delete an agent."""
-        stmt = select(Agent).where(Agent.agent_id == agent_id)
+        stmt = delete(Agent).where(Agent.agent_id == agent_id).returning(Agent.agent_id)
         result = await self.session.execute(stmt)
-        agent = result.scalar_one_or_none()
-
-        if not agent:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(agent)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetAgent) -> Optional[AgentResponse]:
         """Get an agent by ID or name."""
-        stmt = select(Agent)
+        stmt = select(*selection(Agent, command.fields))
         if command.agent_id:
             stmt = stmt.where(Agent.agent_id == command.agent_id)
         elif command.agent_name:
@@ -77,12 +84,40 @@ class AgentRepository:
             return None
 
         result = await self.session.execute(stmt)
-        agent = result.scalar_one_or_none()
-        return AgentResponse.model_validate(agent) if agent else None
+        agent = fetch_one(result, command.fields)
+        return to_response(AgentResponse, agent, command.fields) if agent else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[AgentResponse], List[int]]:
+        """Get agents by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the agents
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[AgentResponse], List[int]]: Agents found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Agent, ids, fields))
+        agents, missing = in_order(fetch_all(result, fields), "agent_id", ids)
+        return [to_response(AgentResponse, agent, fields) for agent in agents], missing
 
-    async def list_all(self) -> List[AgentResponse]:
-        """List all agents."""
-        stmt = select(Agent)
+    async def list_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[AgentResponse], Optional[str], Optional[int]]:
+        """List agents, one page at a time when ``limit`` is given."""
+        stmt = select_fields(Agent, fields)
+        total = await count_rows(
+            self.session, stmt, Agent.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, Agent.agent_id, limit, after)
         result = await self.session.execute(stmt)
-        agents = result.scalars().all()
-        return [AgentResponse.model_validate(agent) for agent in agents]
+        agents, next_cursor = page(fetch_all(result, fields), "agent_id", limit)
+        return [to_response(AgentResponse, agent, fields) for agent in agents], next_cursor, total
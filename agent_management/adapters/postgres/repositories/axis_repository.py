@@ -1,9 +1,13 @@
 """PostgreSQL repository implementation for axis."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.axis import Axis
 from domain.command.axis_command import (
     CreateAxis,
@@ -31,15 +35,20 @@ class AxisRepository:
         Raises:
             ValueError: If axis name already exists
         """
-        axis = Axis(
-            axis_name=command.axis_name        )
-        self.session.add(axis)
+        stmt = (
+            insert(Axis)
+            .values(
+                axis_name=command.axis_name
+            )
+            .returning(Axis.axis_id)
+        )
         try:
-            await self.session.commit()
-            await self.session.refresh(axis)
-            return axis.axis_id
+            result = await self.session.execute(stmt)
+            axis_id = result.scalar_one()
+            await commit(self.session)
+            return axis_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Axis name already exists")
 
     async def update(self, command: UpdateAxis) -> bool:
@@ -54,21 +63,30 @@ class AxisRepository:
         Raises:
             ValueError: If axis name already exists
         """
-        stmt = select(Axis).where(Axis.axis_id == command.axis_id)
-        result = await self.session.execute(stmt)
-        axis = result.scalar_one_or_none()
+        values = {}
+        if command.axis_name is not None:
+            values["axis_name"] = command.axis_name
 
-        if not axis:
-            return False
+        if not values:
+            stmt = select(Axis.axis_id).where(Axis.axis_id == command.axis_id)
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none() is not None
 
-        if command.axis_name is not None:
-            axis.axis_name = command.axis_name
+        stmt = (
+            update(Axis)
+            .where(Axis.axis_id == command.axis_id)
+            .values(**values)
+            .returning(Axis.axis_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Axis name already exists")
 
     async def delete(self, axis_id: int) -> bool:
@@ -80,32 +98,35 @@ class AxisRepository:
         Returns:
             bool: True if deletion was successful
         """
-        stmt = select(Axis).where(Axis.axis_id == axis_id)
+        stmt = delete(Axis).where(Axis.axis_id == axis_id).returning(Axis.axis_id)
         result = await self.session.execute(stmt)
-        axis = result.scalar_one_or_none()
-
-        if not axis:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(axis)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
-    async def get_by_id(self, axis_id: int) -> Optional[AxisResponse]:
+    async def get_by_id(
+        self,
+        axis_id: int,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[AxisResponse]:
         """Get an axis by ID.
         
         Args:
             axis_id: ID of the axis to get
+            fields: Optional columns to return
             
         Returns:
             Optional[AxisResponse]: Axis data if found, None otherwise
         """
-        stmt = select(Axis).where(Axis.axis_id == axis_id)
+        stmt = select(*selection(Axis, fields)).where(Axis.axis_id == axis_id)
         result = await self.session.execute(stmt)
-        axis = result.scalar_one_or_none()
+        axis = fetch_one(result, fields)
         
         if not axis:
             return None
+        if fields:
+            return to_response(AxisResponse, axis, fields)
             
         return AxisResponse(
             axis_id=axis.axis_id,
@@ -133,15 +154,53 @@ class AxisRepository:
             axis_name=axis.axis_name
         )
 
-    async def get_all(self) -> List[AxisResponse]:
-        """Get all axes.
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[AxisResponse], List[int]]:
+        """Get axes by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the axes
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[AxisResponse], List[int]]: Axes found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Axis, ids, fields))
+        axes, missing = in_order(fetch_all(result, fields), "axis_id", ids)
+        return [to_response(AxisResponse, axis, fields) for axis in axes], missing
+
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[AxisResponse], Optional[str], Optional[int]]:
+        """Get all axes, one page at a time when ``limit`` is given.
         
+        Args:
+            limit: Optional page size
+            after: Optional key of the last axis of the previous page
+            fields: Optional columns to return
+            count: How to compute the total
+            
         Returns:
-            List[AxisResponse]: List of all axes
+            Tuple[List[AxisResponse], Optional[str], Optional[int]]: Page of axes and the
+            cursor of the next page and the total, if requested
         """
-        stmt = select(Axis)
+        stmt = select_fields(Axis, fields)
+        total = await count_rows(
+            self.session, stmt, Axis.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, Axis.axis_id, limit, after)
         result = await self.session.execute(stmt)
-        axes = result.scalars().all()
+        axes, next_cursor = page(fetch_all(result, fields), "axis_id", limit)
+
+        if fields:
+            return [to_response(AxisResponse, axis, fields) for axis in axes], next_cursor, total
         
         return [
             AxisResponse(
@@ -149,4 +208,4 @@ class AxisRepository:
                 axis_name=axis.axis_name
             )
             for axis in axes
-        ]
+        ], next_cursor, total
@@ -1,18 +1,77 @@
 """PostgreSQL repository implementation for companies."""
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import JSON, select, update, delete, insert, text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.elements import TextClause
 
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.company import Company
 from domain.command.company_command import (
     CreateCompany,
     UpdateCompany,
     GetCompany,
     CompanyResponse,
-    ListCompanies
+    CompanyTree,
+    ListCompanies,
+    MAX_TREE_DEPTH
 )
 
+# Builds a company and the levels below it as one JSON document. Each level
+# is a correlated subquery aggregating the rows of its parent, so the whole
+# tree is read in one round trip without multiplying rows across joins.
+COMPANY_TREE_SQL = """
+    SELECT json_build_object(
+        'company_id', c.company_id,
+        'company_name', c.company_name,
+        'industry_id', c.industry_id{children}
+    ) AS tree
+    FROM __[SCHEMA__none].companies c
+    WHERE c.company_id = :company_id
+"""
+
+DOMAINS_SQL = """,
+        'domains', (
+            SELECT coalesce(json_agg(json_build_object(
+                'domain_id', d.domain_id,
+                'domain_name', d.domain_name{children}
+            ) ORDER BY d.domain_id), '[]')
+            FROM __[SCHEMA__none].domains d
+            WHERE d.company_id = c.company_id
+        ),
+        'projects', (
+            SELECT coalesce(json_agg(json_build_object(
+                'project_id', p.project_id,
+                'project_name', p.project_name,
+                'description', p.description
+            ) ORDER BY p.project_id), '[]')
+            FROM __[SCHEMA__none].projects p
+            WHERE p.company_id = c.company_id
+        )"""
+
+SUBDOMAINS_SQL = """,
+                'subdomains', (
+                    SELECT coalesce(json_agg(json_build_object(
+                        'subdomain_id', s.subdomain_id,
+                        'subdomain_name', s.subdomain_name
+                    ) ORDER BY s.subdomain_id), '[]')
+                    FROM __[SCHEMA__none].subdomains s
+                    WHERE s.domain_id = d.domain_id
+                )"""
+
+
+@lru_cache(maxsize=MAX_TREE_DEPTH + 1)
+def _company_tree_query(depth: int) -> TextClause:
+    """Build the tree statement for ``depth`` levels below the company."""
+    children = ""
+    if depth >= 1:
+        children = DOMAINS_SQL.format(children=SUBDOMAINS_SQL if depth >= 2 else "")
+    return text(COMPANY_TREE_SQL.format(children=children)).columns(tree=JSON)
+
 
 class CompanyRepository:
     """Repository for company operations."""
@@ -23,55 +82,66 @@ class CompanyRepository:
 
     async def create(self, command: CreateCompany) -> int:
         """Create a new company."""
-        company = Company(
-            company_name=command.company_name,
-            industry_id=command.industry_id
+        stmt = (
+            insert(Company)
+            .values(
+                company_name=command.company_name,
+                industry_id=command.industry_id
+            )
+            .returning(Company.company_id)
         )
-        self._session.add(company)
         try:
-            await self._session.commit()
-            await self._session.refresh(company)
-            return company.company_id
+            result = await self._session.execute(stmt)
+            company_id = result.scalar_one()
+            await commit(self._session)
+            return company_id
         except IntegrityError:
-            await self._session.rollback()
+            await rollback(self._session)
             raise ValueError("Company name already exists or invalid industry ID")
 
     async def update(self, command: UpdateCompany) -> bool:
         """Update an existing company."""
-        stmt = select(Company).where(Company.company_id == command.company_id)
-        result = await self._session.execute(stmt)
-        company = result.scalar_one_or_none()
-
-        if not company:
-            return False
-
+        values = {}
         if command.company_name is not None:
-            company.company_name = command.company_name
+            values["company_name"] = command.company_name
         if command.industry_id is not None:
-            company.industry_id = command.industry_id
+            values["industry_id"] = command.industry_id
+
+        if not values:
+            stmt = select(Company.company_id).where(Company.company_id == command.company_id)
+            result = await self._session.execute(stmt)
+            return result.scalar_one_or_none() is not None
+
+        stmt = (
+            update(Company)
+            .where(Company.company_id == command.company_id)
+            .values(**values)
+            .returning(Company.company_id)
+        )
 
         try:
-            await self._session.commit()
+            result = await self._session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self._session)
             return True
         except IntegrityError:
-            await self._session.rollback()
+            await rollback(self._session)
             raise ValueError("Company name already exists or invalid industry ID")
 
     async def delete(self, company_id: int) -> bool:
         """Delete a company."""
-        stmt = select(Company).where(Company.company_id == company_id)
+        stmt = delete(Company).where(Company.company_id == company_id).returning(Company.company_id)
         result = await self._session.execute(stmt)
-        company = result.scalar_one_or_none()
 
-        if company:
-            await self._session.delete(company)
-            await self._session.commit()
+        if result.scalar_one_or_none() is not None:
+            await commit(self._session)
             return True
         return False
 
     async def get(self, command: GetCompany) -> Optional[CompanyResponse]:
         """Get a company by ID or name."""
-        stmt = select(Company)
+        stmt = select(*selection(Company, command.fields))
         if command.company_id:
             stmt = stmt.where(Company.company_id == command.company_id)
         elif command.company_name:
@@ -80,24 +150,75 @@ class CompanyRepository:
             return None
 
         result = await self._session.execute(stmt)
-        company = result.scalar_one_or_none()
+        company = fetch_one(result, command.fields)
 
         if not company:
             return None
 
+        if command.fields:
+            return to_response(CompanyResponse, company, command.fields)
+
         return CompanyResponse(
             company_id=company.company_id,
             company_name=company.company_name,
             industry_id=company.industry_id
         )
 
-    async def list_all(self) -> ListCompanies:
-        """List all companies."""
-        stmt = select(Company)
+    async def get_tree(self, company_id: int, depth: int = MAX_TREE_DEPTH) -> Optional[CompanyTree]:
+        """Get a company with its domains, subdomains and projects in one query.
+
+        Args:
+            company_id: ID of the company
+            depth: Levels below the company to include; 1 adds the domains
+                and projects, 2 the subdomains of each domain
+
+        Returns:
+            Optional[CompanyTree]: The tree, or None if the company does not exist
+        """
+        result = await self._session.execute(_company_tree_query(depth), {"company_id": company_id})
+        tree = result.scalar_one_or_none()
+        return CompanyTree.model_validate(tree) if tree else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[CompanyResponse], List[int]]:
+        """Get companies by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the companies
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[CompanyResponse], List[int]]: Companies found
+            and the IDs that matched none
+        """
+        result = await self._session.execute(select_many(Company, ids, fields))
+        companies, missing = in_order(fetch_all(result, fields), "company_id", ids)
+        return [to_response(CompanyResponse, company, fields) for company in companies], missing
+
+    async def list_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> ListCompanies:
+        """List companies, one page at a time when ``limit`` is given."""
+        stmt = select_fields(Company, fields)
+        total = await count_rows(
+            self._session, stmt, Company.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, Company.company_id, limit, after)
         result = await self._session.execute(stmt)
-        companies = result.scalars().all()
+        companies, next_cursor = page(fetch_all(result, fields), "company_id", limit)
+
+        if fields:
+            return ListCompanies(next_cursor=next_cursor, total=total, companies=[
+                to_response(CompanyResponse, c, fields) for c in companies
+            ])
 
-        return ListCompanies(companies=[
+        return ListCompanies(next_cursor=next_cursor, total=total, companies=[
             CompanyResponse(
                 company_id=c.company_id,
                 company_name=c.company_name,
@@ -1,6 +1,6 @@
 """Repository implementation for domain agent response operations."""
-from typing import Optional, List
-from sqlalchemy import select, and_
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -10,6 +10,10 @@ from domain.command.domain_agent_response_command import (
     GetDomainAgentResponse,
     DomainAgentResponseData
 )
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.domain_agent_response import DomainAgentResponse
 
 
@@ -33,18 +37,22 @@ class DomainAgentResponseRepository:
             ValueError: If invalid agent or domain question reference
         """
         try:
-            response = DomainAgentResponse(
-                agent_id=command.agent_id,
-                domain_question_id=command.domain_question_id,
-                response_text=command.response_text,
-                response_date=command.response_date
+            stmt = (
+                insert(DomainAgentResponse)
+                .values(
+                    agent_id=command.agent_id,
+                    domain_question_id=command.domain_question_id,
+                    response_text=command.response_text,
+                    response_date=command.response_date
+                )
+                .returning(DomainAgentResponse.domain_agent_response_id)
             )
-            self.session.add(response)
-            await self.session.commit()
-            await self.session.refresh(response)
-            return response.domain_agent_response_id
+            result = await self.session.execute(stmt)
+            domain_agent_response_id = result.scalar_one()
+            await commit(self.session)
+            return domain_agent_response_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Invalid agent or domain question reference")
 
     async def update(self, command: UpdateDomainAgentResponse) -> bool:
@@ -59,25 +67,26 @@ class DomainAgentResponseRepository:
         Raises:
             ValueError: If invalid agent or domain question reference
         """
-        stmt = select(DomainAgentResponse).where(
-            DomainAgentResponse.domain_agent_response_id == command.domain_agent_response_id
+        stmt = (
+            update(DomainAgentResponse)
+            .where(DomainAgentResponse.domain_agent_response_id == command.domain_agent_response_id)
+            .values(
+                agent_id=command.agent_id,
+                domain_question_id=command.domain_question_id,
+                response_text=command.response_text,
+                response_date=command.response_date
+            )
+            .returning(DomainAgentResponse.domain_agent_response_id)
         )
-        result = await self.session.execute(stmt)
-        response = result.scalar_one_or_none()
-
-        if not response:
-            return False
-
-        response.agent_id = command.agent_id
-        response.domain_question_id = command.domain_question_id
-        response.response_text = command.response_text
-        response.response_date = command.response_date
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Invalid agent or domain question reference")
 
     async def delete(self, domain_agent_response_id: int) -> bool:
@@ -89,17 +98,11 @@ class DomainAgentResponseRepository:
         Returns:
             bool: True if deletion was successful
         """
-        stmt = select(DomainAgentResponse).where(
-            DomainAgentResponse.domain_agent_response_id == domain_agent_response_id
-        )
+        stmt = delete(DomainAgentResponse).where(DomainAgentResponse.domain_agent_response_id == domain_agent_response_id).returning(DomainAgentResponse.domain_agent_response_id)
         result = await self.session.execute(stmt)
-        response = result.scalar_one_or_none()
-
-        if not response:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(response)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetDomainAgentResponse) -> Optional[DomainAgentResponseData]:
@@ -111,47 +114,83 @@ class DomainAgentResponseRepository:
         Returns:
             Optional[DomainAgentResponseData]: Domain agent response data if found, None otherwise
         """
-        stmt = select(DomainAgentResponse)
+        domain_agent_response_id = command.domain_agent_response_id
+        agent_id = command.agent_id
+        domain_question_id = command.domain_question_id
+        fields = command.fields
+
+        # Lambda statements are cached per filter combination, so repeated
+        # lookups skip building and compiling the SELECT.
+        stmt = select_fields(DomainAgentResponse, fields)
+        if domain_agent_response_id:
+            stmt += lambda s: s.where(DomainAgentResponse.domain_agent_response_id ==
+                                      domain_agent_response_id)
+        if agent_id:
+            stmt += lambda s: s.where(DomainAgentResponse.agent_id == agent_id)
+        if domain_question_id:
+            stmt += lambda s: s.where(DomainAgentResponse.domain_question_id ==
+                                      domain_question_id)
+
+        result = await self.session.execute(stmt)
+        response = fetch_one(result, fields)
+        return to_response(DomainAgentResponseData, response, fields) if response else None
 
-        conditions = []
-        if command.domain_agent_response_id:
-            conditions.append(DomainAgentResponse.domain_agent_response_id ==
-                              command.domain_agent_response_id)
-        if command.agent_id:
-            conditions.append(DomainAgentResponse.agent_id == command.agent_id)
-        if command.domain_question_id:
-            conditions.append(DomainAgentResponse.domain_question_id ==
-                              command.domain_question_id)
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[DomainAgentResponseData], List[int]]:
+        """Get domain agent responses by ID in one query, in the order of ``ids``.
 
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+        Args:
+            ids: IDs of the domain agent responses
+            fields: Optional columns to return
 
-        result = await self.session.execute(stmt)
-        response = result.scalar_one_or_none()
-        return DomainAgentResponseData.model_validate(response) if response else None
+        Returns:
+            Tuple[List[DomainAgentResponseData], List[int]]: Domain agent responses found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(DomainAgentResponse, ids, fields))
+        responses, missing = in_order(fetch_all(result, fields), "domain_agent_response_id", ids)
+        return [to_response(DomainAgentResponseData, response, fields) for response in responses], missing
 
     async def list_all(
         self,
         agent_id: Optional[int] = None,
-        domain_question_id: Optional[int] = None
-    ) -> List[DomainAgentResponseData]:
+        domain_question_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[DomainAgentResponseData], Optional[str], Optional[int]]:
         """List all domain agent responses, optionally filtered.
         
         Args:
             agent_id: Optional agent ID filter
             domain_question_id: Optional domain question ID filter
+            limit: Optional page size
+            after: Optional key of the last response of the previous page
+            fields: Optional columns to return
+            count: How to compute the total
             
         Returns:
-            List[DomainAgentResponseData]: List of domain agent responses
+            Tuple[List[DomainAgentResponseData], Optional[str], Optional[int]]: Page of domain
+            agent responses and the cursor of the next page
+            and the total, if requested
         """
-        stmt = select(DomainAgentResponse)
+        stmt = select_fields(DomainAgentResponse, fields)
 
         if agent_id:
-            stmt = stmt.where(DomainAgentResponse.agent_id == agent_id)
+            stmt += lambda s: s.where(DomainAgentResponse.agent_id == agent_id)
         if domain_question_id:
-            stmt = stmt.where(
+            stmt += lambda s: s.where(
                 DomainAgentResponse.domain_question_id == domain_question_id)
+        total = await count_rows(
+            self.session, stmt, DomainAgentResponse.__tablename__, count,
+            filtered=bool(agent_id or domain_question_id))
+        stmt = keyset(stmt, DomainAgentResponse.domain_agent_response_id, limit, after)
 
         result = await self.session.execute(stmt)
-        responses = result.scalars().all()
-        return [DomainAgentResponseData.model_validate(r) for r in responses]
+        responses, next_cursor = page(
+            fetch_all(result, fields), "domain_agent_response_id", limit)
+        return [to_response(DomainAgentResponseData, r, fields) for r in responses], next_cursor, total
@@ -1,6 +1,6 @@
 """Repository implementation for domain question operations."""
-from typing import Optional, List
-from sqlalchemy import select, and_
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.command.domain_question_command import (
@@ -9,6 +9,10 @@ from domain.command.domain_question_command import (
     GetDomainQuestion,
     DomainQuestionResponse
 )
+from adapters.postgres.config import commit
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.domain_question import DomainQuestion
 
 
@@ -21,97 +25,127 @@ class DomainQuestionRepository:
 
     async def create(self, command: CreateDomainQuestion) -> int:
         """Create a new domain question."""
-        domain_question = DomainQuestion(
-            domain_id=command.domain_id,
-            industry_id=command.industry_id,
-            question_text=command.question_text,
-            question_type=command.question_type,
-            category=command.category
+        stmt = (
+            insert(DomainQuestion)
+            .values(
+                domain_id=command.domain_id,
+                industry_id=command.industry_id,
+                question_text=command.question_text,
+                question_type=command.question_type,
+                category=command.category
+            )
+            .returning(DomainQuestion.domain_question_id)
         )
-        self.session.add(domain_question)
-        await self.session.commit()
-        await self.session.refresh(domain_question)
-        return domain_question.domain_question_id
+        result = await self.session.execute(stmt)
+        domain_question_id = result.scalar_one()
+        await commit(self.session)
+        return domain_question_id
 
     async def update(self, command: UpdateDomainQuestion) -> bool:
         """Update an existing domain question."""
-        stmt = select(DomainQuestion).where(
-            DomainQuestion.domain_question_id == command.domain_question_id
+        stmt = (
+            update(DomainQuestion)
+            .where(DomainQuestion.domain_question_id == command.domain_question_id)
+            .values(
+                domain_id=command.domain_id,
+                industry_id=command.industry_id,
+                question_text=command.question_text,
+                question_type=command.question_type,
+                category=command.category
+            )
+            .returning(DomainQuestion.domain_question_id)
         )
-        result = await self.session.execute(stmt)
-        domain_question = result.scalar_one_or_none()
 
-        if not domain_question:
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
             return False
-
-        domain_question.domain_id = command.domain_id
-        domain_question.industry_id = command.industry_id
-        domain_question.question_text = command.question_text
-        domain_question.question_type = command.question_type
-        domain_question.category = command.category
-
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def delete(self, domain_question_id: int) -> bool:
         """Delete a domain question."""
-        stmt = select(DomainQuestion).where(
-            DomainQuestion.domain_question_id == domain_question_id
-        )
+        stmt = delete(DomainQuestion).where(DomainQuestion.domain_question_id == domain_question_id).returning(DomainQuestion.domain_question_id)
         result = await self.session.execute(stmt)
-        domain_question = result.scalar_one_or_none()
-
-        if not domain_question:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(domain_question)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetDomainQuestion) -> Optional[DomainQuestionResponse]:
         """Get a domain question by ID or filters."""
-        stmt = select(DomainQuestion)
-
-        conditions = []
-        if command.domain_question_id:
-            conditions.append(DomainQuestion.domain_question_id ==
-                              command.domain_question_id)
-        if command.domain_id:
-            conditions.append(DomainQuestion.domain_id == command.domain_id)
-        if command.industry_id:
-            conditions.append(DomainQuestion.industry_id == command.industry_id)
-        if command.category:
-            conditions.append(DomainQuestion.category == command.category)
-        if command.question_type:
-            conditions.append(DomainQuestion.question_type ==
-                              command.question_type)
-
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+        domain_question_id = command.domain_question_id
+        domain_id = command.domain_id
+        industry_id = command.industry_id
+        category = command.category
+        question_type = command.question_type
+        fields = command.fields
+
+        # Lambda statements are cached per filter combination, so repeated
+        # lookups skip building and compiling the SELECT.
+        stmt = select_fields(DomainQuestion, fields)
+        if domain_question_id:
+            stmt += lambda s: s.where(DomainQuestion.domain_question_id ==
+                                      domain_question_id)
+        if domain_id:
+            stmt += lambda s: s.where(DomainQuestion.domain_id == domain_id)
+        if industry_id:
+            stmt += lambda s: s.where(DomainQuestion.industry_id == industry_id)
+        if category:
+            stmt += lambda s: s.where(DomainQuestion.category == category)
+        if question_type:
+            stmt += lambda s: s.where(DomainQuestion.question_type ==
+                                      question_type)
 
         result = await self.session.execute(stmt)
-        domain_question = result.scalar_one_or_none()
-        return DomainQuestionResponse.model_validate(domain_question) if domain_question else None
+        domain_question = fetch_one(result, fields)
+        return to_response(DomainQuestionResponse, domain_question, fields) if domain_question else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[DomainQuestionResponse], List[int]]:
+        """Get domain questions by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the domain questions
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[DomainQuestionResponse], List[int]]: Domain questions found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(DomainQuestion, ids, fields))
+        questions, missing = in_order(fetch_all(result, fields), "domain_question_id", ids)
+        return [to_response(DomainQuestionResponse, question, fields) for question in questions], missing
 
     async def list_all(
         self,
         domain_id: Optional[int] = None,
         industry_id: Optional[int] = None,
         category: Optional[str] = None,
-        question_type: Optional[str] = None
-    ) -> List[DomainQuestionResponse]:
-        """List all domain questions, optionally filtered."""
-        stmt = select(DomainQuestion)
+        question_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[DomainQuestionResponse], Optional[str], Optional[int]]:
+        """List all domain questions, optionally filtered, a page at a time when ``limit`` is given."""
+        stmt = select_fields(DomainQuestion, fields)
 
         if domain_id:
-            stmt = stmt.where(DomainQuestion.domain_id == domain_id)
+            stmt += lambda s: s.where(DomainQuestion.domain_id == domain_id)
         if industry_id:
-            stmt = stmt.where(DomainQuestion.industry_id == industry_id)
+            stmt += lambda s: s.where(DomainQuestion.industry_id == industry_id)
         if category:
-            stmt = stmt.where(DomainQuestion.category == category)
+            stmt += lambda s: s.where(DomainQuestion.category == category)
         if question_type:
-            stmt = stmt.where(DomainQuestion.question_type == question_type)
+            stmt += lambda s: s.where(DomainQuestion.question_type == question_type)
+        total = await count_rows(
+            self.session, stmt, DomainQuestion.__tablename__, count,
+            filtered=bool(domain_id or industry_id or category or question_type))
+        stmt = keyset(stmt, DomainQuestion.domain_question_id, limit, after)
 
         result = await self.session.execute(stmt)
-        domain_questions = result.scalars().all()
-        return [DomainQuestionResponse.model_validate(q) for q in domain_questions]
+        domain_questions, next_cursor = page(fetch_all(result, fields), "domain_question_id", limit)
+        return [to_response(DomainQuestionResponse, q, fields) for q in domain_questions], next_cursor, total
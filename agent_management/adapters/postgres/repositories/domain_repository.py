@@ -1,10 +1,14 @@
 """Repository implementation for domain operations."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.domain_command import CreateDomain, UpdateDomain, GetDomain, DomainResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.domain import Domain
 
 
@@ -17,50 +21,55 @@ class DomainRepository:
 
     async def create(self, command: CreateDomain) -> int:
         """Create a new domain."""
-        domain = Domain(domain_name=command.domain_name)
-        self.session.add(domain)
+        stmt = (
+            insert(Domain)
+            .values(
+                domain_name=command.domain_name
+            )
+            .returning(Domain.domain_id)
+        )
         try:
-            await self.session.commit()
-            await self.session.refresh(domain)
-            return domain.domain_id
+            result = await self.session.execute(stmt)
+            domain_id = result.scalar_one()
+            await commit(self.session)
+            return domain_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Domain name already exists")
 
     async def update(self, command: UpdateDomain) -> bool:
         """Update an existing domain."""
-        stmt = select(Domain).where(Domain.domain_id == command.domain_id)
-        result = await self.session.execute(stmt)
-        domain = result.scalar_one_or_none()
-
-        if not domain:
-            return False
-
-        domain.domain_name = command.domain_name
+        stmt = (
+            update(Domain)
+            .where(Domain.domain_id == command.domain_id)
+            .values(
+                domain_name=command.domain_name
+            )
+            .returning(Domain.domain_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Domain name already exists")
 
     async def delete(self, domain_id: int) -> bool:
         """Delete a domain."""
-        stmt = select(Domain).where(Domain.domain_id == domain_id)
+        stmt = delete(Domain).where(Domain.domain_id == domain_id).returning(Domain.domain_id)
         result = await self.session.execute(stmt)
-        domain = result.scalar_one_or_none()
-
-        if not domain:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(domain)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetDomain) -> Optional[DomainResponse]:
         """Get a domain by ID or name."""
-        stmt = select(Domain)
+        stmt = select(*selection(Domain, command.fields))
         if command.domain_id:
             stmt = stmt.where(Domain.domain_id == command.domain_id)
         elif command.domain_name:
@@ -69,12 +78,40 @@ class DomainRepository:
             return None
 
         result = await self.session.execute(stmt)
-        domain = result.scalar_one_or_none()
-        return DomainResponse.model_validate(domain) if domain else None
+        domain = fetch_one(result, command.fields)
+        return to_response(DomainResponse, domain, command.fields) if domain else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[DomainResponse], List[int]]:
+        """Get domains by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the domains
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[DomainResponse], List[int]]: Domains found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Domain, ids, fields))
+        domains, missing = in_order(fetch_all(result, fields), "domain_id", ids)
+        return [to_response(DomainResponse, domain, fields) for domain in domains], missing
 
-    async def list_all(self) -> List[DomainResponse]:
-        """List all domains."""
-        stmt = select(Domain)
+    async def list_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[DomainResponse], Optional[str], Optional[int]]:
+        """List domains, one page at a time when ``limit`` is given."""
+        stmt = select_fields(Domain, fields)
+        total = await count_rows(
+            self.session, stmt, Domain.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, Domain.domain_id, limit, after)
         result = await self.session.execute(stmt)
-        domains = result.scalars().all()
-        return [DomainResponse.model_validate(domain) for domain in domains]
+        domains, next_cursor = page(fetch_all(result, fields), "domain_id", limit)
+        return [to_response(DomainResponse, domain, fields) for domain in domains], next_cursor, total
@@ -1,9 +1,13 @@
 """PostgreSQL repository implementation for industries."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.industry import Industry
 from domain.command.industry_command import (
     CreateIndustry,
@@ -31,16 +35,20 @@ class IndustryRepository:
         Raises:
             ValueError: If industry name already exists
         """
-        industry = Industry(
-            industry_name=command.industry_name
+        stmt = (
+            insert(Industry)
+            .values(
+                industry_name=command.industry_name
+            )
+            .returning(Industry.industry_id)
         )
-        self.session.add(industry)
         try:
-            await self.session.commit()
-            await self.session.refresh(industry)
-            return industry.industry_id
+            result = await self.session.execute(stmt)
+            industry_id = result.scalar_one()
+            await commit(self.session)
+            return industry_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Industry name already exists")
 
     async def update(self, command: UpdateIndustry) -> bool:
@@ -55,21 +63,30 @@ class IndustryRepository:
         Raises:
             ValueError: If industry name already exists
         """
-        stmt = select(Industry).where(Industry.industry_id == command.industry_id)
-        result = await self.session.execute(stmt)
-        industry = result.scalar_one_or_none()
+        values = {}
+        if command.industry_name is not None:
+            values["industry_name"] = command.industry_name
 
-        if not industry:
-            return False
+        if not values:
+            stmt = select(Industry.industry_id).where(Industry.industry_id == command.industry_id)
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none() is not None
 
-        if command.industry_name is not None:
-            industry.industry_name = command.industry_name
+        stmt = (
+            update(Industry)
+            .where(Industry.industry_id == command.industry_id)
+            .values(**values)
+            .returning(Industry.industry_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Industry name already exists")
 
     async def delete(self, industry_id: int) -> bool:
@@ -81,32 +98,35 @@ class IndustryRepository:
         Returns:
             bool: True if deletion was successful
         """
-        stmt = select(Industry).where(Industry.industry_id == industry_id)
+        stmt = delete(Industry).where(Industry.industry_id == industry_id).returning(Industry.industry_id)
         result = await self.session.execute(stmt)
-        industry = result.scalar_one_or_none()
-
-        if not industry:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(industry)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
-    async def get_by_id(self, industry_id: int) -> Optional[IndustryResponse]:
+    async def get_by_id(
+        self,
+        industry_id: int,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[IndustryResponse]:
         """Get an industry by ID.
         
         Args:
             industry_id: ID of the industry to get
+            fields: Optional columns to return
             
         Returns:
             Optional[IndustryResponse]: Industry data if found, None otherwise
         """
-        stmt = select(Industry).where(Industry.industry_id == industry_id)
+        stmt = select(*selection(Industry, fields)).where(Industry.industry_id == industry_id)
         result = await self.session.execute(stmt)
-        industry = result.scalar_one_or_none()
+        industry = fetch_one(result, fields)
         
         if not industry:
             return None
+        if fields:
+            return to_response(IndustryResponse, industry, fields)
             
         return IndustryResponse(
             industry_id=industry.industry_id,
@@ -134,15 +154,55 @@ class IndustryRepository:
             industry_name=industry.industry_name
         )
 
-    async def get_all(self) -> List[IndustryResponse]:
-        """Get all industries.
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[IndustryResponse], List[int]]:
+        """Get industries by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the industries
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[IndustryResponse], List[int]]: Industries found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Industry, ids, fields))
+        industries, missing = in_order(fetch_all(result, fields), "industry_id", ids)
+        return [to_response(IndustryResponse, industry, fields) for industry in industries], missing
+
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[IndustryResponse], Optional[str], Optional[int]]:
+        """Get all industries, one page at a time when ``limit`` is given.
         
+        Args:
+            limit: Optional page size
+            after: Optional key of the last industry of the previous page
+            fields: Optional columns to return
+            count: How to compute the total
+            
         Returns:
-            List[IndustryResponse]: List of all industries
+            Tuple[List[IndustryResponse], Optional[str], Optional[int]]: Page of industries and the
+            cursor of the next page and the total, if requested
         """
-        stmt = select(Industry)
+        stmt = select_fields(Industry, fields)
+        total = await count_rows(
+            self.session, stmt, Industry.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, Industry.industry_id, limit, after)
         result = await self.session.execute(stmt)
-        industries = result.scalars().all()
+        industries, next_cursor = page(fetch_all(result, fields), "industry_id", limit)
+
+        if fields:
+            return [
+                to_response(IndustryResponse, industry, fields) for industry in industries
+            ], next_cursor, total
         
         return [
             IndustryResponse(
@@ -150,4 +210,4 @@ class IndustryRepository:
                 industry_name=industry.industry_name
             )
             for industry in industries
-        ]
+        ], next_cursor, total
@@ -1,8 +1,9 @@
 """Repository implementation for maturity agent response operations."""
-from typing import Optional, List
-from sqlalchemy import select, and_
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, and_, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 
 from domain.command.maturity_agent_response_command import (
     CreateMaturityAgentResponse,
@@ -10,6 +11,11 @@ from domain.command.maturity_agent_response_command import (
     GetMaturityAgentResponse,
     MaturityAgentResponseData
 )
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.catalog import refresh_catalog
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.maturity_agent_response import MaturityAgentResponse
 
 
@@ -33,18 +39,23 @@ class MaturityAgentResponseRepository:
             ValueError: If invalid agent or maturity question reference
         """
         try:
-            response = MaturityAgentResponse(
-                agent_id=command.agent_id,
-                maturity_question_id=command.maturity_question_id,
-                response_text=command.response_text,
-                response_date=command.response_date
+            stmt = (
+                insert(MaturityAgentResponse)
+                .values(
+                    agent_id=command.agent_id,
+                    maturity_question_id=command.maturity_question_id,
+                    response_text=command.response_text,
+                    response_date=command.response_date
+                )
+                .returning(MaturityAgentResponse.maturity_agent_response_id)
             )
-            self.session.add(response)
-            await self.session.commit()
-            await self.session.refresh(response)
-            return response.maturity_agent_response_id
+            result = await self.session.execute(stmt)
+            maturity_agent_response_id = result.scalar_one()
+            await refresh_catalog(self.session, [command.maturity_question_id])
+            await commit(self.session)
+            return maturity_agent_response_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Invalid agent or maturity question reference")
 
     async def update(self, command: UpdateMaturityAgentResponse) -> bool:
@@ -59,25 +70,36 @@ class MaturityAgentResponseRepository:
         Raises:
             ValueError: If invalid agent or maturity question reference
         """
-        stmt = select(MaturityAgentResponse).where(
-            MaturityAgentResponse.maturity_agent_response_id == command.maturity_agent_response_id
+        # RETURNING sees the table as it was before the UPDATE, so the
+        # subquery yields the question the response is moving away from.
+        previous = aliased(MaturityAgentResponse)
+        previous_question_id = (
+            select(previous.maturity_question_id)
+            .where(previous.maturity_agent_response_id == command.maturity_agent_response_id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(MaturityAgentResponse)
+            .where(MaturityAgentResponse.maturity_agent_response_id == command.maturity_agent_response_id)
+            .values(
+                agent_id=command.agent_id,
+                maturity_question_id=command.maturity_question_id,
+                response_text=command.response_text,
+                response_date=command.response_date
+            )
+            .returning(previous_question_id)
         )
-        result = await self.session.execute(stmt)
-        response = result.scalar_one_or_none()
-
-        if not response:
-            return False
-
-        response.agent_id = command.agent_id
-        response.maturity_question_id = command.maturity_question_id
-        response.response_text = command.response_text
-        response.response_date = command.response_date
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            row = result.one_or_none()
+            if row is None:
+                return False
+            await refresh_catalog(self.session, [row[0], command.maturity_question_id])
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Invalid agent or maturity question reference")
 
     async def delete(self, maturity_agent_response_id: int) -> bool:
@@ -89,17 +111,13 @@ class MaturityAgentResponseRepository:
         Returns:
             bool: True if deletion was successful
         """
-        stmt = select(MaturityAgentResponse).where(
-            MaturityAgentResponse.maturity_agent_response_id == maturity_agent_response_id
-        )
+        stmt = delete(MaturityAgentResponse).where(MaturityAgentResponse.maturity_agent_response_id == maturity_agent_response_id).returning(MaturityAgentResponse.maturity_question_id)
         result = await self.session.execute(stmt)
-        response = result.scalar_one_or_none()
-
-        if not response:
+        row = result.one_or_none()
+        if row is None:
             return False
-
-        await self.session.delete(response)
-        await self.session.commit()
+        await refresh_catalog(self.session, [row[0]])
+        await commit(self.session)
         return True
 
     async def get(self, command: GetMaturityAgentResponse) -> Optional[MaturityAgentResponseData]:
@@ -111,7 +129,7 @@ class MaturityAgentResponseRepository:
         Returns:
             Optional[MaturityAgentResponseData]: Maturity agent response data if found, None otherwise
         """
-        stmt = select(MaturityAgentResponse)
+        stmt = select(*selection(MaturityAgentResponse, command.fields))
 
         conditions = []
         if command.maturity_agent_response_id:
@@ -127,31 +145,65 @@ class MaturityAgentResponseRepository:
             stmt = stmt.where(and_(*conditions))
 
         result = await self.session.execute(stmt)
-        response = result.scalar_one_or_none()
-        return MaturityAgentResponseData.model_validate(response) if response else None
+        response = fetch_one(result, command.fields)
+        return to_response(MaturityAgentResponseData, response, command.fields) if response else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[MaturityAgentResponseData], List[int]]:
+        """Get maturity agent responses by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the maturity agent responses
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[MaturityAgentResponseData], List[int]]: Maturity agent responses found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(MaturityAgentResponse, ids, fields))
+        responses, missing = in_order(fetch_all(result, fields), "maturity_agent_response_id", ids)
+        return [to_response(MaturityAgentResponseData, response, fields) for response in responses], missing
 
     async def list_all(
         self,
         agent_id: Optional[int] = None,
-        maturity_question_id: Optional[int] = None
-    ) -> List[MaturityAgentResponseData]:
+        maturity_question_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[MaturityAgentResponseData], Optional[str], Optional[int]]:
         """List all maturity agent responses, optionally filtered.
         
         Args:
             agent_id: Optional agent ID filter
             maturity_question_id: Optional maturity question ID filter
+            limit: Optional page size
+            after: Optional key of the last response of the previous page
+            fields: Optional columns to return
+            count: How to compute the total
             
         Returns:
-            List[MaturityAgentResponseData]: List of maturity agent responses
+            Tuple[List[MaturityAgentResponseData], Optional[str], Optional[int]]: Page of
+            maturity agent responses and the cursor of the next page
+            and the total, if requested
         """
-        stmt = select(MaturityAgentResponse)
+        stmt = select_fields(MaturityAgentResponse, fields)
 
         if agent_id:
-            stmt = stmt.where(MaturityAgentResponse.agent_id == agent_id)
+            stmt += lambda s: s.where(MaturityAgentResponse.agent_id == agent_id)
         if maturity_question_id:
-            stmt = stmt.where(
+            stmt += lambda s: s.where(
                 MaturityAgentResponse.maturity_question_id == maturity_question_id)
+        total = await count_rows(
+            self.session, stmt, MaturityAgentResponse.__tablename__, count,
+            filtered=bool(agent_id or maturity_question_id))
+        stmt = keyset(stmt, MaturityAgentResponse.maturity_agent_response_id, limit, after)
 
         result = await self.session.execute(stmt)
-        responses = result.scalars().all()
-        return [MaturityAgentResponseData.model_validate(r) for r in responses]
+        responses, next_cursor = page(
+            fetch_all(result, fields), "maturity_agent_response_id", limit)
+        return [to_response(MaturityAgentResponseData, r, fields) for r in responses], next_cursor, total
@@ -1,6 +1,8 @@
 """Repository implementation for maturity answer operations."""
-from typing import Optional, List
-from sqlalchemy import select, and_
+from datetime import datetime
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import literal_column, select, update, delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -8,8 +10,14 @@ from domain.command.maturity_answer_command import (
     CreateMaturityAnswer,
     UpdateMaturityAnswer,
     GetMaturityAnswer,
-    MaturityAnswerResponse
+    MaturityAnswerResponse,
+    UpsertMaturityAnswers,
+    UpsertMaturityAnswersResponse
 )
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.maturity_answer import MaturityAnswer
 
 
@@ -33,21 +41,75 @@ class MaturityAnswerRepository:
             ValueError: If maturity answer already exists for this session and question
         """
         try:
-            maturity_answer = MaturityAnswer(
-                session_id=command.session_id,
-                maturity_question_id=command.maturity_question_id,
-                answer_text=command.answer_text,
-                answered_at=command.answered_at
+            stmt = (
+                insert(MaturityAnswer)
+                .values(
+                    session_id=command.session_id,
+                    maturity_question_id=command.maturity_question_id,
+                    answer_text=command.answer_text,
+                    answered_at=command.answered_at
+                )
+                .returning(MaturityAnswer.maturity_answer_id)
             )
-            self.session.add(maturity_answer)
-            await self.session.commit()
-            await self.session.refresh(maturity_answer)
-            return maturity_answer.maturity_answer_id
+            result = await self.session.execute(stmt)
+            maturity_answer_id = result.scalar_one()
+            await commit(self.session)
+            return maturity_answer_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError(
                 "Maturity answer already exists for this session and question")
 
+    async def upsert_many(self, command: UpsertMaturityAnswers) -> UpsertMaturityAnswersResponse:
+        """Insert or update many answers of a session in one statement.
+
+        Rows are keyed by (session_id, maturity_question_id); an existing
+        answer to the same question is overwritten. When a question appears
+        more than once in the command, the last answer wins.
+
+        Args:
+            command: UpsertMaturityAnswers command
+
+        Returns:
+            UpsertMaturityAnswersResponse: Number of answers inserted and updated
+
+        Raises:
+            ValueError: If the session or a question does not exist
+        """
+        answers = {answer.maturity_question_id: answer for answer in command.answers}
+        now = datetime.utcnow()
+        rows = [
+            {
+                'session_id': command.session_id,
+                'maturity_question_id': answer.maturity_question_id,
+                'answer_text': answer.answer_text,
+                'answered_at': answer.answered_at,
+                'created_at': now
+            }
+            for answer in answers.values()
+        ]
+        stmt = pg_insert(MaturityAnswer).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint='uq_session_maturity_question',
+            set_={
+                'answer_text': stmt.excluded.answer_text,
+                'answered_at': stmt.excluded.answered_at,
+                'updated_at': now
+            }
+        ).returning(literal_column('xmax = 0').label('inserted'))
+
+        try:
+            result = await self.session.execute(stmt)
+            inserted = sum(1 for row in result if row.inserted)
+            await commit(self.session)
+        except IntegrityError:
+            await rollback(self.session)
+            raise ValueError("Invalid session or maturity question reference")
+        return UpsertMaturityAnswersResponse(
+            inserted=inserted,
+            updated=len(rows) - inserted
+        )
+
     async def update(self, command: UpdateMaturityAnswer) -> bool:
         """Update an existing maturity answer.
         
@@ -60,23 +122,26 @@ class MaturityAnswerRepository:
         Raises:
             ValueError: If maturity answer already exists for this session and question
         """
-        stmt = select(MaturityAnswer).where(MaturityAnswer.maturity_answer_id == command.maturity_answer_id)
-        result = await self.session.execute(stmt)
-        maturity_answer = result.scalar_one_or_none()
-
-        if not maturity_answer:
-            return False
-
-        maturity_answer.session_id = command.session_id
-        maturity_answer.maturity_question_id = command.maturity_question_id
-        maturity_answer.answer_text = command.answer_text
-        maturity_answer.answered_at = command.answered_at
+        stmt = (
+            update(MaturityAnswer)
+            .where(MaturityAnswer.maturity_answer_id == command.maturity_answer_id)
+            .values(
+                session_id=command.session_id,
+                maturity_question_id=command.maturity_question_id,
+                answer_text=command.answer_text,
+                answered_at=command.answered_at
+            )
+            .returning(MaturityAnswer.maturity_answer_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError(
                 "Maturity answer already exists for this session and question")
 
@@ -89,15 +154,11 @@ class MaturityAnswerRepository:
         Returns:
             bool: True if deletion was successful
         """
-        stmt = select(MaturityAnswer).where(MaturityAnswer.maturity_answer_id == maturity_answer_id)
+        stmt = delete(MaturityAnswer).where(MaturityAnswer.maturity_answer_id == maturity_answer_id).returning(MaturityAnswer.maturity_answer_id)
         result = await self.session.execute(stmt)
-        maturity_answer = result.scalar_one_or_none()
-
-        if not maturity_answer:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(maturity_answer)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetMaturityAnswer) -> Optional[MaturityAnswerResponse]:
@@ -109,44 +170,79 @@ class MaturityAnswerRepository:
         Returns:
             Optional[MaturityAnswerResponse]: Maturity answer data if found, None otherwise
         """
-        stmt = select(MaturityAnswer)
+        maturity_answer_id = command.maturity_answer_id
+        session_id = command.session_id
+        maturity_question_id = command.maturity_question_id
+        fields = command.fields
+
+        # Lambda statements are cached per filter combination, so repeated
+        # lookups skip building and compiling the SELECT.
+        stmt = select_fields(MaturityAnswer, fields)
+        if maturity_answer_id:
+            stmt += lambda s: s.where(MaturityAnswer.maturity_answer_id == maturity_answer_id)
+        if session_id:
+            stmt += lambda s: s.where(MaturityAnswer.session_id == session_id)
+        if maturity_question_id:
+            stmt += lambda s: s.where(MaturityAnswer.maturity_question_id == maturity_question_id)
 
-        conditions = []
-        if command.maturity_answer_id:
-            conditions.append(MaturityAnswer.maturity_answer_id == command.maturity_answer_id)
-        if command.session_id:
-            conditions.append(MaturityAnswer.session_id == command.session_id)
-        if command.maturity_question_id:
-            conditions.append(MaturityAnswer.maturity_question_id == command.maturity_question_id)
+        result = await self.session.execute(stmt)
+        maturity_answer = fetch_one(result, fields)
+        return to_response(MaturityAnswerResponse, maturity_answer, fields) if maturity_answer else None
 
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[MaturityAnswerResponse], List[int]]:
+        """Get maturity answers by ID in one query, in the order of ``ids``.
 
-        result = await self.session.execute(stmt)
-        maturity_answer = result.scalar_one_or_none()
-        return MaturityAnswerResponse.model_validate(maturity_answer) if maturity_answer else None
+        Args:
+            ids: IDs of the maturity answers
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[MaturityAnswerResponse], List[int]]: Maturity answers found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(MaturityAnswer, ids, fields))
+        answers, missing = in_order(fetch_all(result, fields), "maturity_answer_id", ids)
+        return [to_response(MaturityAnswerResponse, answer, fields) for answer in answers], missing
 
     async def list_all(
         self,
         session_id: Optional[int] = None,
-        maturity_question_id: Optional[int] = None
-    ) -> List[MaturityAnswerResponse]:
+        maturity_question_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[MaturityAnswerResponse], Optional[str], Optional[int]]:
         """List all maturity answers, optionally filtered.
         
         Args:
             session_id: Optional session ID filter
             maturity_question_id: Optional maturity question ID filter
+            limit: Optional page size
+            after: Optional key of the last answer of the previous page
+            fields: Optional columns to return
+            count: How to compute the total
             
         Returns:
-            List[MaturityAnswerResponse]: List of maturity answers
+            Tuple[List[MaturityAnswerResponse], Optional[str], Optional[int]]: Page of
+            maturity answers and the cursor of the next page
+            and the total, if requested
         """
-        stmt = select(MaturityAnswer)
+        stmt = select_fields(MaturityAnswer, fields)
 
         if session_id:
-            stmt = stmt.where(MaturityAnswer.session_id == session_id)
+            stmt += lambda s: s.where(MaturityAnswer.session_id == session_id)
         if maturity_question_id:
-            stmt = stmt.where(MaturityAnswer.maturity_question_id == maturity_question_id)
+            stmt += lambda s: s.where(MaturityAnswer.maturity_question_id == maturity_question_id)
+        total = await count_rows(
+            self.session, stmt, MaturityAnswer.__tablename__, count,
+            filtered=bool(session_id or maturity_question_id))
+        stmt = keyset(stmt, MaturityAnswer.maturity_answer_id, limit, after)
 
         result = await self.session.execute(stmt)
-        maturity_answers = result.scalars().all()
-        return [MaturityAnswerResponse.model_validate(a) for a in maturity_answers]
+        maturity_answers, next_cursor = page(fetch_all(result, fields), "maturity_answer_id", limit)
+        return [to_response(MaturityAnswerResponse, a, fields) for a in maturity_answers], next_cursor, total
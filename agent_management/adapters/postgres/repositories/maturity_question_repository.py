@@ -1,12 +1,23 @@
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple, Sequence
 
-from sqlalchemy import select, text
+from sqlalchemy import lambda_stmt, select, text, update, delete, insert
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from adapters.postgres.config import DatabaseSettings
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.catalog import catalog_ready, refresh_catalog
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.maturity_question import MaturityQuestion
 from adapters.postgres.models.maturity_agent_response import MaturityAgentResponse
+from adapters.postgres.models.maturity_question_catalog import MaturityQuestionCatalog
 from domain.command.maturity_question_command import (
+    BulkCreateMaturityQuestions,
+    BulkCreateMaturityQuestionsResponse,
+    BulkCreatedMaturityQuestion,
     CreateMaturityQuestion,
     UpdateMaturityQuestion,
     GetMaturityQuestion,
@@ -16,6 +27,36 @@ from domain.command.maturity_question_command import (
 )
 
 
+# Aggregates the options live, for databases whose catalog has not been
+# backfilled yet. Tables are qualified with SQLAlchemy's schema placeholder,
+# which the engine replaces from its schema_translate_map when the statement
+# is executed.
+QUESTIONS_WITH_RESPONSE_SQL = """
+    SELECT
+        mq.maturity_question_id,
+        mq.question_text,
+        json_agg(json_build_object(
+            'id', mar.maturity_agent_response_id,
+            'text', mar.response_text,
+            'score', 0
+        ) ORDER BY mar.maturity_agent_response_id) options
+    FROM __[SCHEMA__none].maturity_questions mq
+    JOIN __[SCHEMA__none].maturity_agent_responses mar ON mq.maturity_question_id = mar.maturity_question_id
+    {where_clause}
+    GROUP BY mq.maturity_question_id, mq.question_text, mq.ambitus_id, mq.question_order
+    ORDER BY mq.ambitus_id, mq.question_order
+"""
+
+
+@lru_cache(maxsize=32)
+def _questions_with_response_query(filters: tuple) -> TextClause:
+    """Build the questions-with-response query once per set of filter columns."""
+    where_clause = " AND ".join(f"mq.{name} = :{name}" for name in filters)
+    return text(QUESTIONS_WITH_RESPONSE_SQL.format(
+        where_clause=f"WHERE {where_clause}" if filters else ""
+    ))
+
+
 class MaturityQuestionRepository:
     """Repository for maturity question operations."""
 
@@ -35,23 +76,92 @@ class MaturityQuestionRepository:
         Raises:
             ValueError: If validation fails
         """
-        maturity_question = MaturityQuestion(
-            question_text=command.question_text,
-            question_type=command.question_type,
-            question_order=command.question_order,
-            category=command.category,
-            axis_id=command.axis_id,
-            industry_id=command.industry_id
+        stmt = (
+            insert(MaturityQuestion)
+            .values(
+                question_text=command.question_text,
+                question_type=command.question_type,
+                question_order=command.question_order,
+                category=command.category,
+                axis_id=command.axis_id,
+                industry_id=command.industry_id
+            )
+            .returning(MaturityQuestion.maturity_question_id)
         )
-        self.session.add(maturity_question)
         try:
-            await self.session.commit()
-            await self.session.refresh(maturity_question)
-            return maturity_question.maturity_question_id
+            result = await self.session.execute(stmt)
+            maturity_question_id = result.scalar_one()
+            await commit(self.session)
+            return maturity_question_id
         except IntegrityError as e:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError(f"Failed to create maturity question: {str(e)}")
 
+    async def bulk_create(
+        self,
+        command: BulkCreateMaturityQuestions
+    ) -> BulkCreateMaturityQuestionsResponse:
+        """Create maturity questions and their options in one transaction.
+
+        Questions and options are each written with batched multi-row
+        INSERTs. RETURNING is sorted by parameter order, so generated IDs
+        line up with the input.
+
+        Args:
+            command: BulkCreateMaturityQuestions command
+
+        Returns:
+            BulkCreateMaturityQuestionsResponse: Generated IDs in input order
+
+        Raises:
+            ValueError: If a question or option violates a constraint
+        """
+        question_rows = [
+            question.model_dump(exclude={'options'}) for question in command.questions
+        ]
+        try:
+            result = await self.session.execute(
+                insert(MaturityQuestion).returning(
+                    MaturityQuestion.maturity_question_id, sort_by_parameter_order=True),
+                question_rows
+            )
+            question_ids = result.scalars().all()
+
+            option_rows = [
+                {
+                    'maturity_question_id': question_id,
+                    'agent_id': option.agent_id,
+                    'response_text': option.response_text,
+                    'response_date': option.response_date
+                }
+                for question_id, question in zip(question_ids, command.questions)
+                for option in question.options
+            ]
+            option_ids = []
+            if option_rows:
+                result = await self.session.execute(
+                    insert(MaturityAgentResponse).returning(
+                        MaturityAgentResponse.maturity_agent_response_id,
+                        sort_by_parameter_order=True),
+                    option_rows
+                )
+                option_ids = result.scalars().all()
+                await refresh_catalog(self.session, question_ids)
+            await commit(self.session)
+        except IntegrityError as e:
+            await rollback(self.session)
+            raise ValueError(f"Failed to create maturity questions: {str(e)}")
+
+        created = []
+        position = 0
+        for question_id, question in zip(question_ids, command.questions):
+            created.append(BulkCreatedMaturityQuestion(
+                maturity_question_id=question_id,
+                option_ids=option_ids[position:position + len(question.options)]
+            ))
+            position += len(question.options)
+        return BulkCreateMaturityQuestionsResponse(questions=created)
+
     async def update(self, command: UpdateMaturityQuestion) -> bool:
         """Update an existing maturity question.
 
@@ -64,26 +174,29 @@ class MaturityQuestionRepository:
         Raises:
             ValueError: If validation fails
         """
-        stmt = select(MaturityQuestion).where(
-            MaturityQuestion.maturity_question_id == command.maturity_question_id)
-        result = await self.session.execute(stmt)
-        maturity_question = result.scalar_one_or_none()
-
-        if not maturity_question:
-            return False
-
-        maturity_question.question_text = command.question_text
-        maturity_question.question_type = command.question_type
-        maturity_question.question_order = command.question_order
-        maturity_question.category = command.category
-        maturity_question.axis_id = command.axis_id
-        maturity_question.industry_id = command.industry_id
+        stmt = (
+            update(MaturityQuestion)
+            .where(MaturityQuestion.maturity_question_id == command.maturity_question_id)
+            .values(
+                question_text=command.question_text,
+                question_type=command.question_type,
+                question_order=command.question_order,
+                category=command.category,
+                axis_id=command.axis_id,
+                industry_id=command.industry_id
+            )
+            .returning(MaturityQuestion.maturity_question_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await refresh_catalog(self.session, [command.maturity_question_id])
+            await commit(self.session)
             return True
         except IntegrityError as e:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError(f"Failed to update maturity question: {str(e)}")
 
     async def delete(self, maturity_question_id: int) -> bool:
@@ -95,16 +208,12 @@ class MaturityQuestionRepository:
         Returns:
             bool: True if deletion was successful
         """
-        stmt = select(MaturityQuestion).where(
-            MaturityQuestion.maturity_question_id == maturity_question_id)
+        stmt = delete(MaturityQuestion).where(MaturityQuestion.maturity_question_id == maturity_question_id).returning(MaturityQuestion.maturity_question_id)
         result = await self.session.execute(stmt)
-        maturity_question = result.scalar_one_or_none()
-
-        if not maturity_question:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(maturity_question)
-        await self.session.commit()
+        # The question's catalog row is removed by ON DELETE CASCADE.
+        await commit(self.session)
         return True
 
     async def get(self, command: GetMaturityQuestion) -> Optional[MaturityQuestionResponse]:
@@ -116,31 +225,38 @@ class MaturityQuestionRepository:
         Returns:
             Optional[MaturityQuestionResponse]: Maturity question data if found, None otherwise
         """
-        stmt = select(MaturityQuestion)
-        conditions = []
-
-        if command.maturity_question_id:
-            conditions.append(
-                MaturityQuestion.maturity_question_id == command.maturity_question_id)
-        if command.category:
-            conditions.append(MaturityQuestion.category == command.category)
-        if command.question_type:
-            conditions.append(
-                MaturityQuestion.question_type == command.question_type)
-        if command.axis_id:
-            conditions.append(MaturityQuestion.axis_id == command.axis_id)
-        if command.industry_id:
-            conditions.append(MaturityQuestion.industry_id == command.industry_id)
-
-        if conditions:
-            stmt = stmt.where(*conditions)
+        maturity_question_id = command.maturity_question_id
+        category = command.category
+        question_type = command.question_type
+        axis_id = command.axis_id
+        industry_id = command.industry_id
+        fields = command.fields
+
+        # Lambda statements are cached per filter combination, so repeated
+        # lookups skip building and compiling the SELECT.
+        stmt = select_fields(MaturityQuestion, fields)
+        if maturity_question_id:
+            stmt += lambda s: s.where(
+                MaturityQuestion.maturity_question_id == maturity_question_id)
+        if category:
+            stmt += lambda s: s.where(MaturityQuestion.category == category)
+        if question_type:
+            stmt += lambda s: s.where(
+                MaturityQuestion.question_type == question_type)
+        if axis_id:
+            stmt += lambda s: s.where(MaturityQuestion.axis_id == axis_id)
+        if industry_id:
+            stmt += lambda s: s.where(MaturityQuestion.industry_id == industry_id)
 
         result = await self.session.execute(stmt)
-        maturity_question = result.scalar_one_or_none()
+        maturity_question = fetch_one(result, fields)
 
         if not maturity_question:
             return None
 
+        if fields:
+            return to_response(MaturityQuestionResponse, maturity_question, fields)
+
         return MaturityQuestionResponse(
             maturity_question_id=maturity_question.maturity_question_id,
             question_text=maturity_question.question_text,
@@ -151,36 +267,75 @@ class MaturityQuestionRepository:
             industry_id=maturity_question.industry_id
         )
 
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[MaturityQuestionResponse], List[int]]:
+        """Get maturity questions by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the maturity questions
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[MaturityQuestionResponse], List[int]]: Maturity questions found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(MaturityQuestion, ids, fields))
+        questions, missing = in_order(fetch_all(result, fields), "maturity_question_id", ids)
+        return [to_response(MaturityQuestionResponse, question, fields) for question in questions], missing
+
     async def list_all(
         self,
         category: Optional[str] = None,
         question_type: Optional[str] = None,
         axis_id: Optional[int] = None,
-        industry_id: Optional[int] = None
-    ) -> List[MaturityQuestionResponse]:
+        industry_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[MaturityQuestionResponse], Optional[str], Optional[int]]:
         """List all maturity questions, optionally filtered.
 
         Args:
             category: Optional category filter
             question_type: Optional question type filter
             axis_id: Optional axis ID filter
+            limit: Optional page size
+            after: Optional key of the last question of the previous page
+            fields: Optional columns to return
+            count: How to compute the total
 
         Returns:
-            List[MaturityQuestionResponse]: List of maturity questions
+            Tuple[List[MaturityQuestionResponse], Optional[str], Optional[int]]: Page of
+            maturity questions and the cursor of the next page
+            and the total, if requested
         """
-        stmt = select(MaturityQuestion)
+        stmt = select_fields(MaturityQuestion, fields)
 
         if category:
-            stmt = stmt.where(MaturityQuestion.category == category)
+            stmt += lambda s: s.where(MaturityQuestion.category == category)
         if question_type:
-            stmt = stmt.where(MaturityQuestion.question_type == question_type)
+            stmt += lambda s: s.where(MaturityQuestion.question_type == question_type)
         if axis_id:
-            stmt = stmt.where(MaturityQuestion.axis_id == axis_id)
+            stmt += lambda s: s.where(MaturityQuestion.axis_id == axis_id)
         if industry_id:
-            stmt = stmt.where(MaturityQuestion.industry_id == industry_id)
+            stmt += lambda s: s.where(MaturityQuestion.industry_id == industry_id)
+        total = await count_rows(
+            self.session, stmt, MaturityQuestion.__tablename__, count,
+            filtered=bool(category or question_type or axis_id or industry_id))
+        stmt = keyset(stmt, MaturityQuestion.maturity_question_id, limit, after)
 
         result = await self.session.execute(stmt)
-        maturity_questions = result.scalars().all()
+        maturity_questions, next_cursor = page(
+            fetch_all(result, fields), "maturity_question_id", limit)
+
+        if fields:
+            return [
+                to_response(MaturityQuestionResponse, q, fields) for q in maturity_questions
+            ], next_cursor, total
 
         return [
             MaturityQuestionResponse(
@@ -193,7 +348,7 @@ class MaturityQuestionRepository:
                 industry_id=q.industry_id
             )
             for q in maturity_questions
-        ]
+        ], next_cursor, total
 
     async def get_questions_with_response(
         self,
@@ -205,55 +360,56 @@ class MaturityQuestionRepository:
     ) -> List[Question]:
         """
         Get questions with options derived from existing agent responses.
+
+        Reads the precomputed catalog, so starting a survey costs one
+        indexed scan however many options the questions have. Until the
+        catalog has been backfilled, the options are aggregated live.
         
         Returns:
             List[Question]: List of questions with their unique response options
         """
-        where_clauses = []
-        params = {}
-        
+        if not await catalog_ready(self.session):
+            params = {
+                name: value for name, value in (
+                    ('category', category),
+                    ('question_type', question_type),
+                    ('axis_id', axis_id),
+                    ('industry_id', industry_id),
+                    ('maturity_question_id', maturity_question_id),
+                ) if value
+            }
+            query = _questions_with_response_query(tuple(params))
+            result = await self.session.execute(query, params)
+            return self._to_questions(result.all())
+
+        # Lambda statements are cached per filter combination, so repeated
+        # lookups skip building and compiling the SELECT.
+        stmt = lambda_stmt(lambda: select(MaturityQuestionCatalog))
         if category:
-            where_clauses.append("mq.category = :category")
-            params['category'] = category
+            stmt += lambda s: s.where(MaturityQuestionCatalog.category == category)
         if question_type:
-            where_clauses.append("mq.question_type = :question_type")
-            params['question_type'] = question_type
+            stmt += lambda s: s.where(MaturityQuestionCatalog.question_type == question_type)
         if axis_id:
-            where_clauses.append("mq.axis_id = :axis_id")
-            params['axis_id'] = axis_id
+            stmt += lambda s: s.where(MaturityQuestionCatalog.axis_id == axis_id)
         if industry_id:
-            where_clauses.append("mq.industry_id = :industry_id")
-            params['industry_id'] = industry_id
+            stmt += lambda s: s.where(MaturityQuestionCatalog.industry_id == industry_id)
         if maturity_question_id:
-            where_clauses.append("mq.maturity_question_id = :maturity_question_id")
-            params['maturity_question_id'] = maturity_question_id
-        
-        where_clause = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
-        schema = DatabaseSettings().local_settings.DB_SCHEMA
-        query = text(f"""
-            SELECT 
-                mq.maturity_question_id AS id,
-                mq.question_text,
-                json_agg(json_build_object(
-                    'id', mar.maturity_agent_response_id,
-                    'text', mar.response_text,
-                    'score', 0 
-                )) options
-            FROM {schema}.maturity_questions mq 
-            JOIN {schema}.maturity_agent_responses mar ON mq.maturity_question_id = mar.maturity_question_id
-            LEFT JOIN {schema}.industries i ON mq.industry_id = i.industry_id
-            LEFT JOIN {schema}.ambitus a ON a.ambitus_id = mq.ambitus_id
-            {where_clause}
-            GROUP BY mq.maturity_question_id, mq.question_text, mq.ambitus_id, mq.question_order
-            ORDER BY mq.ambitus_id, mq.question_order
-        """)
-        
-        result = await self.session.execute(query, params)
+            stmt += lambda s: s.where(
+                MaturityQuestionCatalog.maturity_question_id == maturity_question_id)
+        stmt += lambda s: s.order_by(
+            MaturityQuestionCatalog.ambitus_id, MaturityQuestionCatalog.question_order)
+
+        result = await self.session.execute(stmt)
+        return self._to_questions(result.scalars().all())
+
+    @staticmethod
+    def _to_questions(docs) -> List[Question]:
+        """Build survey questions from catalog rows or live aggregates."""
         return [
 
             # Create Question object
             Question(
-                id=doc.id,
+                id=doc.maturity_question_id,
                 text=doc.question_text,
                 options=[
                     QuestionOption(
@@ -266,6 +422,6 @@ class MaturityQuestionRepository:
                 category=None,
                 subset=None
             )
-            for doc in result.all()
+            for doc in docs
         ]
         
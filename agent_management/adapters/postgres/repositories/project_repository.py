@@ -1,10 +1,14 @@
 """Repository implementation for project operations."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.project_command import CreateProject, UpdateProject, GetProject, ProjectResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.project import Project
 
 
@@ -17,58 +21,61 @@ class ProjectRepository:
 
     async def create(self, command: CreateProject) -> int:
         """Create a new project."""
-        project = Project(
-            project_name=command.project_name,
-            description=command.description,
-            company_id=command.company_id
+        stmt = (
+            insert(Project)
+            .values(
+                project_name=command.project_name,
+                description=command.description,
+                company_id=command.company_id
+            )
+            .returning(Project.project_id)
         )
-        self.session.add(project)
         try:
-            await self.session.commit()
-            await self.session.refresh(project)
-            return project.project_id
+            result = await self.session.execute(stmt)
+            project_id = result.scalar_one()
+            await commit(self.session)
+            return project_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError(
                 "Project name already exists for this company or invalid company ID")
 
     async def update(self, command: UpdateProject) -> bool:
         """Update an existing project."""
-        stmt = select(Project).where(Project.project_id == command.project_id)
-        result = await self.session.execute(stmt)
-        project = result.scalar_one_or_none()
-
-        if not project:
-            return False
-
-        project.project_name = command.project_name
-        project.description = command.description
-        project.company_id = command.company_id
+        stmt = (
+            update(Project)
+            .where(Project.project_id == command.project_id)
+            .values(
+                project_name=command.project_name,
+                description=command.description,
+                company_id=command.company_id
+            )
+            .returning(Project.project_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError(
                 "Project name already exists for this company or invalid company ID")
 
     async def delete(self, project_id: int) -> bool:
         """Delete a project."""
-        stmt = select(Project).where(Project.project_id == project_id)
+        stmt = delete(Project).where(Project.project_id == project_id).returning(Project.project_id)
         result = await self.session.execute(stmt)
-        project = result.scalar_one_or_none()
-
-        if not project:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(project)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetProject) -> Optional[ProjectResponse]:
         """Get a project by ID, name, or company_id."""
-        stmt = select(Project)
+        stmt = select(*selection(Project, command.fields))
         if command.project_id:
             stmt = stmt.where(Project.project_id == command.project_id)
         elif command.project_name and command.company_id:
@@ -80,14 +87,43 @@ class ProjectRepository:
             return None
 
         result = await self.session.execute(stmt)
-        project = result.scalar_one_or_none()
-        return ProjectResponse.model_validate(project) if project else None
+        project = fetch_one(result, command.fields)
+        return to_response(ProjectResponse, project, command.fields) if project else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[ProjectResponse], List[int]]:
+        """Get projects by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the projects
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[ProjectResponse], List[int]]: Projects found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Project, ids, fields))
+        projects, missing = in_order(fetch_all(result, fields), "project_id", ids)
+        return [to_response(ProjectResponse, project, fields) for project in projects], missing
 
-    async def list(self, company_id: Optional[int] = None) -> List[ProjectResponse]:
-        """List all projects, optionally filtered by company_id."""
-        stmt = select(Project)
+    async def list(
+        self,
+        company_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[ProjectResponse], Optional[str], Optional[int]]:
+        """List all projects, optionally filtered by company_id, a page at a time when ``limit`` is given."""
+        stmt = select_fields(Project, fields)
         if company_id:
-            stmt = stmt.where(Project.company_id == company_id)
+            stmt += lambda s: s.where(Project.company_id == company_id)
+        total = await count_rows(
+            self.session, stmt, Project.__tablename__, count, filtered=bool(company_id))
+        stmt = keyset(stmt, Project.project_id, limit, after)
         result = await self.session.execute(stmt)
-        projects = result.scalars().all()
-        return [ProjectResponse.model_validate(project) for project in projects]
+        projects, next_cursor = page(fetch_all(result, fields), "project_id", limit)
+        return [to_response(ProjectResponse, project, fields) for project in projects], next_cursor, total
@@ -1,6 +1,6 @@
 """Repository implementation for project operations."""
 from typing import Optional, List
-from sqlalchemy import select, and_, join, outerjoin
+from sqlalchemy import func, select, and_, join, outerjoin
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -9,6 +9,7 @@ from adapters.postgres.models.project import Project
 from adapters.postgres.models.domain import Domain
 from adapters.postgres.models.subdomain import Subdomain
 from adapters.postgres.models.company import Company
+from adapters.postgres.repositories.user_repository import normalize_email
 from domain.command.user_command import GetUser
 from domain.command.registration_command import RegistrationResponse
 
@@ -39,15 +40,17 @@ class RegistrationRepository:
         #         .outerjoin(Project, Project.company_id == Company.company_id)                
         #         .where(User.email == command.email)
         # )
+        if not command.email:
+            return None
+        # Exact match on lower(email), served by its unique index.
         stmt = (
             select(
                 User.email,
                 User.user_id,
                 User.user_name.label('responsible')
             )
-            .where(User.email.ilike(f"%{command.email}%"))
-            .order_by(User.user_name)
-            .limit(1)
+            .where(func.lower(User.email) == normalize_email(command.email))
         )
         result = await self.session.execute(stmt)
-        return RegistrationResponse.model_validate(result.fetchone()) if result else None
+        row = result.first()
+        return RegistrationResponse.model_validate(row) if row else None
@@ -1,10 +1,14 @@
 """Repository implementation for role operations."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.role_command import CreateRole, UpdateRole, GetRole, RoleResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.role import Role
 
 
@@ -17,54 +21,57 @@ class RoleRepository:
 
     async def create(self, command: CreateRole) -> int:
         """Create a new role."""
-        role = Role(
-            role_name=command.role_name,
-            description=command.description
+        stmt = (
+            insert(Role)
+            .values(
+                role_name=command.role_name,
+                description=command.description
+            )
+            .returning(Role.role_id)
         )
-        self.session.add(role)
         try:
-            await self.session.commit()
-            await self.session.refresh(role)
-            return role.role_id
+            result = await self.session.execute(stmt)
+            role_id = result.scalar_one()
+            await commit(self.session)
+            return role_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Role name already exists")
 
     async def update(self, command: UpdateRole) -> bool:
         """Update an existing role."""
-        stmt = select(Role).where(Role.role_id == command.role_id)
-        result = await self.session.execute(stmt)
-        role = result.scalar_one_or_none()
-
-        if not role:
-            return False
-
-        role.role_name = command.role_name
-        role.description = command.description
+        stmt = (
+            update(Role)
+            .where(Role.role_id == command.role_id)
+            .values(
+                role_name=command.role_name,
+                description=command.description
+            )
+            .returning(Role.role_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Role name already exists")
 
     async def delete(self, role_id: int) -> bool:
         """Delete a role."""
-        stmt = select(Role).where(Role.role_id == role_id)
+        stmt = delete(Role).where(Role.role_id == role_id).returning(Role.role_id)
         result = await self.session.execute(stmt)
-        role = result.scalar_one_or_none()
-
-        if not role:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(role)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetRole) -> Optional[RoleResponse]:
         """Get a role by ID or name."""
-        stmt = select(Role)
+        stmt = select(*selection(Role, command.fields))
         if command.role_id:
             stmt = stmt.where(Role.role_id == command.role_id)
         elif command.role_name:
@@ -73,12 +80,40 @@ class RoleRepository:
             return None
 
         result = await self.session.execute(stmt)
-        role = result.scalar_one_or_none()
-        return RoleResponse.model_validate(role) if role else None
+        role = fetch_one(result, command.fields)
+        return to_response(RoleResponse, role, command.fields) if role else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[RoleResponse], List[int]]:
+        """Get roles by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the roles
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[RoleResponse], List[int]]: Roles found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Role, ids, fields))
+        roles, missing = in_order(fetch_all(result, fields), "role_id", ids)
+        return [to_response(RoleResponse, role, fields) for role in roles], missing
 
-    async def list(self) -> List[RoleResponse]:
-        """List all roles."""
-        stmt = select(Role)
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[RoleResponse], Optional[str], Optional[int]]:
+        """List roles, one page at a time when ``limit`` is given."""
+        stmt = select_fields(Role, fields)
+        total = await count_rows(
+            self.session, stmt, Role.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, Role.role_id, limit, after)
         result = await self.session.execute(stmt)
-        roles = result.scalars().all()
-        return [RoleResponse.model_validate(role) for role in roles]
+        roles, next_cursor = page(fetch_all(result, fields), "role_id", limit)
+        return [to_response(RoleResponse, role, fields) for role in roles], next_cursor, total
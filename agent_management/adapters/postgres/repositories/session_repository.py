@@ -1,11 +1,15 @@
 """Repository implementation for session operations."""
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import select, and_
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, and_, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.session_command import CreateSession, UpdateSession, GetSession, SessionResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.session import Session
 
 
@@ -18,93 +22,130 @@ class SessionRepository:
 
     async def create(self, command: CreateSession) -> int:
         """Create a new session."""
-        session = Session(
-            user_id=command.user_id,
-            session_token=command.session_token,
-            is_active=command.is_active,
-            session_start=command.session_start,
-            session_end=command.session_end
+        stmt = (
+            insert(Session)
+            .values(
+                user_id=command.user_id,
+                session_token=command.session_token,
+                is_active=command.is_active,
+                session_start=command.session_start,
+                session_end=command.session_end
+            )
+            .returning(Session.session_id)
         )
-        self.session.add(session)
         try:
-            await self.session.commit()
-            await self.session.refresh(session)
-            return session.session_id
+            result = await self.session.execute(stmt)
+            session_id = result.scalar_one()
+            await commit(self.session)
+            return session_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Session token already exists or invalid user_id")
 
     async def update(self, command: UpdateSession) -> bool:
         """Update an existing session."""
-        stmt = select(Session).where(Session.session_id == command.session_id)
-        result = await self.session.execute(stmt)
-        session = result.scalar_one_or_none()
-
-        if not session:
-            return False
-
-        session.user_id = command.user_id
-        session.session_token = command.session_token
-        session.is_active = command.is_active
-        session.session_end = command.session_end
+        stmt = (
+            update(Session)
+            .where(Session.session_id == command.session_id)
+            .values(
+                user_id=command.user_id,
+                session_token=command.session_token,
+                is_active=command.is_active,
+                session_end=command.session_end
+            )
+            .returning(Session.session_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Session token already exists or invalid user_id")
 
     async def delete(self, session_id: int) -> bool:
         """Delete a session."""
-        stmt = select(Session).where(Session.session_id == session_id)
+        stmt = delete(Session).where(Session.session_id == session_id).returning(Session.session_id)
         result = await self.session.execute(stmt)
-        session = result.scalar_one_or_none()
-
-        if not session:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(session)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetSession) -> Optional[SessionResponse]:
         """Get a session by ID, token, or user_id."""
-        stmt = select(Session)
-        if command.session_id:
-            stmt = stmt.where(Session.session_id == command.session_id)
-        elif command.session_token:
-            stmt = stmt.where(Session.session_token == command.session_token)
-        elif command.user_id:
-            stmt = stmt.where(Session.user_id == command.user_id)
+        session_id = command.session_id
+        session_token = command.session_token
+        user_id = command.user_id
+        fields = command.fields
+
+        # Lambda statements are cached per lookup column, so repeated lookups
+        # skip building and compiling the SELECT.
+        stmt = select_fields(Session, fields)
+        if session_id:
+            stmt += lambda s: s.where(Session.session_id == session_id)
+        elif session_token:
+            stmt += lambda s: s.where(Session.session_token == session_token)
+        elif user_id:
+            stmt += lambda s: s.where(Session.user_id == user_id)
         else:
             return None
 
         result = await self.session.execute(stmt)
-        session = result.scalar_one_or_none()
-        return SessionResponse.model_validate(session) if session else None
-
-    async def list_all(self, active_only: bool = False) -> List[SessionResponse]:
-        """List all sessions, optionally filtering for active ones only."""
-        stmt = select(Session)
+        session = fetch_one(result, fields)
+        return to_response(SessionResponse, session, fields) if session else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[SessionResponse], List[int]]:
+        """Get sessions by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the sessions
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[SessionResponse], List[int]]: Sessions found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Session, ids, fields))
+        sessions, missing = in_order(fetch_all(result, fields), "session_id", ids)
+        return [to_response(SessionResponse, session, fields) for session in sessions], missing
+
+    async def list_all(
+        self,
+        active_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[SessionResponse], Optional[str], Optional[int]]:
+        """List all sessions, optionally filtering for active ones only, a page at a time when ``limit`` is given."""
+        stmt = select_fields(Session, fields)
         if active_only:
-            stmt = stmt.where(Session.is_active == True)
+            stmt += lambda s: s.where(Session.is_active == True)
+        total = await count_rows(
+            self.session, stmt, Session.__tablename__, count, filtered=active_only)
+        stmt = keyset(stmt, Session.session_id, limit, after)
         result = await self.session.execute(stmt)
-        sessions = result.scalars().all()
-        return [SessionResponse.model_validate(session) for session in sessions]
+        sessions, next_cursor = page(fetch_all(result, fields), "session_id", limit)
+        return [to_response(SessionResponse, session, fields) for session in sessions], next_cursor, total
 
     async def deactivate(self, session_id: int) -> bool:
         """Deactivate a session."""
-        stmt = select(Session).where(
-            and_(Session.session_id == session_id, Session.is_active == True)
+        stmt = (
+            update(Session)
+            .where(and_(Session.session_id == session_id, Session.is_active == True))
+            .values(is_active=False, session_end=datetime.utcnow())
+            .returning(Session.session_id)
         )
         result = await self.session.execute(stmt)
-        session = result.scalar_one_or_none()
-
-        if not session:
+        if result.scalar_one_or_none() is None:
             return False
-
-        session.is_active = False
-        session.session_end = datetime.utcnow()
-        await self.session.commit()
+        await commit(self.session)
         return True
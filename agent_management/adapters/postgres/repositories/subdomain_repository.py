@@ -1,10 +1,14 @@
 """Repository implementation for subdomain operations."""
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.subdomain_command import CreateSubdomain, UpdateSubdomain, GetSubdomain, SubdomainResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.subdomain import Subdomain
 
 
@@ -17,55 +21,57 @@ class SubdomainRepository:
 
     async def create(self, command: CreateSubdomain) -> int:
         """Create a new subdomain."""
-        subdomain = Subdomain(
-            subdomain_name=command.subdomain_name,
-            domain_id=command.domain_id
+        stmt = (
+            insert(Subdomain)
+            .values(
+                subdomain_name=command.subdomain_name,
+                domain_id=command.domain_id
+            )
+            .returning(Subdomain.subdomain_id)
         )
-        self.session.add(subdomain)
         try:
-            await self.session.commit()
-            await self.session.refresh(subdomain)
-            return subdomain.subdomain_id
+            result = await self.session.execute(stmt)
+            subdomain_id = result.scalar_one()
+            await commit(self.session)
+            return subdomain_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Subdomain name already exists in this domain")
 
     async def update(self, command: UpdateSubdomain) -> bool:
         """Update an existing subdomain."""
-        stmt = select(Subdomain).where(
-            Subdomain.subdomain_id == command.subdomain_id)
-        result = await self.session.execute(stmt)
-        subdomain = result.scalar_one_or_none()
-
-        if not subdomain:
-            return False
-
-        subdomain.subdomain_name = command.subdomain_name
-        subdomain.domain_id = command.domain_id
+        stmt = (
+            update(Subdomain)
+            .where(Subdomain.subdomain_id == command.subdomain_id)
+            .values(
+                subdomain_name=command.subdomain_name,
+                domain_id=command.domain_id
+            )
+            .returning(Subdomain.subdomain_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Subdomain name already exists in this domain")
 
     async def delete(self, subdomain_id: int) -> bool:
         """Delete a subdomain."""
-        stmt = select(Subdomain).where(Subdomain.subdomain_id == subdomain_id)
+        stmt = delete(Subdomain).where(Subdomain.subdomain_id == subdomain_id).returning(Subdomain.subdomain_id)
         result = await self.session.execute(stmt)
-        subdomain = result.scalar_one_or_none()
-
-        if not subdomain:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(subdomain)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetSubdomain) -> Optional[SubdomainResponse]:
         """Get a subdomain by ID, name, or domain_id."""
-        stmt = select(Subdomain)
+        stmt = select(*selection(Subdomain, command.fields))
         if command.subdomain_id:
             stmt = stmt.where(Subdomain.subdomain_id == command.subdomain_id)
         elif command.subdomain_name and command.domain_id:
@@ -77,14 +83,43 @@ class SubdomainRepository:
             return None
 
         result = await self.session.execute(stmt)
-        subdomain = result.scalar_one_or_none()
-        return SubdomainResponse.model_validate(subdomain) if subdomain else None
+        subdomain = fetch_one(result, command.fields)
+        return to_response(SubdomainResponse, subdomain, command.fields) if subdomain else None
+
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[SubdomainResponse], List[int]]:
+        """Get subdomains by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the subdomains
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[SubdomainResponse], List[int]]: Subdomains found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(Subdomain, ids, fields))
+        subdomains, missing = in_order(fetch_all(result, fields), "subdomain_id", ids)
+        return [to_response(SubdomainResponse, subdomain, fields) for subdomain in subdomains], missing
 
-    async def list_all(self, domain_id: Optional[int] = None) -> List[SubdomainResponse]:
-        """List all subdomains, optionally filtered by domain_id."""
-        stmt = select(Subdomain)
+    async def list_all(
+        self,
+        domain_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[SubdomainResponse], Optional[str], Optional[int]]:
+        """List all subdomains, optionally filtered by domain_id, a page at a time when ``limit`` is given."""
+        stmt = select_fields(Subdomain, fields)
         if domain_id:
-            stmt = stmt.where(Subdomain.domain_id == domain_id)
+            stmt += lambda s: s.where(Subdomain.domain_id == domain_id)
+        total = await count_rows(
+            self.session, stmt, Subdomain.__tablename__, count, filtered=bool(domain_id))
+        stmt = keyset(stmt, Subdomain.subdomain_id, limit, after)
         result = await self.session.execute(stmt)
-        subdomains = result.scalars().all()
-        return [SubdomainResponse.model_validate(subdomain) for subdomain in subdomains]
+        subdomains, next_cursor = page(fetch_all(result, fields), "subdomain_id", limit)
+        return [to_response(SubdomainResponse, subdomain, fields) for subdomain in subdomains], next_cursor, total
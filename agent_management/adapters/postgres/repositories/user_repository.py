@@ -1,12 +1,26 @@
 """Repository implementation for user operations."""
-from typing import Optional, List
-from sqlalchemy import select
+import re
+from typing import Optional, List, Tuple, Sequence
+from sqlalchemy import func, select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from domain.command.user_command import CreateUser, UpdateUser, GetUser, UserResponse
+from adapters.postgres.config import commit, rollback
+from adapters.postgres.batch import in_order, select_many
+from adapters.postgres.fieldsets import fetch_all, fetch_one, select_fields, selection, to_response
+from adapters.postgres.pagination import Count, count_rows, keyset, page
 from adapters.postgres.models.user import User
 
+# Shortest search term the trigram index can narrow down; shorter terms
+# would read every user.
+MIN_SEARCH_LENGTH = 3
+
+
+def normalize_email(email: str) -> str:
+    """Email as matched by lower(email) lookups."""
+    return email.strip().lower()
+
 
 class UserRepository:
     """Repository for user operations."""
@@ -17,72 +31,128 @@ class UserRepository:
 
     async def create(self, command: CreateUser) -> int:
         """Create a new user."""
-        user = User(
-            user_name=command.user_name,
-            email=command.email,
-            role_id=command.role_id,
-            company_id=command.company_id
+        stmt = (
+            insert(User)
+            .values(
+                user_name=command.user_name,
+                email=command.email,
+                role_id=command.role_id,
+                company_id=command.company_id
+            )
+            .returning(User.user_id)
         )
-        self.session.add(user)
         try:
-            await self.session.commit()
-            await self.session.refresh(user)
-            return user.user_id
+            result = await self.session.execute(stmt)
+            user_id = result.scalar_one()
+            await commit(self.session)
+            return user_id
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Email already exists or invalid role/company ID")
 
     async def update(self, command: UpdateUser) -> bool:
         """Update an existing user."""
-        stmt = select(User).where(User.user_id == command.user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            return False
-
-        user.user_name = command.user_name
-        user.email = command.email
-        user.role_id = command.role_id
-        user.company_id = command.company_id
+        stmt = (
+            update(User)
+            .where(User.user_id == command.user_id)
+            .values(
+                user_name=command.user_name,
+                email=command.email,
+                role_id=command.role_id,
+                company_id=command.company_id
+            )
+            .returning(User.user_id)
+        )
 
         try:
-            await self.session.commit()
+            result = await self.session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                return False
+            await commit(self.session)
             return True
         except IntegrityError:
-            await self.session.rollback()
+            await rollback(self.session)
             raise ValueError("Email already exists or invalid role/company ID")
 
     async def delete(self, user_id: int) -> bool:
         """Delete a user."""
-        stmt = select(User).where(User.user_id == user_id)
+        stmt = delete(User).where(User.user_id == user_id).returning(User.user_id)
         result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
+        if result.scalar_one_or_none() is None:
             return False
-
-        await self.session.delete(user)
-        await self.session.commit()
+        await commit(self.session)
         return True
 
     async def get(self, command: GetUser) -> Optional[UserResponse]:
         """Get a user by ID or email."""
-        stmt = select(User)
+        stmt = select(*selection(User, command.fields))
         if command.user_id:
             stmt = stmt.where(User.user_id == command.user_id)
         elif command.email:
-            stmt = stmt.where(User.email == command.email)
+            stmt = stmt.where(func.lower(User.email) == normalize_email(command.email))
         else:
             return None
 
         result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
-        return UserResponse.model_validate(user) if user else None
+        user = fetch_one(result, command.fields)
+        return to_response(UserResponse, user, command.fields) if user else None
 
-    async def list(self) -> List[UserResponse]:
-        """List all users."""
-        stmt = select(User)
+    async def get_many(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[UserResponse], List[int]]:
+        """Get users by ID in one query, in the order of ``ids``.
+
+        Args:
+            ids: IDs of the users
+            fields: Optional columns to return
+
+        Returns:
+            Tuple[List[UserResponse], List[int]]: Users found
+            and the IDs that matched none
+        """
+        result = await self.session.execute(select_many(User, ids, fields))
+        users, missing = in_order(fetch_all(result, fields), "user_id", ids)
+        return [to_response(UserResponse, user, fields) for user in users], missing
+
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        count: Count = "none"
+    ) -> Tuple[List[UserResponse], Optional[str], Optional[int]]:
+        """List users, one page at a time when ``limit`` is given."""
+        stmt = select_fields(User, fields)
+        total = await count_rows(
+            self.session, stmt, User.__tablename__, count, filtered=False)
+        stmt = keyset(stmt, User.user_id, limit, after)
+        result = await self.session.execute(stmt)
+        users, next_cursor = page(fetch_all(result, fields), "user_id", limit)
+        return [to_response(UserResponse, user, fields) for user in users], next_cursor, total
+
+    async def search(self, email: str, limit: int = 20) -> List[UserResponse]:
+        """Find users whose email contains ``email``, shortest emails first.
+
+        Matching ignores case and is served by the trigram index on email,
+        for terms of at least ``MIN_SEARCH_LENGTH`` characters. Among emails
+        containing the term, the shortest are the closest matches.
+
+        Args:
+            email: Part of the email to look for
+            limit: Maximum number of users to return
+
+        Returns:
+            List[UserResponse]: Matching users, closest first
+        """
+        term = email.strip()
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", term) + "%"
+        stmt = (
+            select(User)
+            .where(User.email.ilike(pattern, escape="\\"))
+            .order_by(func.length(User.email), User.user_id)
+            .limit(limit)
+        )
         result = await self.session.execute(stmt)
-        users = result.scalars().all()
-        return [UserResponse.model_validate(user) for user in users]
+        return [to_response(UserResponse, user) for user in result.scalars()]
@@ -0,0 +1,185 @@
+"""Connection pool and statement telemetry for the database engines."""
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict, fields
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+EMF_NAMESPACE = "Dominiq/AgentManagement"
+
+
+@dataclass
+class _Counters:
+    """Counters accumulated from engine and pool events."""
+    checkouts: int = 0
+    checkout_wait_ms: float = 0.0
+    max_checkout_wait_ms: float = 0.0
+    pre_ping_failures: int = 0
+    invalidations: int = 0
+    statements: int = 0
+    statement_errors: int = 0
+    statement_ms: float = 0.0
+    max_statement_ms: float = 0.0
+    slow_statements: int = 0
+
+
+# Totals since process start, and the window since the last EMF emission.
+_totals = _Counters()
+_window = _Counters()
+_engines: Dict[str, AsyncEngine] = {}
+
+
+def _record_checkout(wait_ms: float) -> None:
+    for counters in (_totals, _window):
+        counters.checkouts += 1
+        counters.checkout_wait_ms += wait_ms
+        counters.max_checkout_wait_ms = max(counters.max_checkout_wait_ms, wait_ms)
+
+
+def _record_statement(duration_ms: float, slow_ms: float) -> None:
+    for counters in (_totals, _window):
+        counters.statements += 1
+        counters.statement_ms += duration_ms
+        counters.max_statement_ms = max(counters.max_statement_ms, duration_ms)
+        if duration_ms >= slow_ms:
+            counters.slow_statements += 1
+
+
+def _increment(name: str) -> None:
+    for counters in (_totals, _window):
+        setattr(counters, name, getattr(counters, name) + 1)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_checkout((time.perf_counter() - started) * 1000)
+
+
+def instrument_engine(name: str, engine: AsyncEngine, slow_statement_ms: float) -> None:
+    """Register pool and statement listeners on an engine.
+
+    Args:
+        name: Label for the engine in metrics, e.g. ``primary`` or ``replica``
+        engine: Engine to instrument
+        slow_statement_ms: Statements at least this slow are counted and logged
+    """
+    _engines[name] = engine
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._telemetry_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_telemetry_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        _record_statement(duration_ms, slow_statement_ms)
+        if duration_ms >= slow_statement_ms:
+            logger.warning(f"Slow statement on {name} ({duration_ms:.1f} ms): {statement[:200]}")
+
+    @event.listens_for(sync_engine, "handle_error")
+    def count_error(context):
+        if getattr(context, "is_pre_ping", False):
+            _increment("pre_ping_failures")
+        else:
+            _increment("statement_errors")
+
+    @event.listens_for(sync_engine.pool, "invalidate")
+    def count_invalidation(dbapi_connection, connection_record, exception):
+        _increment("invalidations")
+
+
+def forget_engines() -> None:
+    """Stop reporting pool state for disposed engines."""
+    _engines.clear()
+
+
+def pool_status() -> Dict[str, dict]:
+    """Current pool gauges for every instrumented engine."""
+    status = {}
+    for name, engine in _engines.items():
+        pool = engine.sync_engine.pool
+        status[name] = {
+            "pool_class": type(pool).__name__,
+            "size": pool.size() if hasattr(pool, "size") else None,
+            "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+            "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+            "overflow": pool.overflow() if hasattr(pool, "overflow") else None
+        }
+    return status
+
+
+def snapshot() -> dict:
+    """Pool gauges and counters accumulated since the process started."""
+    return {
+        "pools": pool_status(),
+        **asdict(_totals)
+    }
+
+
+def reset() -> None:
+    """Zero all counters."""
+    for counters in (_totals, _window):
+        for field in fields(counters):
+            setattr(counters, field.name, field.default)
+
+
+def emit_emf() -> None:
+    """Print the counters since the last call in CloudWatch Embedded Metric Format.
+
+    Lambda serves one request per container at a time, so each emission
+    covers a single invocation. Pool gauges are reported for the primary.
+    """
+    global _window
+
+    window, _window = _window, _Counters()
+    values = {
+        "DbCheckouts": (window.checkouts, "Count"),
+        "DbCheckoutWaitMs": (window.checkout_wait_ms, "Milliseconds"),
+        "DbMaxCheckoutWaitMs": (window.max_checkout_wait_ms, "Milliseconds"),
+        "DbPrePingFailures": (window.pre_ping_failures, "Count"),
+        "DbInvalidations": (window.invalidations, "Count"),
+        "DbStatements": (window.statements, "Count"),
+        "DbStatementErrors": (window.statement_errors, "Count"),
+        "DbStatementMs": (window.statement_ms, "Milliseconds"),
+        "DbMaxStatementMs": (window.max_statement_ms, "Milliseconds"),
+        "DbSlowStatements": (window.slow_statements, "Count")
+    }
+    primary = pool_status().get("primary", {})
+    if primary.get("checked_out") is not None:
+        values["DbPoolCheckedOut"] = (primary["checked_out"], "Count")
+        values["DbPoolOverflow"] = (primary["overflow"], "Count")
+
+    record = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": EMF_NAMESPACE,
+                "Dimensions": [["FunctionName"]],
+                "Metrics": [
+                    {"Name": metric, "Unit": unit}
+                    for metric, (_, unit) in values.items()
+                ]
+            }]
+        },
+        "FunctionName": os.getenv("AWS_LAMBDA_FUNCTION_NAME", "local"),
+        **{metric: value for metric, (value, _) in values.items()}
+    }
+    print(json.dumps(record), flush=True)
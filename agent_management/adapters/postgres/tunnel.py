@@ -0,0 +1,96 @@
+"""SSH tunnel used to reach the database through a bastion host."""
+import atexit
+import logging
+import threading
+from typing import Optional
+
+from sshtunnel import SSHTunnelForwarder
+
+logger = logging.getLogger(__name__)
+
+
+class SSHTunnelManager:
+    """Keeps a single SSH tunnel per process and restarts it when it drops.
+
+    All database connections share the tunnel, which binds the configured
+    local port once and sends keepalive packets so idle bastion sessions are
+    not closed. The tunnel is stopped automatically at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        ssh_host: str,
+        ssh_port: int,
+        ssh_username: Optional[str],
+        ssh_pkey: Optional[str],
+        remote_host: str,
+        remote_port: int,
+        local_port: int,
+        keepalive_seconds: float = 30.0
+    ):
+        """Initialize with bastion and database addresses."""
+        self._ssh_address = (ssh_host, ssh_port)
+        self._ssh_username = ssh_username
+        self._ssh_pkey = ssh_pkey
+        self._remote_address = (remote_host, remote_port)
+        self._local_address = ('localhost', local_port)
+        self._keepalive_seconds = keepalive_seconds
+        self._forwarder: Optional[SSHTunnelForwarder] = None
+        self._lock = threading.Lock()
+        self._exit_hook_registered = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the SSH transport is up and the local forward accepts traffic."""
+        forwarder = self._forwarder
+        if forwarder is None or not forwarder.is_active:
+            return False
+        forwarder.check_tunnels()
+        return all(forwarder.tunnel_is_up.values())
+
+    def start(self) -> None:
+        """Start the tunnel unless it is already running."""
+        with self._lock:
+            if self._forwarder is not None:
+                return
+            self._forwarder = self._open()
+            if not self._exit_hook_registered:
+                atexit.register(self.stop)
+                self._exit_hook_registered = True
+
+    def ensure_running(self) -> None:
+        """Restart the tunnel if the SSH session or the forward has dropped."""
+        if self.is_running:
+            return
+        with self._lock:
+            if self.is_running:
+                return
+            logger.warning(f"SSH tunnel to {self._ssh_address[0]} is down, restarting")
+            self._close()
+            self._forwarder = self._open()
+
+    def stop(self) -> None:
+        """Stop the tunnel and release the local port."""
+        with self._lock:
+            self._close()
+
+    def _open(self) -> SSHTunnelForwarder:
+        forwarder = SSHTunnelForwarder(
+            self._ssh_address,
+            ssh_username=self._ssh_username,
+            ssh_pkey=self._ssh_pkey,
+            remote_bind_address=self._remote_address,
+            local_bind_address=self._local_address,
+            set_keepalive=self._keepalive_seconds
+        )
+        forwarder.start()
+        return forwarder
+
+    def _close(self) -> None:
+        if self._forwarder is None:
+            return
+        try:
+            self._forwarder.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop SSH tunnel: {str(e)}")
+        self._forwarder = None
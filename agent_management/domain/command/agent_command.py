@@ -1,5 +1,5 @@
 """Agent related commands and models."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -30,6 +30,7 @@ class GetAgent(BaseModel):
     agent_id: Optional[int] = Field(None, gt=0)
     agent_name: Optional[str] = None
     agent_type: Optional[str] = None
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class AgentResponse(AgentBase):
@@ -44,3 +45,6 @@ class AgentResponse(AgentBase):
 class ListAgents(BaseModel):
     """Response model for agent list."""
     agents: List[AgentResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
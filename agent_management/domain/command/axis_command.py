@@ -1,5 +1,5 @@
 """Command models for axis operations."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -27,6 +27,7 @@ class DeleteAxis(BaseModel):
 class GetAxis(BaseModel):
     """Command to get an axis by ID."""
     axis_id: int
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class AxisResponse(BaseModel):
@@ -42,3 +43,6 @@ class AxisResponse(BaseModel):
 class ListAxes(BaseModel):
     """Response model for listing axes."""
     axes: List[AxisResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
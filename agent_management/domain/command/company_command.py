@@ -1,5 +1,5 @@
 """Company related commands and models."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -30,6 +30,7 @@ class GetCompany(BaseModel):
     """Command for retrieving a company."""
     company_id: Optional[int] = None
     company_name: Optional[str] = None
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class CompanyResponse(BaseModel):
@@ -39,6 +40,49 @@ class CompanyResponse(BaseModel):
     industry_id: Optional[int] = None
 
 
+# Levels below the company: 1 adds its domains and projects, 2 the subdomains.
+MAX_TREE_DEPTH = 2
+
+
+class GetCompanyTree(BaseModel):
+    """Command for retrieving a company with its organization below it."""
+    company_id: int
+    depth: int = Field(MAX_TREE_DEPTH, ge=0, le=MAX_TREE_DEPTH)
+
+
+class SubdomainNode(BaseModel):
+    """Subdomain in a company tree."""
+    subdomain_id: int
+    subdomain_name: str
+
+
+class DomainNode(BaseModel):
+    """Domain in a company tree; subdomains are None below the depth asked for."""
+    domain_id: int
+    domain_name: str
+    subdomains: Optional[List[SubdomainNode]] = None
+
+
+class ProjectNode(BaseModel):
+    """Project in a company tree."""
+    project_id: int
+    project_name: str
+    description: Optional[str] = None
+
+
+class CompanyTree(CompanyResponse):
+    """Company with its domains, their subdomains, and its projects.
+
+    Levels below the depth asked for are None; levels without rows are
+    empty lists.
+    """
+    domains: Optional[List[DomainNode]] = None
+    projects: Optional[List[ProjectNode]] = None
+
+
 class ListCompanies(BaseModel):
     """Response model for company list."""
     companies: List[CompanyResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
@@ -1,6 +1,6 @@
 """Domain agent response related commands and models."""
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -32,6 +32,7 @@ class GetDomainAgentResponse(BaseModel):
     domain_agent_response_id: Optional[int] = Field(None, gt=0)
     agent_id: Optional[int] = Field(None, gt=0)
     domain_question_id: Optional[int] = Field(None, gt=0)
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class DomainAgentResponseData(DomainAgentResponseBase):
@@ -46,3 +47,6 @@ class DomainAgentResponseData(DomainAgentResponseBase):
 class ListDomainAgentResponses(BaseModel):
     """Response model for domain agent response list."""
     responses: List[DomainAgentResponseData]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
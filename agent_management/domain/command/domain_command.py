@@ -1,5 +1,5 @@
 """Domain related commands and models."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -27,6 +27,7 @@ class GetDomain(BaseModel):
     """Command for retrieving a domain."""
     domain_id: Optional[int] = Field(None, gt=0)
     domain_name: Optional[str] = None
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class DomainResponse(DomainBase):
@@ -41,3 +42,6 @@ class DomainResponse(DomainBase):
 class ListDomains(BaseModel):
     """Response model for domain list."""
     domains: List[DomainResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
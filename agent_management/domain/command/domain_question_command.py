@@ -1,5 +1,5 @@
 """Domain Question related commands and models."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -36,6 +36,7 @@ class GetDomainQuestion(BaseModel):
     category: Optional[str] = None
     question_type: Optional[str] = Field(
         None, pattern="^(multiple_choice|free_text|rating)$")
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class DomainQuestionResponse(DomainQuestionBase):
@@ -50,3 +51,6 @@ class DomainQuestionResponse(DomainQuestionBase):
 class ListDomainQuestions(BaseModel):
     """Response model for domain question list."""
     questions: List[DomainQuestionResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
@@ -1,5 +1,5 @@
 """Command models for industry operations."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -20,6 +20,7 @@ class DeleteIndustry(BaseModel):
 class GetIndustry(BaseModel):
     """Command to get an industry by ID."""
     industry_id: int
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class IndustryResponse(BaseModel):
@@ -30,3 +31,6 @@ class IndustryResponse(BaseModel):
 class ListIndustries(BaseModel):
     """Response model for listing industries."""
     industries: List[IndustryResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
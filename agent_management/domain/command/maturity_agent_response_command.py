@@ -1,6 +1,6 @@
 """Maturity agent response related commands and models."""
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -32,6 +32,7 @@ class GetMaturityAgentResponse(BaseModel):
     maturity_agent_response_id: Optional[int] = Field(None, gt=0)
     agent_id: Optional[int] = Field(None, gt=0)
     maturity_question_id: Optional[int] = Field(None, gt=0)
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class MaturityAgentResponseData(MaturityAgentResponseBase):
@@ -46,3 +47,6 @@ class MaturityAgentResponseData(MaturityAgentResponseBase):
 class ListMaturityAgentResponses(BaseModel):
     """Response model for maturity agent response list."""
     responses: List[MaturityAgentResponseData]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
@@ -1,6 +1,6 @@
 """Maturity Answer related commands and models."""
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -22,6 +22,25 @@ class UpdateMaturityAnswer(MaturityAnswerBase):
     maturity_answer_id: int = Field(..., gt=0)
 
 
+class UpsertMaturityAnswer(BaseModel):
+    """Answer to one question within a bulk upsert."""
+    maturity_question_id: int = Field(..., gt=0)
+    answer_text: str = Field(..., min_length=1)
+    answered_at: datetime = Field(default_factory=datetime.now)
+
+
+class UpsertMaturityAnswers(BaseModel):
+    """Command for saving many answers of a session in one statement."""
+    session_id: int = Field(..., gt=0)
+    answers: List[UpsertMaturityAnswer] = Field(..., min_length=1)
+
+
+class UpsertMaturityAnswersResponse(BaseModel):
+    """Response model for a bulk upsert of maturity answers."""
+    inserted: int
+    updated: int
+
+
 class DeleteMaturityAnswer(BaseModel):
     """Command for deleting a maturity answer."""
     maturity_answer_id: int = Field(..., gt=0)
@@ -32,6 +51,7 @@ class GetMaturityAnswer(BaseModel):
     maturity_answer_id: Optional[int] = Field(None, gt=0)
     session_id: Optional[int] = Field(None, gt=0)
     maturity_question_id: Optional[int] = Field(None, gt=0)
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class MaturityAnswerResponse(MaturityAnswerBase):
@@ -46,6 +66,9 @@ class MaturityAnswerResponse(MaturityAnswerBase):
 class ListMaturityAnswers(BaseModel):
     """Response model for maturity answer list."""
     answers: List[MaturityAnswerResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
 
 
 class AsistantResponse(BaseModel):
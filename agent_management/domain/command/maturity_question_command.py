@@ -1,7 +1,7 @@
 """Maturity Question related commands and models."""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -26,6 +26,34 @@ class CreateMaturityQuestion(MaturityQuestionBase):
     pass
 
 
+class BulkMaturityQuestionOption(BaseModel):
+    """Agent response option created together with its question."""
+    agent_id: int = Field(..., gt=0)
+    response_text: str = Field(..., min_length=1)
+    response_date: datetime = Field(default_factory=datetime.now)
+
+
+class BulkMaturityQuestion(CreateMaturityQuestion):
+    """Maturity question with its agent response options for bulk creation."""
+    options: List[BulkMaturityQuestionOption] = Field(default_factory=list)
+
+
+class BulkCreateMaturityQuestions(BaseModel):
+    """Command for creating many maturity questions in one transaction."""
+    questions: List[BulkMaturityQuestion] = Field(..., min_length=1)
+
+
+class BulkCreatedMaturityQuestion(BaseModel):
+    """IDs generated for one question of a bulk creation."""
+    maturity_question_id: int
+    option_ids: List[int] = Field(default_factory=list)
+
+
+class BulkCreateMaturityQuestionsResponse(BaseModel):
+    """Response model for bulk creation, in the order questions were sent."""
+    questions: List[BulkCreatedMaturityQuestion]
+
+
 class UpdateMaturityQuestion(MaturityQuestionBase):
     """Command for updating a maturity question."""
     maturity_question_id: int = Field(..., gt=0)
@@ -44,6 +72,7 @@ class GetMaturityQuestion(BaseModel):
         None, pattern="^(multiple_choice|free_text|rating)$")
     axis_id: Optional[int] = Field(None, gt=0)
     industry_id: Optional[int] = Field(None, gt=0)
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class MaturityQuestionResponse(MaturityQuestionBase):
@@ -63,6 +92,9 @@ class MaturityQuestionWithResponse(MaturityQuestionResponse):
 class ListMaturityQuestions(BaseModel):
     """Response model for maturity question list."""
     questions: List[MaturityQuestionResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
 
 
 class ChatMessage(BaseModel):
@@ -1,5 +1,5 @@
 """Project related commands and models."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -31,6 +31,7 @@ class GetProject(BaseModel):
     project_id: Optional[int] = Field(None, gt=0)
     project_name: Optional[str] = None
     company_id: Optional[int] = Field(None, gt=0)
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class ProjectResponse(ProjectBase):
@@ -47,3 +48,6 @@ class ProjectResponse(ProjectBase):
 class ListProjects(BaseModel):
     """Response model for project list."""
     projects: List[ProjectResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
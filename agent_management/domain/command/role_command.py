@@ -1,5 +1,5 @@
 """Role related commands and models."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -29,6 +29,7 @@ class GetRole(BaseModel):
     """Command for retrieving a role."""
     role_id: int | None = None
     role_name: int | None = None
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class RoleResponse(RoleBase):
@@ -45,3 +46,6 @@ class RoleResponse(RoleBase):
 class ListRoles(BaseModel):
     """Response model for role list."""
     roles: List[RoleResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
@@ -1,6 +1,6 @@
 """Session related commands and models."""
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -33,6 +33,7 @@ class GetSession(BaseModel):
     session_id: Optional[int] = Field(None, gt=0)
     session_token: Optional[str] = None
     user_id: Optional[int] = None
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class SessionResponse(SessionBase):
@@ -48,3 +49,6 @@ class SessionResponse(SessionBase):
 class ListSessions(BaseModel):
     """Response model for session list."""
     sessions: List[SessionResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
@@ -1,5 +1,5 @@
 """Subdomain related commands and models."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -29,6 +29,7 @@ class GetSubdomain(BaseModel):
     subdomain_id: Optional[int] = Field(None, gt=0)
     subdomain_name: Optional[str] = None
     domain_id: Optional[int] = Field(None, gt=0)
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class SubdomainResponse(SubdomainBase):
@@ -43,3 +44,6 @@ class SubdomainResponse(SubdomainBase):
 class ListSubdomains(BaseModel):
     """Response model for subdomain list."""
     subdomains: List[SubdomainResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
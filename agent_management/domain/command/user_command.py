@@ -1,5 +1,5 @@
 """User related commands and models."""
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -31,6 +31,7 @@ class GetUser(BaseModel):
     """Command for retrieving a user."""
     user_id: int | None = None
     email: str | None = None
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class UserResponse(UserBase):
@@ -47,3 +48,6 @@ class UserResponse(UserBase):
 class ListUsers(BaseModel):
     """Response model for user list."""
     users: List[UserResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    missing: Optional[List[int]] = None
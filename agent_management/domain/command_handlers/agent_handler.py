@@ -1,5 +1,5 @@
 """Handler for agent-related commands."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from domain.command.agent_command import (
     CreateAgent,
     UpdateAgent,
@@ -30,7 +30,24 @@ async def get_agent(repository, command: GetAgent) -> Optional[AgentResponse]:
     return await repository.get(command)
 
 
-async def list_agents(repository) -> ListAgents:
+async def list_agents(
+    repository,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListAgents:
     """List all agents."""
-    agents = await repository.list_all()
-    return ListAgents(agents=agents)
+    agents, next_cursor, total = await repository.list_all(
+        limit=limit, after=after, fields=fields, count=count)
+    return ListAgents(agents=agents, next_cursor=next_cursor, total=total)
+
+
+async def get_agents_by_ids(
+    repository,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListAgents:
+    """Get agents by ID, in the order of ``ids``."""
+    agents, missing = await repository.get_many(ids, fields=fields)
+    return ListAgents(agents=agents, missing=missing)
@@ -1,5 +1,5 @@
 """Handler for axis-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 
 from domain.command.axis_command import (
@@ -61,20 +61,51 @@ async def get_axis(repository: Callable, command: GetAxis) -> Optional[AxisRespo
     Returns:
         Optional[AxisResponse]: Axis data if found, None otherwise
     """
-    return await repository.get_by_id(command.axis_id)
+    return await repository.get_by_id(command.axis_id, command.fields)
 
 
-async def list_axes(repository: Callable) -> ListAxes:
+async def list_axes(
+    repository: Callable,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListAxes:
     """List all axes.
     
     Args:
         repository: Axis repository
+        limit: Optional page size
+        after: Optional key of the last item of the previous page
+        fields: Optional fields to return
+        count: How to compute the total: exact, estimated or none
         
     Returns:
         ListAxes: List of all axes
     """
-    axes = await repository.get_all()
-    return ListAxes(axes=axes)
+    axes, next_cursor, total = await repository.get_all(
+        limit=limit, after=after, fields=fields, count=count)
+    return ListAxes(axes=axes, next_cursor=next_cursor, total=total)
+
+
+async def get_axes_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListAxes:
+    """Get axes by ID, in the order of ``ids``.
+
+    Args:
+        repository: Axis repository
+        ids: IDs of the axes
+        fields: Optional fields to return
+
+    Returns:
+        ListAxes: Axes found, and the IDs that matched none
+        in ``missing``
+    """
+    axes, missing = await repository.get_many(ids, fields=fields)
+    return ListAxes(axes=axes, missing=missing)
 
 
 def create_axis_handler(repository: Callable) -> dict:
@@ -92,4 +123,5 @@ def create_axis_handler(repository: Callable) -> dict:
         'delete_axis': partial(delete_axis, repository),
         'get_axis': partial(get_axis, repository),
         'list_axes': partial(list_axes, repository),
+        'get_axes_by_ids': partial(get_axes_by_ids, repository),
     }
@@ -1,11 +1,13 @@
 """Company command handlers."""
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from functools import partial
 from domain.command.company_command import (
     CreateCompany,
     UpdateCompany,
     DeleteCompany,
     GetCompany,
+    GetCompanyTree,
+    CompanyTree,
     ListCompanies
 )
 
@@ -30,9 +32,30 @@ async def get_company(repository: Callable, command: GetCompany) -> Optional[dic
     return await repository.get(command)
 
 
-async def list_companies(repository: Callable) -> ListCompanies:
+async def get_company_tree(repository: Callable, command: GetCompanyTree) -> Optional[CompanyTree]:
+    """Retrieve a company with its domains, subdomains and projects."""
+    return await repository.get_tree(command.company_id, command.depth)
+
+
+async def list_companies(
+    repository: Callable,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListCompanies:
     """List all companies."""
-    return await repository.list_all()
+    return await repository.list_all(limit=limit, after=after, fields=fields, count=count)
+
+
+async def get_companies_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListCompanies:
+    """Get companies by ID, in the order of ``ids``."""
+    companies, missing = await repository.get_many(ids, fields=fields)
+    return ListCompanies(companies=companies, missing=missing)
 
 
 def create_company_handler(repository: Callable) -> dict:
@@ -42,5 +65,7 @@ def create_company_handler(repository: Callable) -> dict:
         'update_company': partial(update_company, repository),
         'delete_company': partial(delete_company, repository),
         'get_company': partial(get_company, repository),
-        'list_companies': partial(list_companies, repository)
+        'get_company_tree': partial(get_company_tree, repository),
+        'list_companies': partial(list_companies, repository),
+        'get_companies_by_ids': partial(get_companies_by_ids, repository)
     }
@@ -1,5 +1,5 @@
 """Handler for domain agent response-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.domain_agent_response_command import (
     CreateDomainAgentResponse,
@@ -66,7 +66,11 @@ async def get_domain_response(repository: Callable, command: GetDomainAgentRespo
 async def list_domain_responses(
     repository: Callable,
     agent_id: Optional[int] = None,
-    domain_question_id: Optional[int] = None
+    domain_question_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
 ) -> ListDomainAgentResponses:
     """List all domain agent responses, optionally filtered.
     
@@ -74,12 +78,37 @@ async def list_domain_responses(
         repository: DomainAgentResponse repository
         agent_id: Optional agent ID filter
         domain_question_id: Optional domain question ID filter
+        limit: Optional page size
+        after: Optional key of the last item of the previous page
+        fields: Optional fields to return
+        count: How to compute the total: exact, estimated or none
         
     Returns:
         ListDomainAgentResponses: List of domain agent responses
     """
-    responses = await repository.list_all(agent_id, domain_question_id)
-    return ListDomainAgentResponses(responses=responses)
+    responses, next_cursor, total = await repository.list_all(
+        agent_id, domain_question_id, limit=limit, after=after, fields=fields, count=count)
+    return ListDomainAgentResponses(responses=responses, next_cursor=next_cursor, total=total)
+
+
+async def get_domain_responses_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListDomainAgentResponses:
+    """Get domain agent responses by ID, in the order of ``ids``.
+
+    Args:
+        repository: DomainAgentResponse repository
+        ids: IDs of the domain agent responses
+        fields: Optional fields to return
+
+    Returns:
+        ListDomainAgentResponses: Domain agent responses found, and the IDs that matched none
+        in ``missing``
+    """
+    responses, missing = await repository.get_many(ids, fields=fields)
+    return ListDomainAgentResponses(responses=responses, missing=missing)
 
 
 def create_domain_agent_response_handler(repository: Callable) -> dict:
@@ -97,4 +126,5 @@ def create_domain_agent_response_handler(repository: Callable) -> dict:
         'delete_domain_response': partial(delete_domain_response, repository),
         'get_domain_response': partial(get_domain_response, repository),
         'list_domain_responses': partial(list_domain_responses, repository),
+        'get_domain_responses_by_ids': partial(get_domain_responses_by_ids, repository),
     }
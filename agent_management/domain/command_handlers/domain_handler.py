@@ -1,5 +1,5 @@
 """Handler for domain-related commands."""
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from functools import partial
 from domain.command.domain_command import (
     CreateDomain,
@@ -31,10 +31,27 @@ async def get_domain(repository: Callable, command: GetDomain) -> Optional[Domai
     return await repository.get(command)
 
 
-async def list_domains(repository: Callable) -> ListDomains:
+async def list_domains(
+    repository: Callable,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListDomains:
     """List all domains."""
-    domains = await repository.list_all()
-    return ListDomains(domains=domains)
+    domains, next_cursor, total = await repository.list_all(
+        limit=limit, after=after, fields=fields, count=count)
+    return ListDomains(domains=domains, next_cursor=next_cursor, total=total)
+
+
+async def get_domains_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListDomains:
+    """Get domains by ID, in the order of ``ids``."""
+    domains, missing = await repository.get_many(ids, fields=fields)
+    return ListDomains(domains=domains, missing=missing)
 
 
 def create_domain_handler(repository: Callable) -> dict:
@@ -45,4 +62,5 @@ def create_domain_handler(repository: Callable) -> dict:
         'delete_domain': partial(delete_domain, repository),
         'get_domain': partial(get_domain, repository),
         'list_domains': partial(list_domains, repository),
+        'get_domains_by_ids': partial(get_domains_by_ids, repository),
     }
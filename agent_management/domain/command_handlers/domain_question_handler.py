@@ -1,5 +1,5 @@
 """Handler for domain question-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.domain_question_command import (
     CreateDomainQuestion,
@@ -36,11 +36,26 @@ async def list_domain_questions(
     domain_id: Optional[int] = None,
     industry_id: Optional[int] = None,
     category: Optional[str] = None,
-    question_type: Optional[str] = None
+    question_type: Optional[str] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
 ) -> ListDomainQuestions:
     """List all domain questions, optionally filtered."""
-    questions = await repository.list_all(domain_id, industry_id, category, question_type)
-    return ListDomainQuestions(questions=questions)
+    questions, next_cursor, total = await repository.list_all(
+        domain_id, industry_id, category, question_type, limit=limit, after=after, fields=fields, count=count)
+    return ListDomainQuestions(questions=questions, next_cursor=next_cursor, total=total)
+
+
+async def get_domain_questions_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListDomainQuestions:
+    """Get domain questions by ID, in the order of ``ids``."""
+    questions, missing = await repository.get_many(ids, fields=fields)
+    return ListDomainQuestions(questions=questions, missing=missing)
 
 
 def create_domain_question_handler(repository: Callable) -> dict:
@@ -51,4 +66,5 @@ def create_domain_question_handler(repository: Callable) -> dict:
         'delete_domain_question': partial(delete_domain_question, repository),
         'get_domain_question': partial(get_domain_question, repository),
         'list_domain_questions': partial(list_domain_questions, repository),
+        'get_domain_questions_by_ids': partial(get_domain_questions_by_ids, repository),
     }
@@ -1,5 +1,5 @@
 """Handler for industry-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 
 from domain.command.industry_command import (
@@ -61,17 +61,48 @@ async def get_industry(repository: Callable, command: GetIndustry) -> Optional[I
     Returns:
         Optional[IndustryResponse]: Industry data if found, None otherwise
     """
-    return await repository.get_by_id(command.industry_id)
+    return await repository.get_by_id(command.industry_id, command.fields)
 
 
-async def list_industries(repository: Callable) -> ListIndustries:
+async def list_industries(
+    repository: Callable,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListIndustries:
     """List all industries.
     
     Args:
         repository: Industry repository
+        limit: Optional page size
+        after: Optional key of the last item of the previous page
+        fields: Optional fields to return
+        count: How to compute the total: exact, estimated or none
         
     Returns:
         ListIndustries: List of all industries
     """
-    industries = await repository.get_all()
-    return ListIndustries(industries=industries)
+    industries, next_cursor, total = await repository.get_all(
+        limit=limit, after=after, fields=fields, count=count)
+    return ListIndustries(industries=industries, next_cursor=next_cursor, total=total)
+
+
+async def get_industries_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListIndustries:
+    """Get industries by ID, in the order of ``ids``.
+
+    Args:
+        repository: Industry repository
+        ids: IDs of the industries
+        fields: Optional fields to return
+
+    Returns:
+        ListIndustries: Industries found, and the IDs that matched none
+        in ``missing``
+    """
+    industries, missing = await repository.get_many(ids, fields=fields)
+    return ListIndustries(industries=industries, missing=missing)
@@ -1,5 +1,5 @@
 """Handler for maturity agent response-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.maturity_agent_response_command import (
     CreateMaturityAgentResponse,
@@ -66,7 +66,11 @@ async def get_maturity_response(repository: Callable, command: GetMaturityAgentR
 async def list_maturity_responses(
     repository: Callable,
     agent_id: Optional[int] = None,
-    maturity_question_id: Optional[int] = None
+    maturity_question_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
 ) -> ListMaturityAgentResponses:
     """List all maturity agent responses, optionally filtered.
     
@@ -74,12 +78,37 @@ async def list_maturity_responses(
         repository: MaturityAgentResponse repository
         agent_id: Optional agent ID filter
         maturity_question_id: Optional maturity question ID filter
+        limit: Optional page size
+        after: Optional key of the last item of the previous page
+        fields: Optional fields to return
+        count: How to compute the total: exact, estimated or none
         
     Returns:
         ListMaturityAgentResponses: List of maturity agent responses
     """
-    responses = await repository.list_all(agent_id, maturity_question_id)
-    return ListMaturityAgentResponses(responses=responses)
+    responses, next_cursor, total = await repository.list_all(
+        agent_id, maturity_question_id, limit=limit, after=after, fields=fields, count=count)
+    return ListMaturityAgentResponses(responses=responses, next_cursor=next_cursor, total=total)
+
+
+async def get_maturity_responses_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListMaturityAgentResponses:
+    """Get maturity agent responses by ID, in the order of ``ids``.
+
+    Args:
+        repository: MaturityAgentResponse repository
+        ids: IDs of the maturity agent responses
+        fields: Optional fields to return
+
+    Returns:
+        ListMaturityAgentResponses: Maturity agent responses found, and the IDs that matched none
+        in ``missing``
+    """
+    responses, missing = await repository.get_many(ids, fields=fields)
+    return ListMaturityAgentResponses(responses=responses, missing=missing)
 
 
 def create_maturity_agent_response_handler(repository: Callable) -> dict:
@@ -97,4 +126,5 @@ def create_maturity_agent_response_handler(repository: Callable) -> dict:
         'delete_maturity_response': partial(delete_maturity_response, repository),
         'get_maturity_response': partial(get_maturity_response, repository),
         'list_maturity_responses': partial(list_maturity_responses, repository),
+        'get_maturity_responses_by_ids': partial(get_maturity_responses_by_ids, repository),
     }
@@ -1,5 +1,5 @@
 """Handler for maturity answer-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.maturity_answer_command import (
     CreateMaturityAnswer,
@@ -7,7 +7,9 @@ from domain.command.maturity_answer_command import (
     DeleteMaturityAnswer,
     GetMaturityAnswer,
     MaturityAnswerResponse,
-    ListMaturityAnswers
+    ListMaturityAnswers,
+    UpsertMaturityAnswers,
+    UpsertMaturityAnswersResponse
 )
 
 
@@ -24,6 +26,22 @@ async def create_maturity_answer(repository: Callable, command: CreateMaturityAn
     return await repository.create(command)
 
 
+async def upsert_maturity_answers(
+    repository: Callable,
+    command: UpsertMaturityAnswers
+) -> UpsertMaturityAnswersResponse:
+    """Insert or update many answers of a session.
+    
+    Args:
+        repository: MaturityAnswer repository
+        command: UpsertMaturityAnswers command
+        
+    Returns:
+        UpsertMaturityAnswersResponse: Number of answers inserted and updated
+    """
+    return await repository.upsert_many(command)
+
+
 async def update_maturity_answer(repository: Callable, command: UpdateMaturityAnswer) -> bool:
     """Update an existing maturity answer.
     
@@ -66,7 +84,11 @@ async def get_maturity_answer(repository: Callable, command: GetMaturityAnswer)
 async def list_maturity_answers(
     repository: Callable,
     session_id: Optional[int] = None,
-    maturity_question_id: Optional[int] = None
+    maturity_question_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
 ) -> ListMaturityAnswers:
     """List all maturity answers, optionally filtered.
     
@@ -74,12 +96,61 @@ async def list_maturity_answers(
         repository: MaturityAnswer repository
         session_id: Optional session ID filter
         maturity_question_id: Optional maturity question ID filter
+        limit: Optional page size
+        after: Optional key of the last item of the previous page
+        fields: Optional fields to return
+        count: How to compute the total: exact, estimated or none
         
     Returns:
         ListMaturityAnswers: List of maturity answers
     """
-    answers = await repository.list_all(session_id, maturity_question_id)
-    return ListMaturityAnswers(answers=answers)
+    answers, next_cursor, total = await repository.list_all(
+        session_id, maturity_question_id, limit=limit, after=after, fields=fields, count=count)
+    return ListMaturityAnswers(answers=answers, next_cursor=next_cursor, total=total)
+
+
+async def complete_session_answers(
+    answer_repository: Callable,
+    session_repository: Callable,
+    command: UpsertMaturityAnswers
+) -> Optional[UpsertMaturityAnswersResponse]:
+    """Save the final answers of a session and close the session.
+
+    Both repositories must share a unit of work, so the answers and the
+    closed session are committed together or not at all.
+
+    Args:
+        answer_repository: MaturityAnswer repository
+        session_repository: Session repository
+        command: UpsertMaturityAnswers command
+
+    Returns:
+        Optional[UpsertMaturityAnswersResponse]: Number of answers inserted
+        and updated, or None if the session is missing or already closed
+    """
+    if not await session_repository.deactivate(command.session_id):
+        return None
+    return await answer_repository.upsert_many(command)
+
+
+async def get_maturity_answers_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListMaturityAnswers:
+    """Get maturity answers by ID, in the order of ``ids``.
+
+    Args:
+        repository: MaturityAnswer repository
+        ids: IDs of the maturity answers
+        fields: Optional fields to return
+
+    Returns:
+        ListMaturityAnswers: Maturity answers found, and the IDs that matched none
+        in ``missing``
+    """
+    answers, missing = await repository.get_many(ids, fields=fields)
+    return ListMaturityAnswers(answers=answers, missing=missing)
 
 
 def create_maturity_answer_handler(repository: Callable) -> dict:
@@ -97,4 +168,5 @@ def create_maturity_answer_handler(repository: Callable) -> dict:
         'delete_maturity_answer': partial(delete_maturity_answer, repository),
         'get_maturity_answer': partial(get_maturity_answer, repository),
         'list_maturity_answers': partial(list_maturity_answers, repository),
+        'get_maturity_answers_by_ids': partial(get_maturity_answers_by_ids, repository),
     }
@@ -2,13 +2,15 @@
 import json
 import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Optional, List, Callable, Dict
+from typing import Optional, List, Callable, Dict, Tuple
 from functools import partial
 
 from domain.command.comon_command import Sources 
 from domain.command.maturity_question_command import (
     Question, QuestionOption,
     MaturityQuestionBase,
+    BulkCreateMaturityQuestions,
+    BulkCreateMaturityQuestionsResponse,
     CreateMaturityQuestion,
     UpdateMaturityQuestion,
     DeleteMaturityQuestion,
@@ -32,6 +34,22 @@ async def create_maturity_question(repository: Callable, command: CreateMaturity
     return await repository.create(command)
 
 
+async def bulk_create_maturity_questions(
+    repository: Callable,
+    command: BulkCreateMaturityQuestions
+) -> BulkCreateMaturityQuestionsResponse:
+    """Create many maturity questions with their options.
+
+    Args:
+        repository: MaturityQuestion repository
+        command: BulkCreateMaturityQuestions command
+
+    Returns:
+        BulkCreateMaturityQuestionsResponse: Generated IDs in input order
+    """
+    return await repository.bulk_create(command)
+
+
 async def update_maturity_question(repository: Callable, command: UpdateMaturityQuestion) -> bool:
     """Update an existing maturity question.
 
@@ -76,7 +94,11 @@ async def list_maturity_questions(
     category: Optional[str] = None,
     question_type: Optional[str] = None,
     axis_id: Optional[int] = None,
-    industry_id: Optional[int] = None
+    industry_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
 ) -> ListMaturityQuestions:
     """List all maturity questions, optionally filtered.
 
@@ -86,12 +108,37 @@ async def list_maturity_questions(
         question_type: Optional question type filter
         axis_id: Optional axis ID filter
         industry_id: Optional industry ID filter
+        limit: Optional page size
+        after: Optional key of the last item of the previous page
+        fields: Optional fields to return
+        count: How to compute the total: exact, estimated or none
 
     Returns:
         ListMaturityQuestions: List of maturity questions
     """
-    questions = await repository.list_all(category, question_type, axis_id, industry_id)
-    return ListMaturityQuestions(questions=questions)
+    questions, next_cursor, total = await repository.list_all(
+        category, question_type, axis_id, industry_id, limit=limit, after=after, fields=fields, count=count)
+    return ListMaturityQuestions(questions=questions, next_cursor=next_cursor, total=total)
+
+
+async def get_maturity_questions_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListMaturityQuestions:
+    """Get maturity questions by ID, in the order of ``ids``.
+
+    Args:
+        repository: MaturityQuestion repository
+        ids: IDs of the maturity questions
+        fields: Optional fields to return
+
+    Returns:
+        ListMaturityQuestions: Maturity questions found, and the IDs that matched none
+        in ``missing``
+    """
+    questions, missing = await repository.get_many(ids, fields=fields)
+    return ListMaturityQuestions(questions=questions, missing=missing)
 
 
 async def chat_maturity_questions(sources: Sources, cmd):
@@ -135,4 +182,5 @@ def create_maturity_question_handler(repository: Callable) -> dict:
         'delete_maturity_question': partial(delete_maturity_question, repository),
         'get_maturity_question': partial(get_maturity_question, repository),
         'list_maturity_questions': partial(list_maturity_questions, repository),
+        'get_maturity_questions_by_ids': partial(get_maturity_questions_by_ids, repository),
     }
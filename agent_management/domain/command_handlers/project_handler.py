@@ -1,5 +1,5 @@
 """Handler for project-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.project_command import (
     CreateProject,
@@ -31,10 +31,28 @@ async def get_project(repository: Callable, command: GetProject) -> Optional[Pro
     return await repository.get(command)
 
 
-async def list_projects(repository: Callable, company_id: Optional[int] = None) -> ListProjects:
+async def list_projects(
+    repository: Callable,
+    company_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListProjects:
     """List all projects, optionally filtered by company_id."""
-    projects = await repository.list(company_id)
-    return ListProjects(projects=projects)
+    projects, next_cursor, total = await repository.list(
+        company_id, limit=limit, after=after, fields=fields, count=count)
+    return ListProjects(projects=projects, next_cursor=next_cursor, total=total)
+
+
+async def get_projects_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListProjects:
+    """Get projects by ID, in the order of ``ids``."""
+    projects, missing = await repository.get_many(ids, fields=fields)
+    return ListProjects(projects=projects, missing=missing)
 
 
 def create_project_handler(repository: Callable) -> dict:
@@ -44,5 +62,6 @@ def create_project_handler(repository: Callable) -> dict:
         'update_project': partial(update_project, repository),
         'delete_project': partial(delete_project, repository),
         'get_project': partial(get_project, repository),
-        'list_projects': partial(list_projects, repository)
+        'list_projects': partial(list_projects, repository),
+        'get_projects_by_ids': partial(get_projects_by_ids, repository)
     }
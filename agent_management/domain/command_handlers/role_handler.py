@@ -1,5 +1,5 @@
 """Handler for role-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.role_command import (
     CreateRole,
@@ -31,10 +31,27 @@ async def get_role(repository: Callable, command: GetRole) -> Optional[RoleRespo
     return await repository.get(command)
 
 
-async def list_roles(repository: Callable) -> ListRoles:
+async def list_roles(
+    repository: Callable,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListRoles:
     """List all roles."""
-    roles = await repository.list()
-    return ListRoles(roles=roles)
+    roles, next_cursor, total = await repository.list(
+        limit=limit, after=after, fields=fields, count=count)
+    return ListRoles(roles=roles, next_cursor=next_cursor, total=total)
+
+
+async def get_roles_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListRoles:
+    """Get roles by ID, in the order of ``ids``."""
+    roles, missing = await repository.get_many(ids, fields=fields)
+    return ListRoles(roles=roles, missing=missing)
 
 
 def create_role_handler(repository: Callable) -> dict:
@@ -45,4 +62,5 @@ def create_role_handler(repository: Callable) -> dict:
         'delete_role': partial(delete_role, repository),
         'get_role': partial(get_role, repository),
         'list_roles': partial(list_roles, repository),
+        'get_roles_by_ids': partial(get_roles_by_ids, repository),
     }
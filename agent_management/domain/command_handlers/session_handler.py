@@ -1,5 +1,5 @@
 """Handler for session-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.session_command import (
     CreateSession,
@@ -31,10 +31,28 @@ async def get_session(repository: Callable, command: GetSession) -> Optional[Ses
     return await repository.get(command)
 
 
-async def list_sessions(repository: Callable, active_only: bool = False) -> ListSessions:
+async def list_sessions(
+    repository: Callable,
+    active_only: bool = False,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListSessions:
     """List all sessions, optionally filtering for active ones only."""
-    sessions = await repository.list_all(active_only)
-    return ListSessions(sessions=sessions)
+    sessions, next_cursor, total = await repository.list_all(
+        active_only, limit=limit, after=after, fields=fields, count=count)
+    return ListSessions(sessions=sessions, next_cursor=next_cursor, total=total)
+
+
+async def get_sessions_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListSessions:
+    """Get sessions by ID, in the order of ``ids``."""
+    sessions, missing = await repository.get_many(ids, fields=fields)
+    return ListSessions(sessions=sessions, missing=missing)
 
 
 async def deactivate_session(repository: Callable, session_id: int) -> bool:
@@ -50,5 +68,6 @@ def create_session_handler(repository: Callable) -> dict:
         'delete_session': partial(delete_session, repository),
         'get_session': partial(get_session, repository),
         'list_sessions': partial(list_sessions, repository),
+        'get_sessions_by_ids': partial(get_sessions_by_ids, repository),
         'deactivate_session': partial(deactivate_session, repository),
     }
@@ -1,5 +1,5 @@
 """Handler for subdomain-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.subdomain_command import (
     CreateSubdomain,
@@ -31,10 +31,28 @@ async def get_subdomain(repository: Callable, command: GetSubdomain) -> Optional
     return await repository.get(command)
 
 
-async def list_subdomains(repository: Callable, domain_id: Optional[int] = None) -> ListSubdomains:
+async def list_subdomains(
+    repository: Callable,
+    domain_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListSubdomains:
     """List all subdomains, optionally filtered by domain_id."""
-    subdomains = await repository.list_all(domain_id)
-    return ListSubdomains(subdomains=subdomains)
+    subdomains, next_cursor, total = await repository.list_all(
+        domain_id, limit=limit, after=after, fields=fields, count=count)
+    return ListSubdomains(subdomains=subdomains, next_cursor=next_cursor, total=total)
+
+
+async def get_subdomains_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListSubdomains:
+    """Get subdomains by ID, in the order of ``ids``."""
+    subdomains, missing = await repository.get_many(ids, fields=fields)
+    return ListSubdomains(subdomains=subdomains, missing=missing)
 
 
 def create_subdomain_handler(repository: Callable) -> dict:
@@ -45,4 +63,5 @@ def create_subdomain_handler(repository: Callable) -> dict:
         'delete_subdomain': partial(delete_subdomain, repository),
         'get_subdomain': partial(get_subdomain, repository),
         'list_subdomains': partial(list_subdomains, repository),
+        'get_subdomains_by_ids': partial(get_subdomains_by_ids, repository),
     }
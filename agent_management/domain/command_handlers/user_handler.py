@@ -1,5 +1,5 @@
 """Handler for user-related commands."""
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from functools import partial
 from domain.command.user_command import (
     CreateUser,
@@ -31,9 +31,32 @@ async def get_user(repository: Callable, command: GetUser) -> Optional[UserRespo
     return await repository.get(command)
 
 
-async def list_users(repository: Callable) -> ListUsers:
+async def list_users(
+    repository: Callable,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    count: str = "none"
+) -> ListUsers:
     """List all users."""
-    users = await repository.list()
+    users, next_cursor, total = await repository.list(
+        limit=limit, after=after, fields=fields, count=count)
+    return ListUsers(users=users, next_cursor=next_cursor, total=total)
+
+
+async def get_users_by_ids(
+    repository: Callable,
+    ids: Tuple[int, ...],
+    fields: Optional[Tuple[str, ...]] = None
+) -> ListUsers:
+    """Get users by ID, in the order of ``ids``."""
+    users, missing = await repository.get_many(ids, fields=fields)
+    return ListUsers(users=users, missing=missing)
+
+
+async def search_users(repository: Callable, email: str, limit: int = 20) -> ListUsers:
+    """Search users by part of their email, closest matches first."""
+    users = await repository.search(email, limit=limit)
     return ListUsers(users=users)
 
 
@@ -45,4 +68,6 @@ def create_user_handler(repository: Callable) -> dict:
         'delete_user': partial(delete_user, repository),
         'get_user': partial(get_user, repository),
         'list_users': partial(list_users, repository),
+        'get_users_by_ids': partial(get_users_by_ids, repository),
+        'search_users': partial(search_users, repository),
     }
@@ -0,0 +1,89 @@
+"""Benchmark statement preparation for the repository filter queries.
+
+Compares, per call, the client-side work of listing maturity questions
+filtered by category and axis, with the statement looked up in the compiled
+cache the way the engine does:
+
+* ``select``: the code path ``list_all`` had before it used lambda
+  statements, rebuilding the select and its cache key on every call
+* ``lambda``: the current ``list_all``, whose cache key comes from the lambda
+  code locations
+
+Both compile once and then hit the cache, which the benchmark asserts; the
+lambda path saves only the statement construction, a small part of a call.
+No database is needed. Run from the ``agent_management`` directory::
+
+    python -m tests.benchmarks.benchmark_filter_statements
+"""
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.util import LRUCache
+
+from adapters.postgres.models.maturity_question import MaturityQuestion
+from adapters.postgres.repositories.maturity_question_repository import MaturityQuestionRepository
+
+ITERATIONS = 5000
+
+
+class CompilingSession:
+    """Session stand-in that prepares statements the way the engine does."""
+
+    def __init__(self):
+        self.dialect = asyncpg_dialect()
+        self.cache = LRUCache(500)
+        self.compilations = 0
+
+    async def execute(self, stmt, params=None):
+        compiled, _, _, cache_hit = stmt._compile_w_cache(
+            self.dialect, compiled_cache=self.cache, column_keys=[]
+        )
+        if cache_hit != self.dialect.CACHE_HIT:
+            self.compilations += 1
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+async def select_list_all(session, category=None, axis_id=None):
+    """``list_all`` as it was before the lambda statements."""
+    stmt = select(MaturityQuestion)
+
+    if category:
+        stmt = stmt.where(MaturityQuestion.category == category)
+    if axis_id:
+        stmt = stmt.where(MaturityQuestion.axis_id == axis_id)
+
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+async def measure(list_all, session):
+    started = time.perf_counter()
+    for i in range(1, ITERATIONS + 1):
+        await list_all(category="governance", axis_id=i)
+    assert session.compilations == 1, f"compiled {session.compilations} times"
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def run():
+    select_session = CompilingSession()
+    select_us = await measure(
+        lambda **filters: select_list_all(select_session, **filters), select_session)
+
+    lambda_session = CompilingSession()
+    lambda_us = await measure(MaturityQuestionRepository(lambda_session).list_all, lambda_session)
+
+    print(f"{'strategy':<10}{'us/call':>10}{'relative':>10}")
+    print(f"{'select':<10}{select_us:>10.1f}{1:>10.2f}")
+    print(f"{'lambda':<10}{lambda_us:>10.1f}{lambda_us / select_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,79 @@
+"""Bulk upsert of maturity answers against a local PostgreSQL.
+
+Runs against the throwaway database of the query plan tests, whose tables are
+dropped and recreated, and is skipped unless ``PLAN_TEST_DATABASE_URL`` is
+set; see ``test_query_plans``.
+"""
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from adapters.postgres.config import Base
+from adapters.postgres.models import (  # noqa: F401  registers every table
+    agent, axis, company, domain, domain_agent_response, domain_question, industry,
+    maturity_agent_response, maturity_answer, maturity_question, maturity_question_catalog,
+    project, role, session as session_model, subdomain, user
+)
+from adapters.postgres.repositories.maturity_answer_repository import MaturityAnswerRepository
+from domain.command.maturity_answer_command import UpsertMaturityAnswer, UpsertMaturityAnswers
+
+DATABASE_URL = os.getenv("PLAN_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="PLAN_TEST_DATABASE_URL is not set"
+)
+
+SEED_SQL = (
+    "INSERT INTO __[SCHEMA__none].industries (industry_name) VALUES ('industry')",
+    "INSERT INTO __[SCHEMA__none].roles (role_name) VALUES ('role')",
+    "INSERT INTO __[SCHEMA__none].companies (company_name, industry_id) VALUES ('company', 1)",
+    "INSERT INTO __[SCHEMA__none].users (user_name, email, role_id, company_id) "
+    "VALUES ('user', 'user@example.com', 1, 1)",
+    "INSERT INTO __[SCHEMA__none].sessions (user_id, session_token, is_active, session_start, created_at) "
+    "VALUES (1, 'token', true, now(), now())",
+    "INSERT INTO __[SCHEMA__none].maturity_questions (question_text, question_type) "
+    "SELECT 'question ' || g, 'free_text' FROM generate_series(1, 3) g",
+)
+
+
+def _answers(**texts) -> UpsertMaturityAnswers:
+    return UpsertMaturityAnswers(session_id=1, answers=[
+        UpsertMaturityAnswer(maturity_question_id=int(question[1:]), answer_text=answer)
+        for question, answer in texts.items()
+    ])
+
+
+async def _upsert_twice():
+    engine = create_async_engine(
+        DATABASE_URL, execution_options={"schema_translate_map": {None: "public"}})
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            for statement in SEED_SQL:
+                await conn.execute(text(statement))
+
+        async with AsyncSession(engine) as session:
+            repository = MaturityAnswerRepository(session)
+            first = await repository.upsert_many(_answers(q1="a", q2="b"))
+            second = await repository.upsert_many(_answers(q2="b again", q3="c"))
+
+        async with engine.connect() as conn:
+            stored = dict((await conn.execute(text(
+                "SELECT maturity_question_id, answer_text "
+                "FROM __[SCHEMA__none].maturity_answers"))).all())
+        return first, second, stored
+    finally:
+        await engine.dispose()
+
+
+def test_upsert_counts_inserted_and_updated_answers():
+    """Test answers to new questions count as inserted and the rest as updated."""
+    first, second, stored = asyncio.run(_upsert_twice())
+
+    assert (first.inserted, first.updated) == (2, 0)
+    assert (second.inserted, second.updated) == (1, 1)
+    assert stored == {1: "a", 2: "b again", 3: "c"}
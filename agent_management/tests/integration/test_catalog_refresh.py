@@ -0,0 +1,77 @@
+"""Concurrency tests for the maturity question catalog against a local PostgreSQL.
+
+Runs against the throwaway database of the query plan tests, whose tables are
+dropped and recreated, and is skipped unless ``PLAN_TEST_DATABASE_URL`` is
+set; see ``test_query_plans``.
+"""
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from adapters.postgres.config import UNIT_OF_WORK, Base
+from adapters.postgres.models import (  # noqa: F401  registers every table
+    agent, axis, company, domain, domain_agent_response, domain_question, industry,
+    maturity_agent_response, maturity_answer, maturity_question, maturity_question_catalog,
+    project, role, session as session_model, subdomain, user
+)
+from adapters.postgres.repositories.maturity_agent_response_repository import MaturityAgentResponseRepository
+from domain.command.maturity_agent_response_command import CreateMaturityAgentResponse
+
+DATABASE_URL = os.getenv("PLAN_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="PLAN_TEST_DATABASE_URL is not set"
+)
+
+SEED_SQL = (
+    "ALTER TABLE __[SCHEMA__none].maturity_questions ADD COLUMN IF NOT EXISTS ambitus_id integer",
+    "INSERT INTO __[SCHEMA__none].axis (axis_name) VALUES ('axis')",
+    "INSERT INTO __[SCHEMA__none].agents (agent_name) VALUES ('agent')",
+    "INSERT INTO __[SCHEMA__none].maturity_questions (question_text, question_type, axis_id) "
+    "VALUES ('question', 'multiple_choice', 1)",
+)
+
+
+def _add_option(session: AsyncSession, response_text: str):
+    return MaturityAgentResponseRepository(session).create(CreateMaturityAgentResponse(
+        agent_id=1, maturity_question_id=1, response_text=response_text))
+
+
+async def _refresh_concurrently() -> list:
+    engine = create_async_engine(
+        DATABASE_URL, execution_options={"schema_translate_map": {None: "public"}})
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            for statement in SEED_SQL:
+                await conn.execute(text(statement))
+
+        # Inside a unit of work the repositories only flush, so both
+        # transactions stay open until they are committed here.
+        async with AsyncSession(engine, info={UNIT_OF_WORK: True}) as first, \
+                AsyncSession(engine, info={UNIT_OF_WORK: True}) as second:
+            await _add_option(first, "first")
+            blocked = asyncio.ensure_future(_add_option(second, "second"))
+            await asyncio.sleep(0.5)
+            assert not blocked.done()
+            await first.commit()
+            await blocked
+            await second.commit()
+
+        async with engine.connect() as conn:
+            return (await conn.execute(text(
+                "SELECT options FROM __[SCHEMA__none].maturity_question_catalog "
+                "WHERE maturity_question_id = 1"))).scalar()
+    finally:
+        await engine.dispose()
+
+
+def test_concurrent_refreshes_of_a_question_keep_every_option():
+    """Test the later of two refreshes of one question sees the earlier one's option."""
+    options = asyncio.run(_refresh_concurrently())
+
+    assert [option["text"] for option in options] == ["first", "second"]
@@ -0,0 +1,381 @@
+"""Query plan regression tests against a local PostgreSQL.
+
+Seeds a throwaway database with production-sized synthetic data (1M maturity
+answers, 50k questions by default), runs the repository query shapes through
+the real repositories, and checks the plan PostgreSQL picks for every
+statement they send with ``EXPLAIN (FORMAT JSON)``: large tables must never be
+read with a sequential scan, hot paths must use their index, and the
+estimated cost must stay under a ceiling.
+
+The tables of the target database are dropped and recreated. The suite is
+skipped unless ``PLAN_TEST_DATABASE_URL`` points at an asyncpg URL, e.g.::
+
+    PLAN_TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/plans \\
+        python -m pytest tests/integration/test_query_plans.py
+
+``PLAN_TEST_SCALE`` scales the seeded row counts; 0.1 seeds in seconds.
+"""
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from adapters.postgres.catalog import backfill_catalog, refresh_catalog
+from adapters.postgres.config import UNIT_OF_WORK, Base
+from adapters.postgres.models import (  # noqa: F401  registers every table
+    agent, axis, company, domain, domain_agent_response, domain_question, industry,
+    maturity_agent_response, maturity_answer, maturity_question, maturity_question_catalog,
+    project, role, session as session_model, subdomain, user
+)
+from adapters.postgres.repositories.company_repository import CompanyRepository
+from adapters.postgres.repositories.domain_agent_response_repository import DomainAgentResponseRepository
+from adapters.postgres.repositories.domain_question_repository import DomainQuestionRepository
+from adapters.postgres.repositories.maturity_agent_response_repository import MaturityAgentResponseRepository
+from adapters.postgres.repositories.maturity_answer_repository import MaturityAnswerRepository
+from adapters.postgres.repositories.maturity_question_repository import MaturityQuestionRepository
+from adapters.postgres.repositories.registration_repository import RegistrationRepository
+from adapters.postgres.repositories.session_repository import SessionRepository
+from adapters.postgres.repositories.user_repository import UserRepository
+from domain.command.domain_agent_response_command import GetDomainAgentResponse
+from domain.command.domain_question_command import GetDomainQuestion, UpdateDomainQuestion
+from domain.command.maturity_agent_response_command import (
+    CreateMaturityAgentResponse,
+    GetMaturityAgentResponse,
+    UpdateMaturityAgentResponse
+)
+from domain.command.maturity_answer_command import (
+    CreateMaturityAnswer,
+    GetMaturityAnswer,
+    UpdateMaturityAnswer,
+    UpsertMaturityAnswer,
+    UpsertMaturityAnswers
+)
+from domain.command.maturity_question_command import GetMaturityQuestion, UpdateMaturityQuestion
+from domain.command.session_command import GetSession
+from domain.command.user_command import GetUser
+
+DATABASE_URL = os.getenv("PLAN_TEST_DATABASE_URL")
+SCALE = float(os.getenv("PLAN_TEST_SCALE", "1"))
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL, reason="PLAN_TEST_DATABASE_URL is not set"
+)
+
+ANSWERS = int(1_000_000 * SCALE)
+QUESTIONS = int(50_000 * SCALE)
+SESSIONS = ANSWERS // 10
+USERS = int(100_000 * SCALE)
+RESPONSES_PER_QUESTION = 4
+
+# Tables seeded large enough that a sequential scan is a regression.
+LARGE_TABLES = {
+    "maturity_answers",
+    "maturity_questions",
+    "maturity_agent_responses",
+    "maturity_question_catalog",
+    "domain_questions",
+    "domain_agent_responses",
+    "sessions",
+    "users",
+}
+
+# Ceiling on the planner's estimated total cost of any statement.
+MAX_COST = 5_000
+
+# Seed statements, in foreign key order, formatted with the row counts.
+# ambitus_id exists on the deployed maturity_questions table without being
+# mapped; the catalog reads it.
+SEED_SQL = (
+    "ALTER TABLE __[SCHEMA__none].maturity_questions ADD COLUMN IF NOT EXISTS ambitus_id integer",
+    "INSERT INTO __[SCHEMA__none].industries (industry_name) "
+    "SELECT 'industry ' || g FROM generate_series(1, 20) g",
+    "INSERT INTO __[SCHEMA__none].axis (axis_name) "
+    "SELECT 'axis ' || g FROM generate_series(1, 10) g",
+    "INSERT INTO __[SCHEMA__none].agents (agent_name) "
+    "SELECT 'agent ' || g FROM generate_series(1, 50) g",
+    "INSERT INTO __[SCHEMA__none].roles (role_name) "
+    "SELECT 'role ' || g FROM generate_series(1, 5) g",
+    "INSERT INTO __[SCHEMA__none].companies (company_name, industry_id) "
+    "SELECT 'company ' || g, g % 20 + 1 FROM generate_series(1, 100) g",
+    "INSERT INTO __[SCHEMA__none].users (user_name, email, role_id, company_id) "
+    "SELECT 'user ' || g, 'user' || g || '@example.com', g % 5 + 1, g % 100 + 1 "
+    "FROM generate_series(1, {users}) g",
+    "INSERT INTO __[SCHEMA__none].domains (domain_name, company_id) "
+    "SELECT 'domain ' || g, g % 100 + 1 FROM generate_series(1, 30) g",
+    "INSERT INTO __[SCHEMA__none].sessions (user_id, session_token, is_active, session_start, created_at) "
+    "SELECT g % {users} + 1, md5(g::text) || md5(g::text), g % 10 = 0, now(), now() "
+    "FROM generate_series(1, {sessions}) g",
+    "INSERT INTO __[SCHEMA__none].maturity_questions "
+    "(question_text, question_type, question_order, category, axis_id, industry_id, ambitus_id) "
+    "SELECT 'question ' || g, (ARRAY['multiple_choice', 'free_text', 'rating'])[g % 3 + 1], "
+    "g % 100, 'category ' || g % 20, g % 10 + 1, g % 20 + 1, g % 8 + 1 "
+    "FROM generate_series(1, {questions}) g",
+    "INSERT INTO __[SCHEMA__none].maturity_agent_responses "
+    "(agent_id, maturity_question_id, response_text, response_date) "
+    "SELECT g % 50 + 1, (g - 1) / {responses} + 1, 'option ' || g % {responses}, now() "
+    "FROM generate_series(1, {questions} * {responses}) g",
+    # Ten consecutive answers share a session and stride over distinct
+    # questions, which keeps (session_id, maturity_question_id) unique.
+    "INSERT INTO __[SCHEMA__none].maturity_answers "
+    "(session_id, maturity_question_id, answer_text, answered_at, created_at) "
+    "SELECT (g - 1) / 10 + 1, (g::bigint * 7919) % {questions} + 1, 'answer ' || g, now(), now() "
+    "FROM generate_series(1, {sessions} * 10) g",
+    "INSERT INTO __[SCHEMA__none].domain_questions "
+    "(domain_id, industry_id, question_text, question_type, category) "
+    "SELECT g % 30 + 1, g % 20 + 1, 'question ' || g, "
+    "(ARRAY['multiple_choice', 'free_text', 'rating'])[g % 3 + 1], 'category ' || g % 20 "
+    "FROM generate_series(1, {questions}) g",
+    "INSERT INTO __[SCHEMA__none].domain_agent_responses "
+    "(agent_id, domain_question_id, response_text, response_date) "
+    "SELECT g % 50 + 1, (g - 1) / {responses} + 1, 'option ' || g % {responses}, now() "
+    "FROM generate_series(1, {questions} * {responses}) g",
+)
+
+
+class Case(NamedTuple):
+    """A repository query shape and what its plan must look like.
+
+    ``index`` is only set where the index is the one sensible plan. A page
+    filtered on a common value may legitimately walk the primary key and
+    stop after ``limit`` matches instead. Cases needing an ``extension``
+    the server does not ship are skipped.
+    """
+    run: Callable[[AsyncSession], Awaitable[object]]
+    index: Optional[str] = None
+    extension: Optional[str] = None
+
+
+# get() returns one row or none, so its multi-column filters below use value
+# combinations the seed never produces; the planner still estimates them from
+# the per-column statistics.
+CASES: Dict[str, Case] = {
+    # Maturity answers
+    "answers list by session": Case(
+        lambda s: MaturityAnswerRepository(s).list_all(session_id=4242, count="exact"),
+        index="uq_session_maturity_question"),
+    "answers list by question": Case(
+        lambda s: MaturityAnswerRepository(s).list_all(maturity_question_id=42, limit=50),
+        index="idx_maturity_answer_question_id_id"),
+    "answers list unfiltered": Case(
+        lambda s: MaturityAnswerRepository(s).list_all(limit=50, after=500_000, count="estimated")),
+    "answers get by session and question": Case(
+        lambda s: MaturityAnswerRepository(s).get(
+            GetMaturityAnswer(session_id=4242, maturity_question_id=42)),
+        index="uq_session_maturity_question"),
+    "answers get many": Case(
+        lambda s: MaturityAnswerRepository(s).get_many([1, 500, 70_000])),
+    "answers create": Case(
+        lambda s: MaturityAnswerRepository(s).create(
+            CreateMaturityAnswer(session_id=1, maturity_question_id=QUESTIONS, answer_text="a"))),
+    "answers upsert": Case(
+        lambda s: MaturityAnswerRepository(s).upsert_many(UpsertMaturityAnswers(
+            session_id=2, answers=[UpsertMaturityAnswer(maturity_question_id=q, answer_text="a")
+                                   for q in (1, 2, 3)]))),
+    "answers update": Case(
+        lambda s: MaturityAnswerRepository(s).update(UpdateMaturityAnswer(
+            maturity_answer_id=10, session_id=1, maturity_question_id=QUESTIONS - 1,
+            answer_text="b"))),
+    "answers delete": Case(
+        lambda s: MaturityAnswerRepository(s).delete(11)),
+
+    # Maturity questions
+    "questions list by axis": Case(
+        lambda s: MaturityQuestionRepository(s).list_all(axis_id=3, limit=50, count="exact"),
+        index="idx_maturity_question_axis_id_id"),
+    "questions list by industry": Case(
+        lambda s: MaturityQuestionRepository(s).list_all(industry_id=7, limit=50)),
+    "questions list by category": Case(
+        lambda s: MaturityQuestionRepository(s).list_all(category="category 5", limit=50)),
+    "questions get many": Case(
+        lambda s: MaturityQuestionRepository(s).get_many([1, 2, 3], ("question_text",))),
+    "questions get by axis and industry": Case(
+        lambda s: MaturityQuestionRepository(s).get(
+            GetMaturityQuestion(axis_id=3, industry_id=8))),
+    "questions with response by axis": Case(
+        lambda s: MaturityQuestionRepository(s).get_questions_with_response(axis_id=3),
+        index="idx_maturity_question_catalog_axis_order"),
+    "questions with response by industry": Case(
+        lambda s: MaturityQuestionRepository(s).get_questions_with_response(industry_id=7),
+        index="idx_maturity_question_catalog_industry_order"),
+    "questions with response by id": Case(
+        lambda s: MaturityQuestionRepository(s).get_questions_with_response(
+            maturity_question_id=42)),
+    "questions update and refresh catalog": Case(
+        lambda s: MaturityQuestionRepository(s).update(UpdateMaturityQuestion(
+            maturity_question_id=43, question_text="edited", question_type="rating",
+            axis_id=4))),
+
+    # Maturity agent responses and the catalog refresh they trigger
+    "agent responses list by agent": Case(
+        lambda s: MaturityAgentResponseRepository(s).list_all(agent_id=7, limit=50),
+        index="idx_maturity_agent_responses_agent_id_id"),
+    "agent responses list by question": Case(
+        lambda s: MaturityAgentResponseRepository(s).list_all(maturity_question_id=42),
+        index="idx_maturity_agent_responses_question_id_id"),
+    "agent responses get by question": Case(
+        lambda s: MaturityAgentResponseRepository(s).get(
+            GetMaturityAgentResponse(agent_id=7, maturity_question_id=42))),
+    "agent responses create": Case(
+        lambda s: MaturityAgentResponseRepository(s).create(CreateMaturityAgentResponse(
+            agent_id=1, maturity_question_id=44, response_text="new option"))),
+    "agent responses update": Case(
+        lambda s: MaturityAgentResponseRepository(s).update(UpdateMaturityAgentResponse(
+            maturity_agent_response_id=200, agent_id=1, maturity_question_id=45,
+            response_text="moved option"))),
+    "agent responses delete": Case(
+        lambda s: MaturityAgentResponseRepository(s).delete(300)),
+    "catalog refresh of some questions": Case(
+        lambda s: refresh_catalog(s, [10, 20, 30])),
+
+    # Domain questions and responses
+    "domain questions list by domain": Case(
+        lambda s: DomainQuestionRepository(s).list_all(domain_id=5, limit=50)),
+    "domain questions list by type": Case(
+        lambda s: DomainQuestionRepository(s).list_all(question_type="rating", limit=50)),
+    "domain questions get by domain and industry": Case(
+        lambda s: DomainQuestionRepository(s).get(GetDomainQuestion(domain_id=5, industry_id=6))),
+    "domain questions update": Case(
+        lambda s: DomainQuestionRepository(s).update(UpdateDomainQuestion(
+            domain_question_id=99, domain_id=9, question_text="edited", question_type="rating"))),
+    "domain agent responses list by question": Case(
+        lambda s: DomainAgentResponseRepository(s).list_all(domain_question_id=42)),
+    "domain agent responses get by agent and question": Case(
+        lambda s: DomainAgentResponseRepository(s).get(
+            GetDomainAgentResponse(agent_id=7, domain_question_id=42))),
+
+    # Companies
+    "company tree": Case(
+        lambda s: CompanyRepository(s).get_tree(42)),
+
+    # Sessions
+    "sessions get by token": Case(
+        lambda s: SessionRepository(s).get(GetSession(session_token="0" * 64))),
+    "sessions get by user and id": Case(
+        lambda s: SessionRepository(s).get(GetSession(user_id=7, session_id=8))),
+    "sessions list active": Case(
+        lambda s: SessionRepository(s).list_all(active_only=True, limit=50)),
+    "sessions deactivate": Case(
+        lambda s: SessionRepository(s).deactivate(50)),
+
+    # Users
+    "registration by email": Case(
+        lambda s: RegistrationRepository(s).get(GetUser(email="Nobody@Example.com")),
+        index="uq_user_email_lower"),
+    "users get by email": Case(
+        lambda s: UserRepository(s).get(GetUser(email="USER42@example.com")),
+        index="uq_user_email_lower"),
+    "users search by email": Case(
+        lambda s: UserRepository(s).search("user4242"),
+        index="idx_user_email_trgm", extension="pg_trgm"),
+}
+
+# Statements and plans of each case; None for cases that were skipped.
+Plans = Dict[str, Optional[List[Tuple[str, dict]]]]
+
+
+async def _seed(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in SEED_SQL:
+            await conn.execute(text(statement.format(
+                users=USERS, sessions=SESSIONS, questions=QUESTIONS,
+                responses=RESPONSES_PER_QUESTION)))
+    async with AsyncSession(engine) as session:
+        await backfill_catalog(session)
+        await session.commit()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE"))
+
+
+async def _explain_cases(engine) -> Plans:
+    """Run every case and explain each statement it sends."""
+    plans: Plans = {}
+    sent: List[Tuple[str, tuple]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            sent.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            # Writes only flush inside a unit of work; the outer transaction
+            # is rolled back, so cases see the seeded data unchanged.
+            session = AsyncSession(bind=conn, info={UNIT_OF_WORK: True}, autoflush=False)
+            extensions = set((await conn.execute(text(
+                "SELECT extname FROM pg_extension"))).scalars())
+            for name, case in CASES.items():
+                if case.extension and case.extension not in extensions:
+                    plans[name] = None
+                    continue
+                sent.clear()
+                await case.run(session)
+                plans[name] = []
+                for statement, parameters in list(sent):
+                    result = await conn.exec_driver_sql(
+                        f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                    plans[name].append((statement, result.scalar()[0]["Plan"]))
+                session.expunge_all()
+            await transaction.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+    return plans
+
+
+async def _collect() -> Plans:
+    engine = create_async_engine(
+        DATABASE_URL, execution_options={"schema_translate_map": {None: "public"}})
+    try:
+        await _seed(engine)
+        return await _explain_cases(engine)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def plans() -> Plans:
+    """Plans of every case, seeded and collected once for the module."""
+    return asyncio.run(_collect())
+
+
+def _statements(plans: Plans, name: str) -> List[Tuple[str, dict]]:
+    if plans[name] is None:
+        pytest.skip(f"{CASES[name].extension} is not installed")
+    assert plans[name], f"{name} sent no statement"
+    return plans[name]
+
+
+def _nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _nodes(child)
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_no_sequential_scan_on_large_tables(plans, name):
+    """Test no statement of the case reads a large table sequentially."""
+    for statement, plan in _statements(plans, name):
+        scanned = {node.get("Relation Name") for node in _nodes(plan)
+                   if node["Node Type"] == "Seq Scan"}
+        assert not scanned & LARGE_TABLES, f"{name}: Seq Scan on {scanned} for {statement}"
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_estimated_cost_is_bounded(plans, name):
+    """Test every statement of the case stays under the cost ceiling."""
+    for statement, plan in _statements(plans, name):
+        assert plan["Total Cost"] <= MAX_COST, (
+            f"{name}: estimated cost {plan['Total Cost']} for {statement}")
+
+
+@pytest.mark.parametrize("name", [name for name, case in CASES.items() if case.index])
+def test_hot_paths_use_their_index(plans, name):
+    """Test the case reads through the index built for its access path."""
+    used = {node.get("Index Name") for _, plan in _statements(plans, name) for node in _nodes(plan)}
+    assert CASES[name].index in used, f"{name}: expected {CASES[name].index}, used {used - {None}}"
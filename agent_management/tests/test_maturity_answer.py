@@ -266,3 +266,45 @@ async def test_list_maturity_answers(app: FastAPI, client: AsyncClient, test_ses
     data = response.json()
     assert len(data["answers"]) >= 1
     assert data["answers"][0]["maturity_question_id"] == maturity_question1.maturity_question_id
+
+
+@pytest.mark.asyncio
+async def test_upsert_maturity_answers(app: FastAPI, client: AsyncClient, test_session):
+    """Test saving answers of a session inserts new ones and overwrites existing ones."""
+    # Create test session and maturity questions
+    session = Session(
+        user_id=1,  # Assuming user with ID 1 exists
+        session_token="test_token_upsert",
+        is_active=True
+    )
+    first = MaturityQuestion(question_text="First question", question_type="multiple_choice")
+    second = MaturityQuestion(question_text="Second question", question_type="multiple_choice")
+    test_session.add_all([session, first, second])
+    await test_session.commit()
+    for instance in (session, first, second):
+        await test_session.refresh(instance)
+
+    await client.put("/maturity-answers/bulk", json={
+        "session_id": session.session_id,
+        "answers": [{"maturity_question_id": first.maturity_question_id, "answer_text": "First"}]
+    })
+
+    # Act
+    response = await client.put("/maturity-answers/bulk", json={
+        "session_id": session.session_id,
+        "answers": [
+            {"maturity_question_id": first.maturity_question_id, "answer_text": "First again"},
+            {"maturity_question_id": second.maturity_question_id, "answer_text": "Second"}
+        ]
+    })
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 1, "updated": 1}
+
+    repository = MaturityAnswerRepository(test_session)
+    answers, _, _ = await repository.list_all(session_id=session.session_id)
+    assert {a.maturity_question_id: a.answer_text for a in answers} == {
+        first.maturity_question_id: "First again",
+        second.maturity_question_id: "Second"
+    }
@@ -9,6 +9,7 @@ from domain.command.maturity_question_command import (
     GetMaturityQuestion,
     MaturityQuestionResponse
 )
+from adapters.postgres.models.agent import Agent
 from adapters.postgres.models.maturity_question import MaturityQuestion
 from adapters.postgres.repositories.maturity_question_repository import MaturityQuestionRepository
 
@@ -192,3 +193,68 @@ async def test_list_maturity_questions(app: FastAPI, client: AsyncClient, test_s
     data = response.json()
     assert len(data["questions"]) == 1
     assert data["questions"][0]["question_text"] == "Maturity question 2"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_maturity_questions(app: FastAPI, client: AsyncClient, test_session):
+    """Test creating maturity questions with nested options in one request."""
+    # Arrange
+    agent = Agent(agent_name="Bulk agent")
+    test_session.add(agent)
+    await test_session.commit()
+    await test_session.refresh(agent)
+
+    bulk_data = {
+        "questions": [
+            {
+                "question_text": "Bulk question 1",
+                "question_type": "multiple_choice",
+                "options": [
+                    {"agent_id": agent.agent_id, "response_text": "Option A"},
+                    {"agent_id": agent.agent_id, "response_text": "Option B"}
+                ]
+            },
+            {"question_text": "Bulk question 2", "question_type": "free_text"}
+        ]
+    }
+
+    # Act
+    response = await client.post("/maturity-questions/bulk", json=bulk_data)
+
+    # Assert
+    assert response.status_code == 200
+    created = response.json()["questions"]
+    assert len(created) == 2
+    assert len(created[0]["option_ids"]) == 2
+    assert created[1]["option_ids"] == []
+
+    repository = MaturityQuestionRepository(test_session)
+    for question, data in zip(created, bulk_data["questions"]):
+        maturity_question = await repository.get(
+            GetMaturityQuestion(maturity_question_id=question["maturity_question_id"])
+        )
+        assert maturity_question.question_text == data["question_text"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_maturity_questions_is_atomic(app: FastAPI, client: AsyncClient, test_session):
+    """Test a rejected option rolls back the whole bulk creation."""
+    # Arrange
+    bulk_data = {
+        "questions": [
+            {"question_text": "Kept only if all succeed", "question_type": "free_text"},
+            {
+                "question_text": "Question with invalid agent",
+                "question_type": "multiple_choice",
+                "options": [{"agent_id": 999999, "response_text": "Option"}]
+            }
+        ]
+    }
+
+    # Act
+    response = await client.post("/maturity-questions/bulk", json=bulk_data)
+
+    # Assert
+    assert response.status_code == 400
+    response = await client.get("/maturity-questions/")
+    assert response.json()["questions"] == []
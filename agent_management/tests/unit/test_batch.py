@@ -0,0 +1,49 @@
+"""Unit tests for batched lookups by ID."""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from adapters.fastapi.batch import id_list
+from adapters.postgres.batch import MAX_IDS, in_order, select_many
+from adapters.postgres.models.axis import Axis
+
+
+def test_select_many_binds_one_array():
+    """Test the IDs are bound as a single ANY(array) parameter."""
+    compiled = select_many(Axis, [3, 1, 2]).compile(dialect=postgresql.dialect())
+
+    assert "WHERE axis.axis_id = ANY (%(ids)s::INTEGER[])" in str(compiled)
+    assert compiled.params == {"ids": [3, 1, 2]}
+
+
+def test_select_many_with_fields():
+    """Test sparse fieldsets apply to batched lookups."""
+    compiled = str(select_many(Axis, [1], ("axis_name",)).compile(dialect=postgresql.dialect()))
+
+    assert compiled.startswith("SELECT axis.axis_id, axis.axis_name \nFROM axis")
+
+
+def test_in_order_follows_ids_and_reports_missing():
+    """Test rows come back in request order and unknown IDs are listed."""
+    rows = [SimpleNamespace(axis_id=i) for i in (1, 2, 3)]
+
+    found, missing = in_order(rows, "axis_id", [3, 9, 1])
+
+    assert [r.axis_id for r in found] == [3, 1]
+    assert missing == [9]
+
+
+def test_id_list_parses_and_dedupes():
+    """Test ids are read in order without duplicates."""
+    assert id_list(None) is None
+    assert id_list("7, 2,7,,5") == (7, 2, 5)
+
+
+@pytest.mark.parametrize("ids", ["", ",", "1,a", ",".join(map(str, range(MAX_IDS + 1)))])
+def test_id_list_rejects_bad_input(ids):
+    """Test empty, non-integer and oversized ID lists are refused."""
+    with pytest.raises(HTTPException) as e:
+        id_list(ids)
+    assert e.value.status_code == 400
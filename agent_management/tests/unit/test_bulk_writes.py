@@ -0,0 +1,109 @@
+"""Unit tests for bulk writes of maturity questions and answers."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from adapters.postgres.catalog import _lock_questions_query, _refresh_catalog_query
+from adapters.postgres.repositories.maturity_answer_repository import MaturityAnswerRepository
+from adapters.postgres.repositories.maturity_question_repository import MaturityQuestionRepository
+from domain.command.maturity_answer_command import UpsertMaturityAnswer, UpsertMaturityAnswers
+from domain.command.maturity_question_command import (
+    BulkCreateMaturityQuestions,
+    BulkMaturityQuestion,
+    BulkMaturityQuestionOption
+)
+
+
+def returning(*ids):
+    """Result of an INSERT ... RETURNING that generated ``ids``."""
+    return MagicMock(**{"scalars.return_value.all.return_value": list(ids)})
+
+
+def bulk_session(*results):
+    """Session answering each statement with the next of ``results``."""
+    session = AsyncMock()
+    session.info = {}
+    session.execute.side_effect = list(results)
+    return session
+
+
+def question(text, *options):
+    return BulkMaturityQuestion(
+        question_text=text,
+        question_type="multiple_choice",
+        options=[BulkMaturityQuestionOption(agent_id=1, response_text=o) for o in options]
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_matches_generated_ids_to_input_order():
+    """Test options are attached to the question IDs returned in parameter order."""
+    session = bulk_session(returning(10, 11, 12), returning(100, 101, 102), None, None)
+    command = BulkCreateMaturityQuestions(questions=[
+        question("first", "a", "b"), question("second"), question("third", "c")])
+
+    created = await MaturityQuestionRepository(session).bulk_create(command)
+
+    questions, options, lock, refresh = session.execute.await_args_list
+    assert questions.args[0]._sort_by_parameter_order
+    assert [row["question_text"] for row in questions.args[1]] == ["first", "second", "third"]
+    assert options.args[0]._sort_by_parameter_order
+    assert [(row["maturity_question_id"], row["response_text"]) for row in options.args[1]] == [
+        (10, "a"), (10, "b"), (12, "c")]
+    assert lock.args == (_lock_questions_query(True), {"ids": [10, 11, 12]})
+    assert refresh.args == (_refresh_catalog_query(True), {"ids": [10, 11, 12]})
+    assert [(q.maturity_question_id, q.option_ids) for q in created.questions] == [
+        (10, [100, 101]), (11, []), (12, [102])]
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_without_options_skips_their_insert():
+    """Test questions alone are written in one statement with no catalog refresh."""
+    session = bulk_session(returning(10, 11))
+    command = BulkCreateMaturityQuestions(questions=[question("first"), question("second")])
+
+    created = await MaturityQuestionRepository(session).bulk_create(command)
+
+    assert session.execute.await_count == 1
+    assert [q.maturity_question_id for q in created.questions] == [10, 11]
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rolls_back_on_constraint_violation():
+    """Test a rejected option discards the questions written before it."""
+    session = bulk_session(
+        returning(10), IntegrityError("INSERT", {}, Exception("agent_id not present")))
+    command = BulkCreateMaturityQuestions(questions=[question("first", "a")])
+
+    with pytest.raises(ValueError):
+        await MaturityQuestionRepository(session).bulk_create(command)
+
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_upsert_many_counts_inserted_and_updated_rows():
+    """Test one statement upserts on the session-question key, last answer winning."""
+    session = bulk_session([SimpleNamespace(inserted=True), SimpleNamespace(inserted=False)])
+    command = UpsertMaturityAnswers(session_id=7, answers=[
+        UpsertMaturityAnswer(maturity_question_id=1, answer_text="draft"),
+        UpsertMaturityAnswer(maturity_question_id=2, answer_text="b"),
+        UpsertMaturityAnswer(maturity_question_id=1, answer_text="a"),
+    ])
+
+    counts = await MaturityAnswerRepository(session).upsert_many(command)
+
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT ON CONSTRAINT uq_session_maturity_question DO UPDATE" in str(compiled)
+    assert str(compiled).endswith("RETURNING xmax = 0 AS inserted")
+    answers = {
+        value for name, value in compiled.params.items() if name.startswith("answer_text")}
+    assert answers == {"a", "b"}
+    assert (counts.inserted, counts.updated) == (1, 1)
+    session.commit.assert_awaited_once()
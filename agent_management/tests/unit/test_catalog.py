@@ -0,0 +1,107 @@
+"""Unit tests for maintenance of the maturity question catalog."""
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from adapters.postgres import catalog
+from adapters.postgres.catalog import (
+    CATALOG_READY_SQL,
+    MARK_BACKFILLED_SQL,
+    _lock_questions_query,
+    _refresh_catalog_query,
+    backfill_catalog,
+    catalog_ready,
+    refresh_catalog
+)
+
+
+def test_selected_refresh_binds_one_array():
+    """Test a partial refresh filters both the upsert and the delete by ANY(:ids)."""
+    compiled = str(_refresh_catalog_query(True).compile(dialect=postgresql.dialect()))
+
+    assert "mq.maturity_question_id = ANY(%(ids)s::INTEGER[])" in compiled
+    assert "c.maturity_question_id = ANY(%(ids)s::INTEGER[])" in compiled
+
+
+def test_refresh_locks_questions_in_order():
+    """Test questions are locked in ID order without blocking response inserts."""
+    statement = str(_lock_questions_query(True))
+
+    assert "ORDER BY maturity_question_id" in statement
+    assert statement.rstrip().endswith("FOR NO KEY UPDATE")
+
+
+def test_full_refresh_has_no_filter():
+    """Test a full refresh rebuilds every row."""
+    assert "ANY" not in str(_refresh_catalog_query(False))
+
+
+@pytest.mark.asyncio
+async def test_refresh_dedupes_ids():
+    """Test IDs are refreshed once each, in a stable order, skipping None."""
+    session = AsyncMock()
+
+    await refresh_catalog(session, [3, None, 1, 3])
+
+    assert session.execute.await_args_list == [
+        call(_lock_questions_query(True), {"ids": [1, 3]}),
+        call(_refresh_catalog_query(True), {"ids": [1, 3]})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_ids_is_skipped():
+    """Test nothing is executed when no question changed."""
+    session = AsyncMock()
+
+    await refresh_catalog(session, [None])
+
+    session.execute.assert_not_awaited()
+
+
+@pytest.fixture
+def unchecked(monkeypatch):
+    monkeypatch.setattr(catalog, "_catalog_ready", False)
+
+
+def checking_session(*answers):
+    """Session answering the readiness query with each of ``answers`` in turn."""
+    session = AsyncMock()
+    session.execute.side_effect = [MagicMock(scalar=MagicMock(return_value=a)) for a in answers]
+    return session
+
+
+@pytest.mark.asyncio
+async def test_catalog_awaiting_backfill_is_checked_again(unchecked):
+    """Test a catalog that is missing or not yet backfilled is checked on every call."""
+    session = checking_session(None, False)
+
+    assert await catalog_ready(session) is False
+    assert await catalog_ready(session) is False
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_backfilled_catalog_is_remembered(unchecked):
+    """Test a backfilled catalog is only checked once per process."""
+    session = checking_session(True)
+
+    assert await catalog_ready(session) is True
+    assert await catalog_ready(session) is True
+    session.execute.assert_awaited_once_with(CATALOG_READY_SQL)
+
+
+@pytest.mark.asyncio
+async def test_backfill_refreshes_everything_then_marks(unchecked):
+    """Test the backfill marks the catalog in the transaction that fills it."""
+    session = AsyncMock()
+
+    await backfill_catalog(session)
+
+    assert session.execute.await_args_list == [
+        call(_lock_questions_query(False)),
+        call(_refresh_catalog_query(False)),
+        call(MARK_BACKFILLED_SQL)
+    ]
+    session.commit.assert_not_awaited()
@@ -0,0 +1,40 @@
+"""Unit tests for the company tree query."""
+from adapters.postgres.repositories.company_repository import _company_tree_query
+from domain.command.company_command import CompanyTree
+
+
+def test_depth_limits_the_levels_aggregated():
+    """Test each depth adds exactly one level of subqueries."""
+    company, first, second = (str(_company_tree_query(depth)) for depth in range(3))
+
+    assert "domains" not in company and "projects" not in company
+    assert "'domains'" in first and "'projects'" in first and "subdomains" not in first
+    assert "'subdomains'" in second
+
+
+def test_tree_is_one_statement_on_the_schema_placeholder():
+    """Test the tree is read with a single SELECT the engine can schema-qualify."""
+    sql = str(_company_tree_query(2))
+
+    assert sql.count("WHERE c.company_id = :company_id") == 1
+    assert "__[SCHEMA__none].subdomains s" in sql
+    assert "JOIN" not in sql
+
+
+def test_tree_document_validates_nested_levels():
+    """Test the JSON document maps onto the nested response models."""
+    tree = CompanyTree.model_validate({
+        "company_id": 1,
+        "company_name": "Acme",
+        "industry_id": 2,
+        "domains": [{
+            "domain_id": 3,
+            "domain_name": "Data",
+            "subdomains": [{"subdomain_id": 4, "subdomain_name": "Quality"}],
+        }],
+        "projects": [],
+    })
+
+    assert tree.domains[0].subdomains[0].subdomain_name == "Quality"
+    assert tree.projects == []
+    assert CompanyTree(company_id=1, company_name="Acme").domains is None
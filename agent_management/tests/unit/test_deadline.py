@@ -0,0 +1,104 @@
+"""Unit tests for request database deadlines."""
+import asyncio
+import contextvars
+
+import pytest
+from sqlalchemy.orm import Session
+
+from adapters.postgres import deadline
+
+
+def run_in_request(fn):
+    """Run ``fn`` in a fresh context, as each request does."""
+    return contextvars.copy_context().run(fn)
+
+
+def test_no_deadline_by_default():
+    """Test requests without a budget leave statement_timeout alone."""
+    assert run_in_request(deadline.remaining_ms) is None
+
+
+def test_deadline_only_tightens():
+    """Test a route budget is not widened by the default deadline."""
+    def request():
+        deadline.start_deadline(5)
+        deadline.start_deadline(25)
+        return deadline.remaining_ms()
+
+    assert 4000 < run_in_request(request) <= 5000
+
+
+def test_expired_deadline_raises():
+    """Test no new transaction starts once the budget is spent."""
+    def request():
+        deadline.start_deadline(0)
+        with pytest.raises(deadline.DeadlineExceeded):
+            deadline.remaining_ms()
+
+    run_in_request(request)
+
+
+@pytest.mark.asyncio
+async def test_route_dependency_sets_budget():
+    """Test the route dependency starts the request deadline."""
+    async def request():
+        await deadline.deadline(2)()
+        return deadline.remaining_ms()
+
+    assert 1000 < await asyncio.create_task(request()) <= 2000
+    assert deadline.remaining_ms() is None
+
+
+class FakeConnection:
+    """Records the statements sent when a transaction begins."""
+
+    def __init__(self, statement_timeout_ms=None):
+        self.info = {}
+        if statement_timeout_ms:
+            self.info[deadline.STATEMENT_TIMEOUT_MS] = statement_timeout_ms
+        self.statements = []
+
+    def exec_driver_sql(self, statement):
+        self.statements.append(statement)
+
+
+class DeadlineSession(Session):
+    """Session class the deadline is installed on."""
+
+
+deadline.install(DeadlineSession)
+
+
+def begin(connection, budget=None):
+    """Begin a transaction on ``connection`` in a request with ``budget``."""
+    def request():
+        if budget is not None:
+            deadline.start_deadline(budget)
+        session = DeadlineSession()
+        session.dispatch.after_begin(session, None, connection)
+        return connection.statements
+
+    return run_in_request(request)
+
+
+def test_default_budget_relies_on_connection_timeout():
+    """Test no SET LOCAL is sent when the connection already times out first."""
+    assert begin(FakeConnection(statement_timeout_ms=25000), budget=25) == []
+
+
+def test_tighter_budget_sets_local_timeout():
+    """Test a route budget below the connection's timeout is applied."""
+    statements = begin(FakeConnection(statement_timeout_ms=25000), budget=5)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("SET LOCAL statement_timeout = ")
+
+
+def test_unknown_connection_timeout_sets_local_timeout():
+    """Test connections behind a transaction pooler get the budget per transaction."""
+    assert len(begin(FakeConnection(), budget=25)) == 1
+
+
+def test_no_budget_leaves_timeout_alone():
+    """Test requests without a deadline send nothing."""
+    assert begin(FakeConnection()) == []
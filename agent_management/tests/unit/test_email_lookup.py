@@ -0,0 +1,57 @@
+"""Unit tests for case-insensitive email lookup and search."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from adapters.fastapi.routes.registration_routes import get_user_data_route
+from adapters.postgres.repositories.user_repository import UserRepository, normalize_email
+from domain.command.user_command import GetUser
+
+
+def _compiled(session):
+    stmt = session.execute.await_args.args[0]
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def test_normalize_email():
+    """Test emails are trimmed and lower-cased."""
+    assert normalize_email("  Ann.Smith@Example.COM ") == "ann.smith@example.com"
+
+
+@pytest.mark.asyncio
+async def test_get_by_email_matches_lower_email():
+    """Test lookups by email compare lower(email) with the normalized value."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(**{"scalar_one_or_none.return_value": None})
+
+    await UserRepository(session).get(GetUser(email=" Bob@Example.com"))
+
+    compiled = _compiled(session)
+    assert "WHERE lower(users.email) = %(lower_1)s" in str(compiled)
+    assert compiled.params["lower_1"] == "bob@example.com"
+
+
+@pytest.mark.asyncio
+async def test_search_escapes_like_wildcards():
+    """Test % and _ in the term match literally."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(**{"scalars.return_value": []})
+
+    await UserRepository(session).search(" bob_j%s ", limit=5)
+
+    compiled = _compiled(session)
+    assert "WHERE users.email ILIKE %(email_1)s::VARCHAR ESCAPE '\\'" in str(compiled)
+    assert compiled.params["email_1"] == "%bob\\_j\\%s%"
+
+
+@pytest.mark.asyncio
+async def test_unknown_email_is_not_found():
+    """Test registration data for an email no user has is a 404, not a 500."""
+    handler = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException) as error:
+        await get_user_data_route(GetUser(email="nobody@example.com"), handler)
+
+    assert error.value.status_code == 404
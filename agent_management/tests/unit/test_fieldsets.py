@@ -0,0 +1,52 @@
+"""Unit tests for sparse fieldsets."""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from adapters.fastapi.fieldsets import fieldset, sparse
+from adapters.postgres.fieldsets import select_fields, selection, to_response
+from adapters.postgres.models.company import Company
+from domain.command.company_command import CompanyResponse
+
+
+def test_selection_keeps_primary_key():
+    """Test the primary key is always selected alongside requested fields."""
+    assert selection(Company, None) == [Company]
+    assert selection(Company, ("company_name",)) == [Company.company_id, Company.company_name]
+    assert selection(Company, ("company_name", "company_id")) == [
+        Company.company_id, Company.company_name
+    ]
+
+
+def test_select_fields_selects_only_requested_columns():
+    """Test each fieldset compiles to its own column list."""
+    for _ in range(2):
+        narrow = str(select_fields(Company, ("company_name",)).compile(dialect=postgresql.dialect()))
+        full = str(select_fields(Company, None).compile(dialect=postgresql.dialect()))
+
+    assert "industry_id" not in narrow
+    assert "companies.company_name" in narrow
+    assert "companies.industry_id" in full
+
+
+def test_partial_response_serializes_requested_fields_only():
+    """Test a partial model leaves unrequested fields out of the payload."""
+    row = SimpleNamespace(company_id=7, company_name="Acme")
+
+    response = sparse(to_response(CompanyResponse, row, ("company_name",)), ("company_name",))
+
+    assert response.body == b'{"company_name":"Acme"}'
+
+
+def test_fieldset_rejects_unknown_fields():
+    """Test names that are not fields of the response model are refused."""
+    read_fields = fieldset(CompanyResponse)
+
+    assert read_fields(None) is None
+    assert read_fields(" company_name,company_id,company_name") == ("company_name", "company_id")
+    for fields in ("password", ","):
+        with pytest.raises(HTTPException) as e:
+            read_fields(fields)
+        assert e.value.status_code == 400
@@ -0,0 +1,60 @@
+"""Unit tests for the compiled-cache reuse of the repository filter queries."""
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.util import LRUCache
+
+from adapters.postgres.repositories.maturity_question_repository import MaturityQuestionRepository
+
+
+class CompilingSession:
+    """Session stand-in recording the SQL of each statement and cache misses."""
+
+    def __init__(self):
+        self.dialect = asyncpg_dialect()
+        self.cache = LRUCache(500)
+        self.compilations = 0
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        compiled, _, _, cache_hit = stmt._compile_w_cache(
+            self.dialect, compiled_cache=self.cache, column_keys=[]
+        )
+        if cache_hit != self.dialect.CACHE_HIT:
+            self.compilations += 1
+        self.statements.append(str(compiled))
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_filter_values_reuse_the_compiled_statement():
+    """Test new filter values hit the compiled cache instead of recompiling."""
+    session = CompilingSession()
+    repository = MaturityQuestionRepository(session)
+
+    for axis_id in range(1, 6):
+        await repository.list_all(category="governance", axis_id=axis_id)
+
+    assert session.compilations == 1
+    assert len(set(session.statements)) == 1
+
+
+@pytest.mark.asyncio
+async def test_each_filter_combination_compiles_once():
+    """Test a different set of filters gets its own cached statement."""
+    session = CompilingSession()
+    repository = MaturityQuestionRepository(session)
+
+    for _ in range(2):
+        await repository.list_all(category="governance")
+        await repository.list_all(axis_id=3)
+        await repository.list_all(category="governance", axis_id=3)
+
+    assert session.compilations == 3
+    assert "axis_id" not in session.statements[0].split("WHERE")[1]
+    assert "category" not in session.statements[1].split("WHERE")[1]
@@ -0,0 +1,94 @@
+"""Unit tests for the online index migration."""
+import re
+
+import pytest
+from sqlalchemy import event
+
+from adapters.postgres import config, migrations
+from adapters.postgres.migrations import EXTENSIONS, OBSOLETE_INDEXES, TABLES, index_statements
+
+
+def test_indexes_are_built_concurrently_before_drops():
+    """Test extensions come first and model indexes are built before old ones are dropped."""
+    statements = index_statements()
+    extensions = [s for s in statements if s.startswith("CREATE EXTENSION")]
+    creates = [s for s in statements if re.match(r"CREATE (UNIQUE )?INDEX", s)]
+    drops = [s for s in statements if s.startswith("DROP")]
+
+    assert len(extensions) == len(EXTENSIONS)
+    assert len(creates) == sum(len(table.indexes) for table in TABLES)
+    assert all(re.match(r"CREATE (UNIQUE )?INDEX CONCURRENTLY IF NOT EXISTS", s) for s in creates)
+    assert len(drops) == len(OBSOLETE_INDEXES)
+    assert all(s.startswith("DROP INDEX CONCURRENTLY IF EXISTS") for s in drops)
+    assert statements == extensions + creates + drops
+
+
+def test_unavailable_extension_skips_its_indexes():
+    """Test servers without pg_trgm get every index but the trigram one."""
+    statements = index_statements(unavailable={"pg_trgm"})
+
+    assert not any("pg_trgm" in s or "idx_user_email_trgm" in s for s in statements)
+    assert (
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_user_email_lower "
+        "ON __[SCHEMA__none].users (lower(email))"
+    ) in statements
+
+
+def test_statements_keep_schema_placeholder():
+    """Test tables are left for the engine's schema_translate_map to qualify."""
+    assert (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_maturity_answer_question_id_id "
+        "ON __[SCHEMA__none].maturity_answers (maturity_question_id, maturity_answer_id)"
+    ) in index_statements()
+
+
+def test_catalog_indexes_are_migrated():
+    """Test the catalog's access paths are built like every other index."""
+    statements = index_statements()
+
+    assert (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_maturity_question_catalog_axis_order "
+        "ON __[SCHEMA__none].maturity_question_catalog (axis_id, ambitus_id, question_order)"
+    ) in statements
+    assert any("idx_maturity_question_catalog_industry_order" in s for s in statements)
+
+
+def test_obsolete_indexes_are_not_declared():
+    """Test the migration never drops an index the models still declare."""
+    declared = {index.name for table in TABLES for index in table.indexes}
+
+    assert declared.isdisjoint(OBSOLETE_INDEXES)
+
+
+class _Connected(Exception):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_migration_connections_have_no_statement_timeout(monkeypatch):
+    """Test the migration does not run under the request deadline's timeout."""
+    engines = []
+
+    async def migrate(engine):
+        engines.append(engine)
+
+    monkeypatch.setattr(config, "get_secret", lambda secret_name: {
+        "username": "postgres", "password": "postgres", "host": "localhost",
+        "port": 5432, "dbname": "agent_management"
+    })
+    monkeypatch.setattr(config, "_install_credential_refresh", lambda engine: None)
+    monkeypatch.setattr(migrations, "migrate_indexes", migrate)
+    monkeypatch.setattr(migrations, "migrate_catalog", migrate)
+    await migrations.main()
+
+    parameters = {}
+
+    @event.listens_for(engines[0].sync_engine, "do_connect")
+    def capture(dialect, conn_rec, cargs, cparams):
+        parameters.update(cparams)
+        raise _Connected
+
+    with pytest.raises(_Connected):
+        await engines[0].connect()
+    assert engines[0] is engines[1]
+    assert "statement_timeout" not in parameters.get("server_settings", {})
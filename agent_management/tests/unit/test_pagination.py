@@ -0,0 +1,121 @@
+"""Unit tests for keyset pagination."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects import postgresql
+
+from adapters.postgres.models.session import Session
+from adapters.postgres.pagination import (
+    ESTIMATE_THRESHOLD,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset,
+    page
+)
+
+
+def test_cursor_round_trip():
+    """Test a cursor decodes to the key it was built from."""
+    cursor = encode_cursor(1234567)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == 1234567
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "e30", encode_cursor(1)[:-2], "eyJrIjoiMSJ9"])
+def test_invalid_cursor(cursor):
+    """Test cursors not issued by the API are rejected."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_keyset_orders_and_limits_by_key():
+    """Test a page query seeks past the cursor and fetches one extra row."""
+    stmt = keyset(lambda_stmt(lambda: select(Session)), Session.session_id, 50, 10)
+    compiled = stmt.compile(dialect=postgresql.dialect())
+
+    assert "WHERE sessions.session_id > " in str(compiled)
+    assert "ORDER BY sessions.session_id" in str(compiled)
+    assert list(compiled.params.values()) == [10, 51]
+
+
+def test_keyset_without_page_keeps_statement():
+    """Test list queries are unchanged when no page is requested."""
+    stmt = lambda_stmt(lambda: select(Session))
+
+    assert keyset(stmt, Session.session_id, None, None) is stmt
+
+
+def test_page_returns_cursor_of_last_row():
+    """Test the extra row is dropped and the last kept row becomes the cursor."""
+    rows = [SimpleNamespace(session_id=i) for i in (3, 5, 8)]
+
+    items, next_cursor = page(rows, "session_id", 2)
+
+    assert [r.session_id for r in items] == [3, 5]
+    assert decode_cursor(next_cursor) == 5
+
+
+def test_last_page_has_no_cursor():
+    """Test a short page ends the listing."""
+    rows = [SimpleNamespace(session_id=i) for i in (3, 5)]
+
+    assert page(rows, "session_id", 2) == (rows, None)
+    assert page(rows, "session_id", None) == (rows, None)
+
+
+def _session(*scalars):
+    """Fake session whose queries return ``scalars`` in order."""
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[
+        MagicMock(scalar_one=MagicMock(return_value=value)) for value in scalars
+    ])
+    return session
+
+
+@pytest.mark.asyncio
+async def test_no_count_runs_no_query():
+    """Test the total is skipped unless requested."""
+    session = _session()
+
+    assert await count_rows(session, lambda_stmt(lambda: select(Session)), "sessions", "none", False) is None
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_of_large_table_uses_statistics():
+    """Test an unfiltered estimate is read from pg_class, not counted."""
+    session = _session(ESTIMATE_THRESHOLD * 3)
+
+    total = await count_rows(session, lambda_stmt(lambda: select(Session)), "sessions", "estimated", False)
+
+    assert total == ESTIMATE_THRESHOLD * 3
+    assert "pg_class" in str(session.execute.call_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_of_small_table_is_exact():
+    """Test small or never analyzed tables fall back to count(*)."""
+    session = _session(-1, 42)
+
+    total = await count_rows(session, lambda_stmt(lambda: select(Session)), "sessions", "estimated", False)
+
+    assert total == 42
+    counted = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    assert str(counted).startswith("SELECT count(*)")
+
+
+@pytest.mark.asyncio
+async def test_filtered_count_is_exact():
+    """Test filtered lists are counted with their filters."""
+    session = _session(3)
+    stmt = lambda_stmt(lambda: select(Session))
+    stmt += lambda s: s.where(Session.is_active == True)
+
+    assert await count_rows(session, stmt, "sessions", "estimated", True) == 3
+    counted = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "count(*)" in counted and "WHERE sessions.is_active" in counted
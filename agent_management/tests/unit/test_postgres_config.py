@@ -0,0 +1,388 @@
+"""Unit tests for the shared database engine."""
+import contextvars
+import time
+
+import pytest
+import pytest_asyncio
+from asyncpg.exceptions import InvalidAuthorizationSpecificationError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from adapters.postgres import config
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def database_secret(monkeypatch):
+    """Stub the database secret and reset the shared engine."""
+    monkeypatch.setattr(config, "get_secret", lambda secret_name: {
+        "username": "postgres",
+        "password": "postgres",
+        "host": "localhost",
+        "port": 5432,
+        "dbname": "agent_management"
+    })
+    config.clear_secret_cache()
+    await config.dispose_engine()
+    yield
+    await config.dispose_engine()
+    config.clear_secret_cache()
+
+
+@pytest.mark.asyncio
+async def test_engine_is_reused():
+    """Test the engine and session factory are created once per process."""
+    engine = config.get_engine()
+    factory = config.get_session_factory()
+
+    assert config.get_engine() is engine
+    assert config.get_session_factory() is factory
+
+
+@pytest.mark.asyncio
+async def test_dispose_engine_resets_state():
+    """Test disposing the engine makes the next call build a new one."""
+    engine = config.get_engine()
+
+    await config.dispose_engine()
+
+    assert config.get_engine() is not engine
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_engine():
+    """Test sessions from the dependency are bound to the shared engine."""
+    sessions = config.get_session()
+    session = await sessions.__anext__()
+
+    assert session.bind is config.get_engine()
+    await sessions.aclose()
+
+
+def test_secret_is_cached_within_ttl(monkeypatch):
+    """Test Secrets Manager is only called again once the TTL expires."""
+    calls = []
+    monkeypatch.setattr(config, "get_secret", lambda secret_name: calls.append(secret_name) or {"n": len(calls)})
+    config.clear_secret_cache()
+
+    first = config.get_cached_secret("dev/database", ttl_seconds=300)
+    second = config.get_cached_secret("dev/database", ttl_seconds=300)
+    expired = config.get_cached_secret("dev/database", ttl_seconds=0)
+
+    assert first is second
+    assert expired == {"n": 2}
+    assert calls == ["dev/database", "dev/database"]
+    config.clear_secret_cache()
+
+
+def test_secret_force_refresh(monkeypatch):
+    """Test a forced refresh bypasses the cached secret."""
+    calls = []
+    monkeypatch.setattr(config, "get_secret", lambda secret_name: calls.append(secret_name) or {"n": len(calls)})
+    config.clear_secret_cache()
+
+    config.get_cached_secret("dev/database", ttl_seconds=300)
+    refreshed = config.get_cached_secret("dev/database", ttl_seconds=300, force_refresh=True)
+
+    assert refreshed == {"n": 2}
+    config.clear_secret_cache()
+
+
+def test_rejected_credentials_are_refreshed_once(monkeypatch):
+    """Test a rotated password is fetched again and the connection retried with it."""
+    calls = []
+    monkeypatch.setattr(config, "get_secret", lambda secret_name: calls.append(secret_name) or {
+        "username": "app", "password": f"password {len(calls)}"})
+    config.clear_secret_cache()
+    engine = create_async_engine("postgresql+asyncpg://app@localhost/agent_management")
+    config._install_credential_refresh(engine)
+
+    dialect = engine.sync_engine.dialect
+    attempts = []
+
+    def connect(*cargs, **cparams):
+        attempts.append(cparams["password"])
+        if len(attempts) == 1:
+            raise InvalidAuthorizationSpecificationError("password authentication failed")
+        return "connection"
+
+    monkeypatch.setattr(dialect, "connect", connect)
+    connections = [hook(dialect, None, [], {}) for hook in dialect.dispatch.do_connect]
+
+    assert connections == ["connection"]
+    assert attempts == ["password 1", "password 2"]
+    assert len(calls) == 2
+    assert config._credentials_rotated
+    config.clear_secret_cache()
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_without_replica():
+    """Test reads use the primary when no replica is configured."""
+    assert config.get_read_session_factory() is config.get_session_factory()
+
+
+@pytest.fixture
+def replica_secret(monkeypatch):
+    """Point the secret at a primary with a read replica."""
+    monkeypatch.setattr(config, "get_secret", lambda secret_name: {
+        "username": "postgres",
+        "password": "postgres",
+        "host": "primary",
+        "read_host": "replica",
+        "port": 5432,
+        "dbname": "agent_management"
+    })
+
+
+def in_request(fn, *args):
+    """Run ``fn`` in a fresh context, as each request does."""
+    return contextvars.copy_context().run(fn, *args)
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_outside_write_window(replica_secret, monkeypatch):
+    """Test reads go to the replica unless the caller just wrote."""
+    primary = config.get_session_factory()
+    replica = config.get_read_session_factory()
+
+    assert replica is not primary
+    assert config._read_engine.url.host == "replica"
+
+    monkeypatch.setattr(config, "_read_your_writes_seconds", 5.0)
+
+    def request(last_write_at):
+        config.track_caller_writes(last_write_at)
+        return config.get_read_session_factory()
+
+    assert in_request(request, time.time() - 1) is primary
+    assert in_request(request, time.time() - 10) is replica
+    assert in_request(request, None) is replica
+
+
+@pytest.mark.asyncio
+async def test_write_window_is_scoped_to_the_caller(replica_secret, monkeypatch):
+    """Test a commit moves only the committing caller's reads to the primary."""
+    replica = config.get_read_session_factory()
+    monkeypatch.setattr(config, "_read_your_writes_seconds", 5.0)
+
+    def request(write):
+        writes = config.track_caller_writes()
+        if write:
+            config._record_write(None)
+        return writes, config.get_read_session_factory()
+
+    writes, factory = in_request(request, True)
+    assert writes.wrote and writes.last_write_at <= time.time()
+    assert factory is config.get_session_factory()
+
+    writes, factory = in_request(request, False)
+    assert not writes.wrote
+    assert factory is replica
+
+
+@pytest.mark.asyncio
+async def test_request_sessions_open_on_first_use():
+    """Test sessions are only opened when used and reads share the primary."""
+    sessions = config.get_sessions()
+    request_sessions = await sessions.__anext__()
+
+    assert request_sessions._primary is None and request_sessions._read is None
+    assert request_sessions.read is request_sessions.primary
+    await sessions.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_sessions_read_from_replica(replica_secret):
+    """Test reads get their own session when they go to the replica."""
+    request_sessions = config.RequestSessions()
+
+    assert request_sessions.read.bind is config._read_engine
+    assert request_sessions._primary is None
+    await request_sessions.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("replica", [False, True])
+async def test_single_pool_mode_serves_both_sessions(request, monkeypatch, replica):
+    """Test a request with primary and read sessions open needs one
+    connection per pool in single mode."""
+    if replica:
+        request.getfixturevalue("replica_secret")
+    monkeypatch.setattr(config.get_settings().local_settings, "DB_POOL_MODE", "single")
+    request_sessions = config.RequestSessions()
+
+    primary, read = request_sessions.primary, request_sessions.read
+
+    assert (read is primary) is not replica
+    for session in {primary, read}:
+        pool = session.bind.sync_engine.pool
+        assert (pool.size(), pool._max_overflow) == (1, 0)
+    assert len({session.bind for session in {primary, read}}) == len({primary, read})
+    await request_sessions.close()
+
+
+def test_single_pool_mode_keeps_one_connection():
+    """Test the Lambda pool mode caps the pool at one connection."""
+    options = config._pool_options(config.DatabaseLocalSettings(DB_POOL_MODE="single"))
+
+    assert options["pool_size"] == 1
+    assert options["max_overflow"] == 0
+
+
+def test_connections_open_with_request_deadline_timeout():
+    """Test direct connections time statements out at the request deadline."""
+    options = config._pool_options(config.DatabaseLocalSettings(DB_REQUEST_DEADLINE_SECONDS=25))
+
+    assert options["connect_args"]["server_settings"] == {"statement_timeout": "25000"}
+
+
+def test_maintenance_connections_have_no_request_timeout(monkeypatch):
+    """Test engines outside requests leave statements unbounded."""
+    created = {}
+    monkeypatch.setattr(config, "create_engine", lambda *args, **kwargs: created.update(kwargs))
+
+    config.create_maintenance_engine()
+
+    assert created == {"request_timeout": False}
+    assert "connect_args" not in config._pool_options(
+        config.DatabaseLocalSettings(DB_REQUEST_DEADLINE_SECONDS=25), request_timeout=False)
+
+
+def test_null_pool_mode_behind_transaction_pooler():
+    """Test the pooler-safe setup disables prepared statement caching."""
+    options = config._pool_options(config.DatabaseLocalSettings(
+        DB_POOL_MODE="null",
+        DB_TRANSACTION_POOLER=True
+    ))
+
+    assert options["poolclass"] is config.NullPool
+    assert "pool_size" not in options
+    assert "server_settings" not in options["connect_args"]
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    name_func = options["connect_args"]["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+class FakeSession:
+    """Records the transaction calls a unit of work makes."""
+
+    def __init__(self):
+        self.info = {}
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def flush(self):
+        self.calls.append("flush")
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    async def close(self):
+        self.calls.append("close")
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Make the session factory hand out a single fake session."""
+    session = FakeSession()
+    monkeypatch.setattr(config, "get_session_factory", lambda: lambda: session)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once(fake_session):
+    """Test repository writes inside a unit of work are committed together."""
+    sessions = config.get_unit_of_work()
+    session = await sessions.__anext__()
+
+    await config.commit(session)
+    await config.commit(session)
+    with pytest.raises(StopAsyncIteration):
+        await sessions.__anext__()
+
+    assert fake_session.calls == ["flush", "flush", "commit", "close"]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(fake_session):
+    """Test an error in the request discards the flushed writes."""
+    sessions = config.get_unit_of_work()
+    session = await sessions.__anext__()
+
+    await config.commit(session)
+    with pytest.raises(ValueError):
+        await sessions.athrow(ValueError("duplicate"))
+
+    assert fake_session.calls == ["flush", "rollback", "close"]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_skips_commit_without_writes(fake_session):
+    """Test read-only requests do not send a commit."""
+    sessions = config.get_unit_of_work()
+    await sessions.__anext__()
+    with pytest.raises(StopAsyncIteration):
+        await sessions.__anext__()
+
+    assert fake_session.calls == ["close"]
+
+
+@pytest.mark.asyncio
+async def test_commit_outside_unit_of_work():
+    """Test repositories keep committing on plain sessions."""
+    session = FakeSession()
+
+    await config.commit(session)
+
+    assert session.calls == ["commit"]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back_plain_session():
+    """Test repositories still roll back their own transaction on errors."""
+    session = FakeSession()
+
+    await config.rollback(session)
+
+    assert session.calls == ["rollback"]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_leaves_rollback_to_unit_of_work(fake_session):
+    """Test a failed write keeps the writes other repositories flushed until
+    the unit of work itself rolls back."""
+    sessions = config.get_unit_of_work()
+    session = await sessions.__anext__()
+
+    await config.commit(session)
+    await config.rollback(session)
+    assert fake_session.calls == ["flush"]
+
+    with pytest.raises(ValueError):
+        await sessions.athrow(ValueError("duplicate"))
+    assert fake_session.calls == ["flush", "rollback", "close"]
+
+
+def test_settings_are_loaded_once():
+    """Test the settings accessor returns the same instance every call."""
+    assert config.get_settings() is config.get_settings()
+    assert config.get_aws_settings() is config.get_aws_settings()
+
+
+@pytest.mark.asyncio
+async def test_engine_translates_schema():
+    """Test tables are mapped to DB_SCHEMA by the engine, not the metadata."""
+    engine = config.get_engine()
+
+    assert config.metadata.schema is None
+    assert engine.get_execution_options()["schema_translate_map"] == {
+        None: config.get_settings().local_settings.DB_SCHEMA
+    }
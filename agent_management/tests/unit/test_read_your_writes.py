@@ -0,0 +1,32 @@
+"""Unit tests for the read-your-writes middleware."""
+import time
+
+import pytest
+
+from adapters.fastapi.middleware.read_your_writes import _parse
+from adapters.postgres import config
+
+
+@pytest.fixture(autouse=True)
+def window(monkeypatch):
+    monkeypatch.setattr(config, "_read_your_writes_seconds", 5.0)
+
+
+def test_recent_write_is_kept():
+    """Test a write inside the window keeps its time."""
+    last_write_at = time.time() - 1
+
+    assert _parse(f"{last_write_at:.3f}") == pytest.approx(last_write_at, abs=0.001)
+
+
+def test_future_write_is_clamped_to_now():
+    """Test a client cannot pin its reads to the primary with a future time."""
+    before = time.time()
+
+    assert before <= _parse(str(before + 3600)) <= time.time()
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", "nan", str(time.time() - 60)])
+def test_malformed_or_expired_write_is_ignored(value):
+    """Test values outside the window or not a time route reads normally."""
+    assert _parse(value) is None
@@ -0,0 +1,76 @@
+"""Unit tests for the SSH tunnel manager."""
+import pytest
+
+from adapters.postgres import tunnel as tunnel_module
+from adapters.postgres.tunnel import SSHTunnelManager
+
+
+class FakeForwarder:
+    """Stand-in for SSHTunnelForwarder that records its lifecycle."""
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+        self.is_active = False
+        self.tunnel_is_up = {}
+        FakeForwarder.instances.append(self)
+
+    def start(self):
+        self.is_active = True
+        self.tunnel_is_up = {('localhost', 5432): True}
+
+    def stop(self):
+        self.is_active = False
+
+    def check_tunnels(self):
+        pass
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Create a tunnel manager backed by fake forwarders."""
+    FakeForwarder.instances = []
+    monkeypatch.setattr(tunnel_module, "SSHTunnelForwarder", FakeForwarder)
+    monkeypatch.setattr(tunnel_module.atexit, "register", lambda fn: None)
+    return SSHTunnelManager(
+        ssh_host="bastion",
+        ssh_port=22,
+        ssh_username="analyst",
+        ssh_pkey=None,
+        remote_host="db.internal",
+        remote_port=5432,
+        local_port=5432,
+        keepalive_seconds=15
+    )
+
+
+def test_start_opens_a_single_tunnel(manager):
+    """Test repeated starts share the same tunnel."""
+    manager.start()
+    manager.start()
+    manager.ensure_running()
+
+    assert len(FakeForwarder.instances) == 1
+    assert FakeForwarder.instances[0].kwargs["set_keepalive"] == 15
+    assert manager.is_running
+
+
+def test_ensure_running_restarts_dropped_tunnel(manager):
+    """Test a dropped tunnel is replaced on the next connection."""
+    manager.start()
+    FakeForwarder.instances[0].is_active = False
+
+    manager.ensure_running()
+
+    assert len(FakeForwarder.instances) == 2
+    assert manager.is_running
+
+
+def test_stop_closes_tunnel(manager):
+    """Test stopping releases the tunnel."""
+    manager.start()
+
+    manager.stop()
+
+    assert not FakeForwarder.instances[0].is_active
+    assert not manager.is_running
@@ -0,0 +1,48 @@
+"""Unit tests for database telemetry."""
+import json
+
+import pytest
+
+from adapters.postgres import telemetry
+
+
+@pytest.fixture(autouse=True)
+def clean_counters():
+    """Start every test from zeroed counters."""
+    telemetry.reset()
+    yield
+    telemetry.reset()
+
+
+def test_snapshot_accumulates_counters():
+    """Test checkouts and statements are aggregated in the snapshot."""
+    telemetry._record_checkout(2.0)
+    telemetry._record_checkout(6.0)
+    telemetry._record_statement(10.0, slow_ms=50.0)
+    telemetry._record_statement(80.0, slow_ms=50.0)
+
+    snapshot = telemetry.snapshot()
+
+    assert snapshot["checkouts"] == 2
+    assert snapshot["checkout_wait_ms"] == 8.0
+    assert snapshot["max_checkout_wait_ms"] == 6.0
+    assert snapshot["statements"] == 2
+    assert snapshot["max_statement_ms"] == 80.0
+    assert snapshot["slow_statements"] == 1
+
+
+def test_emit_emf_reports_window_since_last_emit(capsys):
+    """Test each EMF line only covers work since the previous one."""
+    telemetry._record_statement(10.0, slow_ms=50.0)
+    telemetry.emit_emf()
+    telemetry._record_statement(20.0, slow_ms=50.0)
+    telemetry.emit_emf()
+
+    first, second = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    metrics = first["_aws"]["CloudWatchMetrics"][0]
+    assert metrics["Namespace"] == telemetry.EMF_NAMESPACE
+    assert {"Name": "DbStatements", "Unit": "Count"} in metrics["Metrics"]
+    assert first["DbStatements"] == 1
+    assert second["DbStatementMs"] == 20.0
+    assert telemetry.snapshot()["statements"] == 2